@@ -1,9 +1,9 @@
 """The SolarEdge Modbus Integration."""
 import logging
 from datetime import timedelta
+from functools import partial
 from typing import Any
 
-import async_timeout
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_HOST,
@@ -13,29 +13,74 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .capture import CaptureWriter
 from .const import (
+    CONF_ASYNC_MODBUS,
+    CONF_CAPTURE_READS,
     CONF_DETECT_BATTERIES,
     CONF_DETECT_METERS,
     CONF_DEVICE_ID,
     CONF_KEEP_MODBUS_OPEN,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_NUMBER_INVERTERS,
+    CONF_PROXY_ADDRESS,
+    CONF_PROXY_MAX_AGE,
+    CONF_PROXY_PORT,
+    CONF_PROXY_SERVER,
     CONF_SINGLE_DEVICE_ENTITY,
+    CONF_SLEEP_SCAN_INTERVAL,
+    CONF_SLOW_SCAN_INTERVAL,
+    CONNECTION_KEEPALIVE_IDLE,
+    DEFAULT_ASYNC_MODBUS,
+    DEFAULT_CAPTURE_READS,
     DEFAULT_DETECT_BATTERIES,
     DEFAULT_DETECT_METERS,
     DEFAULT_KEEP_MODBUS_OPEN,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_PROXY_ADDRESS,
+    DEFAULT_PROXY_MAX_AGE,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_PROXY_SERVER,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SINGLE_DEVICE_ENTITY,
+    DEFAULT_SLEEP_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
     DOMAIN,
 )
+from .fleet import async_get_fleet
 from .hub import DataUpdateFailed, HubInitFailed, SolarEdgeModbusMultiHub
+from .proxy import ModbusProxy
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+DISCOVERY_STORAGE_VERSION = 1
+
+
+def discovery_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Storage for the devices discovered on a config entry."""
+    return Store(
+        hass, DISCOVERY_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.discovery"
+    )
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the SolarEdge Modbus services."""
+    async_setup_services(hass)
+
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SolarEdge Modbus from a config entry."""
@@ -51,6 +96,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if entry_updates:
         hass.config_entries.async_update_entry(entry, **entry_updates)
 
+    fleet = async_get_fleet(hass)
+
+    capture = None
+    if entry.options.get(CONF_CAPTURE_READS, DEFAULT_CAPTURE_READS):
+        capture = CaptureWriter(hass.config.path(f"{DOMAIN}.{entry.entry_id}.capture"))
+        _LOGGER.warning(f"Capturing raw Modbus reads to {capture.path}")
+
     solaredge_hub = SolarEdgeModbusMultiHub(
         hass,
         entry.data[CONF_NAME],
@@ -62,14 +114,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.options.get(CONF_DETECT_BATTERIES, DEFAULT_DETECT_BATTERIES),
         entry.options.get(CONF_SINGLE_DEVICE_ENTITY, DEFAULT_SINGLE_DEVICE_ENTITY),
         entry.options.get(CONF_KEEP_MODBUS_OPEN, DEFAULT_KEEP_MODBUS_OPEN),
-    )
-
-    coordinator = SolarEdgeCoordinator(
-        hass,
-        solaredge_hub,
+        entry.options.get(CONF_ASYNC_MODBUS, DEFAULT_ASYNC_MODBUS),
         entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        entry.options.get(CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL),
+        entry.options.get(CONF_SLEEP_SCAN_INTERVAL, DEFAULT_SLEEP_SCAN_INTERVAL),
+        discovery_store(hass, entry),
+        entry.options.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        ),
+        capture,
+        partial(fleet.async_poll, entry.data[CONF_HOST]),
+        partial(fleet.async_set_interval, entry.entry_id),
     )
 
+    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    coordinator = SolarEdgeCoordinator(hass, solaredge_hub, scan_interval)
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "hub": solaredge_hub,
@@ -78,8 +138,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await coordinator.async_config_entry_first_refresh()
 
+    remove_site = fleet.async_add_site(
+        entry.entry_id, scan_interval, coordinator.async_refresh
+    )
+    hass.data[DOMAIN][entry.entry_id]["remove_site"] = remove_site
+    entry.async_on_unload(remove_site)
+
+    if entry.options.get(CONF_PROXY_SERVER, DEFAULT_PROXY_SERVER):
+        proxy_port = entry.options.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT)
+        proxy = ModbusProxy(
+            solaredge_hub.connection,
+            partial(fleet.async_connection, entry.data[CONF_HOST]),
+            entry.options.get(CONF_PROXY_ADDRESS, DEFAULT_PROXY_ADDRESS),
+            proxy_port,
+            entry.options.get(CONF_PROXY_MAX_AGE, DEFAULT_PROXY_MAX_AGE),
+        )
+
+        try:
+            await proxy.async_start()
+
+        except OSError as e:
+            _LOGGER.error(f"Could not start Modbus/TCP proxy on port {proxy_port}: {e}")
+
+        else:
+            hass.data[DOMAIN][entry.entry_id]["proxy"] = proxy
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if solaredge_hub.discovered_from_cache:
+        hass.data[DOMAIN][entry.entry_id]["rediscovery"] = hass.async_create_task(
+            async_rediscover(hass, entry, solaredge_hub)
+        )
+
+    if solaredge_hub.keep_modbus_open:
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                solaredge_hub.async_keepalive,
+                timedelta(seconds=CONNECTION_KEEPALIVE_IDLE),
+            )
+        )
+
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
@@ -88,8 +187,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     solaredge_hub = hass.data[DOMAIN][entry.entry_id]["hub"]
+
+    # on_unload callbacks run after this returns, a fleet poll in between
+    # would reopen the connection of the hub
+    if remove_site := hass.data[DOMAIN][entry.entry_id].pop("remove_site", None):
+        remove_site()
+
+    if rediscovery := hass.data[DOMAIN][entry.entry_id].pop("rediscovery", None):
+        rediscovery.cancel()
+
     await solaredge_hub.shutdown()
 
+    if burst_end := hass.data[DOMAIN][entry.entry_id].pop("burst_end", None):
+        burst_end()
+
+    if proxy := hass.data[DOMAIN][entry.entry_id].get("proxy"):
+        await proxy.async_stop()
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
@@ -97,6 +211,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored data of a config entry."""
+    await discovery_store(hass, entry).async_remove()
+
+
+async def async_rediscover(
+    hass: HomeAssistant, entry: ConfigEntry, hub: SolarEdgeModbusMultiHub
+) -> None:
+    """Check the cached devices with a full discovery, reloading if they changed."""
+    if await hub.async_rediscover():
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle an options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -150,12 +277,16 @@ async def async_remove_config_entry_device(
 
 
 class SolarEdgeCoordinator(DataUpdateCoordinator):
+    """Refreshes a hub, scheduled by the fleet instead of its own timer.
+
+    The hub shares concurrent refreshes, then waits for its fleet poll slot.
+    """
+
     def __init__(self, hass, hub, scan_interval):
         super().__init__(
             hass,
             _LOGGER,
             name="SolarEdge Coordinator",
-            update_interval=timedelta(seconds=scan_interval),
         )
         self._hub = hub
 
@@ -165,8 +296,7 @@ class SolarEdgeCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         try:
-            async with async_timeout.timeout(5):
-                return await self._hub.async_refresh_modbus_data()
+            return await self._hub.async_refresh_modbus_data()
 
         except HubInitFailed as e:
             raise UpdateFailed(f"{e}")
@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import os
+import struct
+import time
+from collections import defaultdict
+from enum import IntEnum
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+from pymodbus.pdu import ExceptionResponse, ModbusExceptions
+from pymodbus.register_read_message import (
+    ReadHoldingRegistersRequest,
+    ReadHoldingRegistersResponse,
+)
+
+from .const import CAPTURE_BACKUPS, CAPTURE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+# file magic and format version, repeated at the start of every rotated file
+CAPTURE_MAGIC = b"SEMC\x01"
+
+# timestamp, latency, unit, address, count, status, exception code, registers
+RECORD_HEADER = struct.Struct("<dfBHHBBB")
+
+
+class CaptureStatus(IntEnum):
+    RESPONSE = 0
+    EXCEPTION = 1
+    NO_RESPONSE = 2
+    DISCONNECTED = 3
+
+
+class CaptureRecord(NamedTuple):
+    """One captured holding register read."""
+
+    timestamp: float
+    latency: float
+    unit: int
+    address: int
+    count: int
+    status: int
+    exception_code: int
+    registers: Tuple[int, ...]
+
+
+def encode_record(record: CaptureRecord) -> bytes:
+    return RECORD_HEADER.pack(
+        record.timestamp,
+        record.latency,
+        record.unit,
+        record.address,
+        record.count,
+        record.status,
+        record.exception_code,
+        len(record.registers),
+    ) + struct.pack(f"<{len(record.registers)}H", *record.registers)
+
+
+def capture_record(
+    unit: int, address: int, count: int, result, latency: float
+) -> CaptureRecord:
+    """Record of a read result or of the ConnectionException that ended it."""
+    registers = ()
+    exception_code = 0
+
+    if isinstance(result, ConnectionException):
+        status = CaptureStatus.DISCONNECTED
+    elif isinstance(result, ExceptionResponse):
+        status = CaptureStatus.EXCEPTION
+        exception_code = result.exception_code
+    elif result.isError():
+        status = CaptureStatus.NO_RESPONSE
+    else:
+        status = CaptureStatus.RESPONSE
+        registers = tuple(result.registers)
+
+    return CaptureRecord(
+        time.time(),
+        latency,
+        unit or 0,
+        address,
+        count,
+        status,
+        exception_code,
+        registers,
+    )
+
+
+class CaptureWriter:
+    """Append-only file of raw reads, rotated by size.
+
+    Records are buffered in memory and written by flush, which does blocking
+    file I/O and belongs in the executor.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = CAPTURE_MAX_BYTES,
+        backups: int = CAPTURE_BACKUPS,
+    ) -> None:
+        self.path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._pending = bytearray()
+        self.records = 0
+
+    def add(self, record: CaptureRecord) -> None:
+        self._pending += encode_record(record)
+        self.records += 1
+
+    def flush(self) -> None:
+        """Write buffered records, rotating the file if it is full."""
+        if not self._pending:
+            return
+
+        data = bytes(self._pending)
+        self._pending.clear()
+
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            size = 0
+
+        if size and size + len(data) > self._max_bytes:
+            self._rotate()
+            size = 0
+
+        with open(self.path, "ab") as capture_file:
+            if size == 0:
+                capture_file.write(CAPTURE_MAGIC)
+            capture_file.write(data)
+
+    def _rotate(self) -> None:
+        for index in range(self._backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+
+        if self._backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+        _LOGGER.debug(f"Rotated read capture {self.path}")
+
+
+def capture_files(path: str) -> List[str]:
+    """A capture file and its rotated backups, oldest first."""
+    files = [path]
+    index = 1
+
+    while os.path.exists(f"{path}.{index}"):
+        files.insert(0, f"{path}.{index}")
+        index += 1
+
+    return [name for name in files if os.path.exists(name)]
+
+
+def read_capture(path: str) -> Iterator[CaptureRecord]:
+    """Records of a capture file in the order they were read."""
+    with open(path, "rb") as capture_file:
+        data = capture_file.read()
+
+    if not data.startswith(CAPTURE_MAGIC):
+        raise ValueError(f"{path} is not a read capture")
+
+    offset = len(CAPTURE_MAGIC)
+
+    while offset < len(data):
+        header = RECORD_HEADER.unpack_from(data, offset)
+        offset += RECORD_HEADER.size
+
+        length = header[-1]
+        registers = struct.unpack_from(f"<{length}H", data, offset)
+        offset += 2 * length
+
+        yield CaptureRecord(*header[:-1], registers)
+
+
+class ReplayModbusClient:
+    """Modbus client answering reads from captured records.
+
+    Each read gets the next captured response to the same unit, address and
+    count, starting over when they run out. With realtime each read takes as
+    long as it did when captured, otherwise replay runs as fast as possible.
+    Reads that were never captured get an IllegalAddress exception response.
+    """
+
+    def __init__(self, records: Iterable[CaptureRecord], realtime: bool = False):
+        self._responses = defaultdict(list)
+        self._next = defaultdict(int)
+        self._realtime = realtime
+        self._open = False
+        self.reads = 0
+
+        for record in records:
+            self._responses[(record.unit, record.address, record.count)].append(record)
+
+    async def connect(self) -> bool:
+        self._open = True
+        return True
+
+    def close(self) -> None:
+        self._open = False
+
+    def is_socket_open(self) -> bool:
+        return self._open
+
+    async def read_holding_registers(
+        self, address: int, count: int, unit: int = 1
+    ) -> Optional[object]:
+        """Read holding registers."""
+        if not self._open:
+            raise ConnectionException("Replay is not connected")
+
+        self.reads += 1
+        key = (unit or 0, address, count)
+        responses = self._responses.get(key)
+
+        if not responses:
+            return ExceptionResponse(
+                ReadHoldingRegistersRequest.function_code,
+                ModbusExceptions.IllegalAddress,
+            )
+
+        record = responses[self._next[key] % len(responses)]
+        self._next[key] += 1
+
+        if self._realtime:
+            await asyncio.sleep(record.latency)
+
+        if record.status == CaptureStatus.DISCONNECTED:
+            self._open = False
+            raise ConnectionException("Captured connection loss")
+
+        if record.status == CaptureStatus.EXCEPTION:
+            return ExceptionResponse(
+                ReadHoldingRegistersRequest.function_code, record.exception_code
+            )
+
+        if record.status == CaptureStatus.NO_RESPONSE:
+            return ModbusIOException(f"Captured no response from unit {unit}")
+
+        return ReadHoldingRegistersResponse(list(record.registers))
@@ -10,21 +10,43 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
+    CONF_ASYNC_MODBUS,
+    CONF_CAPTURE_READS,
     CONF_DETECT_BATTERIES,
     CONF_DETECT_METERS,
     CONF_DEVICE_ID,
     CONF_KEEP_MODBUS_OPEN,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_NUMBER_INVERTERS,
+    CONF_PROXY_ADDRESS,
+    CONF_PROXY_MAX_AGE,
+    CONF_PROXY_PORT,
+    CONF_PROXY_SERVER,
     CONF_SINGLE_DEVICE_ENTITY,
+    CONF_SLEEP_SCAN_INTERVAL,
+    CONF_SLOW_SCAN_INTERVAL,
+    CONF_STATE_DEADBAND,
+    CONF_STATE_REFRESH_CYCLES,
+    DEFAULT_ASYNC_MODBUS,
+    DEFAULT_CAPTURE_READS,
     DEFAULT_DETECT_BATTERIES,
     DEFAULT_DETECT_METERS,
     DEFAULT_DEVICE_ID,
     DEFAULT_KEEP_MODBUS_OPEN,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_NAME,
     DEFAULT_NUMBER_INVERTERS,
     DEFAULT_PORT,
+    DEFAULT_PROXY_ADDRESS,
+    DEFAULT_PROXY_MAX_AGE,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_PROXY_SERVER,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SINGLE_DEVICE_ENTITY,
+    DEFAULT_SLEEP_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    DEFAULT_STATE_DEADBAND,
+    DEFAULT_STATE_REFRESH_CYCLES,
     DOMAIN,
 )
 
@@ -39,6 +61,16 @@ def host_valid(host):
         return all(x and not disallowed.search(x) for x in host.split("."))
 
 
+def address_valid(address):
+    """Return True if address is an IP address to listen on."""
+    try:
+        ipaddress.ip_address(address)
+    except ValueError:
+        return False
+
+    return True
+
+
 @callback
 def solaredge_modbus_multi_entries(hass: HomeAssistant):
     """Return the hosts already configured."""
@@ -140,6 +172,32 @@ class SolaredgeModbusMultiOptionsFlowHandler(config_entries.OptionsFlow):
                 errors[CONF_SCAN_INTERVAL] = "invalid_scan_interval"
             elif user_input[CONF_SCAN_INTERVAL] > 86400:
                 errors[CONF_SCAN_INTERVAL] = "invalid_scan_interval"
+            elif user_input[CONF_SLOW_SCAN_INTERVAL] < 1:
+                errors[CONF_SLOW_SCAN_INTERVAL] = "invalid_scan_interval"
+            elif user_input[CONF_SLOW_SCAN_INTERVAL] > 86400:
+                errors[CONF_SLOW_SCAN_INTERVAL] = "invalid_scan_interval"
+            elif user_input[CONF_SLEEP_SCAN_INTERVAL] < 1:
+                errors[CONF_SLEEP_SCAN_INTERVAL] = "invalid_scan_interval"
+            elif user_input[CONF_SLEEP_SCAN_INTERVAL] > 86400:
+                errors[CONF_SLEEP_SCAN_INTERVAL] = "invalid_scan_interval"
+            elif user_input[CONF_MAX_CONCURRENT_REQUESTS] < 1:
+                errors[CONF_MAX_CONCURRENT_REQUESTS] = "invalid_max_requests"
+            elif user_input[CONF_MAX_CONCURRENT_REQUESTS] > 16:
+                errors[CONF_MAX_CONCURRENT_REQUESTS] = "invalid_max_requests"
+            elif user_input[CONF_STATE_REFRESH_CYCLES] < 1:
+                errors[CONF_STATE_REFRESH_CYCLES] = "invalid_refresh_cycles"
+            elif user_input[CONF_STATE_REFRESH_CYCLES] > 1000:
+                errors[CONF_STATE_REFRESH_CYCLES] = "invalid_refresh_cycles"
+            elif not address_valid(user_input[CONF_PROXY_ADDRESS]):
+                errors[CONF_PROXY_ADDRESS] = "invalid_address"
+            elif user_input[CONF_PROXY_PORT] < 1:
+                errors[CONF_PROXY_PORT] = "invalid_tcp_port"
+            elif user_input[CONF_PROXY_PORT] > 65535:
+                errors[CONF_PROXY_PORT] = "invalid_tcp_port"
+            elif user_input[CONF_PROXY_MAX_AGE] < 0:
+                errors[CONF_PROXY_MAX_AGE] = "invalid_max_age"
+            elif user_input[CONF_PROXY_MAX_AGE] > 86400:
+                errors[CONF_PROXY_MAX_AGE] = "invalid_max_age"
             else:
                 return self.async_create_entry(title="", data=user_input)
         else:
@@ -147,6 +205,12 @@ class SolaredgeModbusMultiOptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_SCAN_INTERVAL: self.config_entry.options.get(
                     CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                 ),
+                CONF_SLOW_SCAN_INTERVAL: self.config_entry.options.get(
+                    CONF_SLOW_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL
+                ),
+                CONF_SLEEP_SCAN_INTERVAL: self.config_entry.options.get(
+                    CONF_SLEEP_SCAN_INTERVAL, DEFAULT_SLEEP_SCAN_INTERVAL
+                ),
                 CONF_SINGLE_DEVICE_ENTITY: self.config_entry.options.get(
                     CONF_SINGLE_DEVICE_ENTITY, DEFAULT_SINGLE_DEVICE_ENTITY
                 ),
@@ -159,6 +223,33 @@ class SolaredgeModbusMultiOptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_DETECT_BATTERIES: self.config_entry.options.get(
                     CONF_DETECT_BATTERIES, DEFAULT_DETECT_BATTERIES
                 ),
+                CONF_ASYNC_MODBUS: self.config_entry.options.get(
+                    CONF_ASYNC_MODBUS, DEFAULT_ASYNC_MODBUS
+                ),
+                CONF_MAX_CONCURRENT_REQUESTS: self.config_entry.options.get(
+                    CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                ),
+                CONF_STATE_DEADBAND: self.config_entry.options.get(
+                    CONF_STATE_DEADBAND, DEFAULT_STATE_DEADBAND
+                ),
+                CONF_STATE_REFRESH_CYCLES: self.config_entry.options.get(
+                    CONF_STATE_REFRESH_CYCLES, DEFAULT_STATE_REFRESH_CYCLES
+                ),
+                CONF_CAPTURE_READS: self.config_entry.options.get(
+                    CONF_CAPTURE_READS, DEFAULT_CAPTURE_READS
+                ),
+                CONF_PROXY_SERVER: self.config_entry.options.get(
+                    CONF_PROXY_SERVER, DEFAULT_PROXY_SERVER
+                ),
+                CONF_PROXY_ADDRESS: self.config_entry.options.get(
+                    CONF_PROXY_ADDRESS, DEFAULT_PROXY_ADDRESS
+                ),
+                CONF_PROXY_PORT: self.config_entry.options.get(
+                    CONF_PROXY_PORT, DEFAULT_PROXY_PORT
+                ),
+                CONF_PROXY_MAX_AGE: self.config_entry.options.get(
+                    CONF_PROXY_MAX_AGE, DEFAULT_PROXY_MAX_AGE
+                ),
             }
 
         return self.async_show_form(
@@ -169,6 +260,14 @@ class SolaredgeModbusMultiOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_SCAN_INTERVAL,
                         default=user_input[CONF_SCAN_INTERVAL],
                     ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_SLOW_SCAN_INTERVAL,
+                        default=user_input[CONF_SLOW_SCAN_INTERVAL],
+                    ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_SLEEP_SCAN_INTERVAL,
+                        default=user_input[CONF_SLEEP_SCAN_INTERVAL],
+                    ): vol.Coerce(int),
                     vol.Optional(
                         CONF_SINGLE_DEVICE_ENTITY,
                         default=user_input[CONF_SINGLE_DEVICE_ENTITY],
@@ -185,6 +284,42 @@ class SolaredgeModbusMultiOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_DETECT_BATTERIES,
                         default=user_input[CONF_DETECT_BATTERIES],
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_ASYNC_MODBUS,
+                        default=user_input[CONF_ASYNC_MODBUS],
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=user_input[CONF_MAX_CONCURRENT_REQUESTS],
+                    ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_STATE_DEADBAND,
+                        default=user_input[CONF_STATE_DEADBAND],
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_STATE_REFRESH_CYCLES,
+                        default=user_input[CONF_STATE_REFRESH_CYCLES],
+                    ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_CAPTURE_READS,
+                        default=user_input[CONF_CAPTURE_READS],
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_PROXY_SERVER,
+                        default=user_input[CONF_PROXY_SERVER],
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_PROXY_ADDRESS,
+                        default=user_input[CONF_PROXY_ADDRESS],
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_PROXY_PORT,
+                        default=user_input[CONF_PROXY_PORT],
+                    ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_PROXY_MAX_AGE,
+                        default=user_input[CONF_PROXY_MAX_AGE],
+                    ): vol.Coerce(int),
                 },
             ),
             errors=errors,
@@ -0,0 +1,270 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from pymodbus.client.sync import ModbusTcpClient
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from .capture import CaptureWriter, capture_record
+from .const import (
+    CONNECTION_BACKOFF_BASE,
+    CONNECTION_BACKOFF_MAX,
+    CONNECTION_KEEPALIVE_IDLE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+)
+from .planner import RegisterCache
+from .transport import AsyncModbusTcpClient
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ModbusConnection:
+    """Modbus/TCP client and the lifecycle of its connection.
+
+    Failed connections are retried with jittered exponential backoff. Until
+    the backoff has elapsed the circuit is open and connection attempts fail
+    at once instead of waiting for the host to time out again. A connection
+    that has been idle is checked with a short read before it is used.
+    Without Home Assistant, blocking calls run in the default executor of the
+    event loop.
+    """
+
+    def __init__(
+        self,
+        hass: Optional["HomeAssistant"],
+        host: str,
+        port: int,
+        async_modbus: bool = False,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        probe_unit: int = 1,
+        client=None,
+        capture: Optional[CaptureWriter] = None,
+    ) -> None:
+        self._hass = hass
+        self._host = host
+        self._port = port
+        self._async_modbus = async_modbus
+        self._probe_unit = probe_unit
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+        self._requests = asyncio.Semaphore(max_concurrent_requests)
+        self.capture = capture
+        self.cache: Optional[RegisterCache] = None
+
+        if client is not None:
+            self._client = client
+        elif async_modbus:
+            self._client = AsyncModbusTcpClient(host, port)
+        else:
+            self._client = ModbusTcpClient(host=host, port=port)
+
+        self.failures = 0
+        self.connects = 0
+        self.connect_time: Optional[float] = None
+        self._retry_at = 0.0
+        self._connected_at: Optional[float] = None
+        self._last_used = 0.0
+
+    @property
+    def state(self) -> str:
+        if self.is_open():
+            return "connected"
+
+        if time.monotonic() < self._retry_at:
+            return "circuit_open"
+
+        return "closed"
+
+    @property
+    def session_age(self) -> Optional[float]:
+        """Seconds since the current connection was opened."""
+        if self._connected_at is None or not self.is_open():
+            return None
+
+        return time.monotonic() - self._connected_at
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next connection attempt is allowed."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def is_open(self) -> bool:
+        """Check connection status."""
+        if self._async_modbus:
+            return self._client.is_socket_open()
+
+        with self._lock:
+            return self._client.is_socket_open()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._connected_at = None
+
+        if self._async_modbus:
+            self._client.close()
+            return
+
+        with self._lock:
+            self._client.close()
+
+    async def async_connect(self) -> bool:
+        """Open the connection unless the circuit is open."""
+        if self.is_open():
+            return True
+
+        if self.retry_in > 0:
+            _LOGGER.debug(
+                f"Not connecting to {self._host}:{self._port} "
+                f"for another {self.retry_in:.1f}s"
+            )
+            return False
+
+        started = time.monotonic()
+
+        if self._async_modbus:
+            async with self._async_lock:
+                connected = await self._client.connect()
+        else:
+            connected = await self._async_add_executor_job(self._connect)
+
+        if not connected:
+            self._backoff()
+            return False
+
+        self.failures = 0
+        self.connects += 1
+        self.connect_time = time.monotonic() - started
+        self._connected_at = self._last_used = time.monotonic()
+
+        _LOGGER.debug(
+            f"Connected to {self._host}:{self._port} "
+            f"in {self.connect_time * 1000:.1f}ms"
+        )
+        return True
+
+    def _connect(self) -> bool:
+        with self._lock:
+            return self._client.connect()
+
+    def _backoff(self) -> None:
+        """Open the circuit for a jittered, exponentially growing delay."""
+        self.failures += 1
+        delay = min(
+            CONNECTION_BACKOFF_BASE * 2 ** (self.failures - 1), CONNECTION_BACKOFF_MAX
+        )
+        delay *= random.uniform(0.5, 1)
+        self._retry_at = time.monotonic() + delay
+
+        _LOGGER.debug(
+            f"Connection to {self._host}:{self._port} failed {self.failures} "
+            f"times, retry in {delay:.1f}s"
+        )
+
+    async def async_ready(self) -> None:
+        """Make sure the connection is open and responding before use."""
+        if self.is_open() and not await self.async_keepalive():
+            self.close()
+
+        if not await self.async_connect():
+            raise ConnectionException(
+                f"Could not open Modbus/TCP connection to {self._host}"
+            )
+
+    async def async_keepalive(self) -> bool:
+        """Send a short read if the connection has been idle, False if it failed."""
+        if time.monotonic() - self._last_used < CONNECTION_KEEPALIVE_IDLE:
+            return True
+
+        try:
+            result = await self.async_read_holding_registers(self._probe_unit, 40000, 2)
+
+        except ConnectionException as e:
+            _LOGGER.debug(f"Keepalive to {self._host} failed: {e}")
+            return False
+
+        # an exception response still shows the link is alive
+        if isinstance(result, ModbusIOException):
+            _LOGGER.debug(f"Keepalive to {self._host} failed: {result}")
+            return False
+
+        return True
+
+    def read_holding_registers(self, unit, address, count):
+        """Read holding registers."""
+        with self._lock:
+            kwargs = {"unit": unit} if unit else {}
+            return self._client.read_holding_registers(address, count, **kwargs)
+
+    async def async_read_holding_registers(self, unit, address, count, backoff=True):
+        """Read holding registers on the event loop or in the executor.
+
+        A connection error closes the connection, and opens the circuit
+        unless backoff is False.
+        """
+        started = time.monotonic()
+
+        try:
+            if self._async_modbus:
+                async with self._requests:
+                    result = await self._client.read_holding_registers(
+                        address, count, unit=unit
+                    )
+            else:
+                result = await self._async_add_executor_job(
+                    self.read_holding_registers, unit, address, count
+                )
+
+        except ConnectionException as e:
+            self._capture(unit, address, count, e, started)
+            self.close()
+            if backoff:
+                self._backoff()
+            raise
+
+        finally:
+            self._last_used = time.monotonic()
+
+        self._capture(unit, address, count, result, started)
+
+        if self.cache is not None and not result.isError():
+            self.cache.update(unit, address, result.registers)
+
+        return result
+
+    def _capture(self, unit, address, count, result, started: float) -> None:
+        if self.capture is not None:
+            self.capture.add(
+                capture_record(unit, address, count, result, time.monotonic() - started)
+            )
+
+    async def _async_add_executor_job(self, target, *args):
+        if self._hass is None:
+            return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+        return await self._hass.async_add_executor_job(target, *args)
+
+    async def async_flush_capture(self) -> None:
+        """Write captured reads to the capture file."""
+        if self.capture is not None:
+            await self._async_add_executor_job(self.capture.flush)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "connects": self.connects,
+            "failures": self.failures,
+            "connect_time_ms": (
+                round(self.connect_time * 1000, 1) if self.connect_time else None
+            ),
+            "session_age": (
+                round(self.session_age) if self.session_age is not None else None
+            ),
+            "retry_in": round(self.retry_in, 1),
+            "captured_reads": self.capture.records if self.capture else None,
+        }
@@ -4,6 +4,9 @@ from typing import Final
 DOMAIN = "solaredge_modbus_multi"
 DEFAULT_NAME = "SolarEdge"
 DEFAULT_SCAN_INTERVAL = 300
+DEFAULT_SLOW_SCAN_INTERVAL = 60
+DEFAULT_SLEEP_SCAN_INTERVAL = 300
+DEFAULT_MAX_CONCURRENT_REQUESTS = 1
 DEFAULT_PORT = 1502
 DEFAULT_NUMBER_INVERTERS = 1
 DEFAULT_DEVICE_ID = 1
@@ -11,12 +14,90 @@ DEFAULT_DETECT_METERS = True
 DEFAULT_DETECT_BATTERIES = False
 DEFAULT_SINGLE_DEVICE_ENTITY = True
 DEFAULT_KEEP_MODBUS_OPEN = False
+DEFAULT_ASYNC_MODBUS = False
+DEFAULT_STATE_DEADBAND = False
+DEFAULT_STATE_REFRESH_CYCLES = 12
+DEFAULT_CAPTURE_READS = False
+DEFAULT_PROXY_SERVER = False
+DEFAULT_PROXY_ADDRESS = "127.0.0.1"
+DEFAULT_PROXY_PORT = 1502
+DEFAULT_PROXY_MAX_AGE = 10
 CONF_NUMBER_INVERTERS = "number_of_inverters"
 CONF_DEVICE_ID = "device_id"
 CONF_DETECT_METERS = "detect_meters"
 CONF_DETECT_BATTERIES = "detect_batteries"
 CONF_SINGLE_DEVICE_ENTITY = "single_device_entity"
 CONF_KEEP_MODBUS_OPEN = "keep_modbus_open"
+CONF_ASYNC_MODBUS = "async_modbus"
+CONF_SLOW_SCAN_INTERVAL = "slow_scan_interval"
+CONF_SLEEP_SCAN_INTERVAL = "sleep_scan_interval"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_STATE_DEADBAND = "state_deadband"
+CONF_STATE_REFRESH_CYCLES = "state_refresh_cycles"
+CONF_CAPTURE_READS = "capture_reads"
+CONF_PROXY_SERVER = "proxy_server"
+CONF_PROXY_ADDRESS = "proxy_address"
+CONF_PROXY_PORT = "proxy_port"
+CONF_PROXY_MAX_AGE = "proxy_max_age"
+
+# register group polling tiers
+TIER_FAST = "fast"
+TIER_SLOW = "slow"
+
+# inverter I_Status values that slow down or resume inverter polling
+INVERTER_SLEEP_STATUS = [1, 2]
+INVERTER_WAKE_STATUS = [3, 4]
+
+# modbus function 3 limit
+MODBUS_MAX_READ_REGISTERS = 125
+
+# unused registers of a model read through rather than split into two reads
+MODBUS_MAX_GAP = 16
+
+# modbus/tcp connection reconnect backoff and idle keepalive, in seconds
+CONNECTION_BACKOFF_BASE = 2
+CONNECTION_BACKOFF_MAX = 300
+CONNECTION_KEEPALIVE_IDLE = 60
+
+# share of the scan interval that reads may take, at least CYCLE_BUDGET_MIN
+# seconds, and the extra time allowed for the last read before a refresh fails
+CYCLE_BUDGET_MIN = 5
+CYCLE_BUDGET_RATIO = 0.5
+CYCLE_TIMEOUT_MARGIN = 5
+
+# polls running at once across all config entries, and against one host
+FLEET_MAX_CONNECTIONS = 16
+FLEET_MAX_PER_HOST = 1
+
+# burst polling interval and duration limits and defaults in seconds, and the
+# share of the measured read capacity a burst may bring polling up to
+BURST_MIN_INTERVAL = 1
+BURST_MAX_DURATION = 3600
+BURST_MAX_LOAD = 0.8
+DEFAULT_BURST_INTERVAL = 1
+DEFAULT_BURST_DURATION = 300
+
+# longest wait in seconds before polling a failed device again
+DEVICE_MAX_BACKOFF = 1800
+
+# raw read capture file size in bytes before it is rotated, rotated files kept
+CAPTURE_MAX_BYTES = 10 * 1024 * 1024
+CAPTURE_BACKUPS = 3
+
+# number of recent reads and polls kept for device poll statistics
+POLL_STATS_WINDOW = 100
+
+# state change needed to write a sensor state, by sensor device class
+STATE_DEADBANDS = {
+    "apparent_power": 10,
+    "current": 0.1,
+    "frequency": 0.01,
+    "power": 10,
+    "power_factor": 1,
+    "reactive_power": 10,
+    "temperature": 0.5,
+    "voltage": 0.5,
+}
 
 # units missing in homeassistant core
 ENERGY_VOLT_AMPERE_HOUR: Final = "VAh"
@@ -150,6 +231,15 @@ SUNSPEC_DID = {
     204: "Three Phase Delta Meter",
 }
 
+# phases and lines reported by single and split phase devices, three phase
+# devices report all of them; single phase meters are wired AN or AB
+SUNSPEC_PHASES = {
+    101: frozenset({"A", "AB", "AN"}),
+    102: frozenset({"A", "B", "AB", "AN", "BN"}),
+    201: frozenset({"A", "AB", "AN", "LN", "LL"}),
+    202: frozenset({"A", "B", "AB", "AN", "BN", "LN", "LL"}),
+}
+
 METER_EVENTS = {
     2: "M_EVENT_Power_Failure",
     3: "M_EVENT_Under_Voltage",
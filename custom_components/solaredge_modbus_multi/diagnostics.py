@@ -0,0 +1,74 @@
+"""Diagnostics support for SolarEdge Modbus Multi."""
+import time
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .fleet import async_get_fleet
+
+REDACT_CONFIG = {CONF_HOST, "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    hub = hass.data[DOMAIN][config_entry.entry_id]["hub"]
+    proxy = hass.data[DOMAIN][config_entry.entry_id].get("proxy")
+    fleet = async_get_fleet(hass)
+    site = fleet.sites.get(config_entry.entry_id)
+
+    burst = None
+    if hub.burst is not None:
+        burst = {
+            "interval": hub.burst.interval,
+            "remaining": round(max(0, hub.burst.until - time.monotonic())),
+            "groups": {
+                device.name: sorted(groups)
+                for device, groups in hub.burst.groups.items()
+            },
+        }
+
+    devices = []
+
+    for device in [*hub.inverters, *hub.meters, *hub.batteries]:
+        devices.append(
+            {
+                "name": device.name,
+                "unit_id": device.inverter_unit_id,
+                "model": device.model,
+                "fw_version": device.fw_version,
+                "online": device.online,
+                "failures": device.failures,
+                "poll_intervals": device.poll_intervals,
+                "poll_stats": device.stats.as_dict(),
+            }
+        )
+
+    return {
+        "config_entry": async_redact_data(config_entry.as_dict(), REDACT_CONFIG),
+        "hub": {
+            "online": hub.online,
+            "initialized": hub.initalized,
+            "sleeping": hub.sleeping,
+            "discovered_from_cache": hub.discovered_from_cache,
+            "tier_intervals": hub.tier_intervals,
+            "read_plan": hub.read_plan,
+            "cycle_budget": hub.cycle_budget,
+            "coalesced_refreshes": hub.coalesced_refreshes,
+            "burst": burst,
+            "bus_load": hub.bus_load(hub.burst),
+            "carried_devices": [device.name for device in hub.carried_devices],
+            "connection": hub.connection.as_dict(),
+            "proxy": proxy.as_dict() if proxy else None,
+        },
+        "devices": devices,
+        "fleet": {
+            **fleet.as_dict(),
+            "site": site.as_dict() if site else None,
+        },
+    }
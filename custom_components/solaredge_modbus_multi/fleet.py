@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, FLEET_MAX_CONNECTIONS, FLEET_MAX_PER_HOST
+from .stats import PollStats
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+
+def slot_offset(slot: int) -> float:
+    """Share of the scan interval a slot starts at, halving the largest gap."""
+    offset = 0.0
+    scale = 0.5
+
+    while slot:
+        if slot & 1:
+            offset += scale
+        slot >>= 1
+        scale /= 2
+
+    return offset
+
+
+class FleetSite:
+    """Poll schedule of one config entry."""
+
+    def __init__(
+        self,
+        key: str,
+        interval: float,
+        slot: int,
+        refresh: Callable[[], Awaitable[None]],
+    ) -> None:
+        self.key = key
+        self.interval = interval
+        self.slot = slot
+        self.offset = slot_offset(slot) * interval
+        self.refresh = refresh
+        self.due: Optional[float] = None
+        self.polling = False
+        self.overruns = 0
+        self.cancel: Optional[CALLBACK_TYPE] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "offset": round(self.offset, 1),
+            "polling": self.polling,
+            "overruns": self.overruns,
+        }
+
+
+class FleetScheduler:
+    """Shared poll schedule and connection limits of all config entries.
+
+    Sites start their polls at spread out offsets of their scan interval
+    instead of together. Every refresh waits for a free connection, limited
+    across all config entries and per host.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_connections: int = FLEET_MAX_CONNECTIONS,
+        max_per_host: int = FLEET_MAX_PER_HOST,
+    ) -> None:
+        self._hass = hass
+        self._max_connections = max_connections
+        self._max_per_host = max_per_host
+        self._connections = asyncio.Semaphore(max_connections)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self.sites: Dict[str, FleetSite] = {}
+        self.cycles = PollStats()
+        self.waits = PollStats()
+        self.polling = 0
+        self.backlog = 0
+        self.backlog_max = 0
+
+    @asynccontextmanager
+    async def async_connection(self, host: str):
+        """Hold a connection to host, within the host and global limits."""
+        queued = time.monotonic()
+        host_limit = self._hosts.setdefault(host, asyncio.Semaphore(self._max_per_host))
+        waiting = host_limit.locked() or self._connections.locked()
+
+        async with AsyncExitStack() as stack:
+            if waiting:
+                self.backlog += 1
+                self.backlog_max = max(self.backlog_max, self.backlog)
+
+            try:
+                await stack.enter_async_context(host_limit)
+                await stack.enter_async_context(self._connections)
+
+            finally:
+                if waiting:
+                    self.backlog -= 1
+
+            self.waits.add_read(time.monotonic() - queued)
+            yield
+
+    @asynccontextmanager
+    async def async_poll(self, host: str):
+        """Hold a connection to host for one refresh."""
+        queued = time.monotonic()
+
+        async with self.async_connection(host):
+            self.polling += 1
+
+            try:
+                yield
+
+            except Exception as e:
+                self.cycles.add_error(e)
+                raise
+
+            else:
+                self.cycles.add_success()
+
+            finally:
+                self.polling -= 1
+                self.cycles.add_read(time.monotonic() - queued)
+
+    @callback
+    def async_add_site(
+        self, key: str, interval: int, refresh: Callable[[], Awaitable[None]]
+    ) -> CALLBACK_TYPE:
+        """Poll a site every interval, returns a callback removing it."""
+        used = {site.slot for site in self.sites.values()}
+        slot = min(set(range(len(used) + 1)) - used)
+
+        site = FleetSite(key, interval, slot, refresh)
+        self.sites[key] = site
+        self._schedule(site, time.time())
+
+        _LOGGER.debug(
+            f"Fleet site {key} polls every {interval}s at offset {site.offset:.1f}s"
+        )
+
+        return partial(self._remove_site, key)
+
+    @callback
+    def _remove_site(self, key: str) -> None:
+        site = self.sites.pop(key, None)
+
+        if site is None:
+            return
+
+        if site.cancel is not None:
+            site.cancel()
+
+        if site.task is not None:
+            site.task.cancel()
+
+    @callback
+    def async_set_interval(self, key: str, interval: float) -> None:
+        """Poll a site at a new interval from its next poll on."""
+        site = self.sites.get(key)
+
+        if site is None or site.interval == interval:
+            return
+
+        if site.cancel is not None:
+            site.cancel()
+
+        site.interval = interval
+        site.offset = slot_offset(site.slot) * interval
+        self._schedule(site, time.time())
+
+        _LOGGER.debug(f"Fleet site {key} polls every {interval}s")
+
+    @callback
+    def _schedule(self, site: FleetSite, after: float) -> None:
+        site.due = after + (site.offset - after) % site.interval
+        site.cancel = async_call_later(
+            self._hass, site.due - time.time(), partial(self._tick, site)
+        )
+
+    @callback
+    def _tick(self, site: FleetSite, _now) -> None:
+        self._schedule(site, max(time.time(), site.due + site.interval / 2))
+
+        if site.polling:
+            site.overruns += 1
+
+            if site.overruns == 1:
+                _LOGGER.warning(
+                    f"Fleet site {site.key} is still polling after {site.interval}s, "
+                    "skipping polls until it finishes"
+                )
+
+            _LOGGER.debug(f"Fleet site {site.key} skipped {site.overruns} polls")
+            return
+
+        # cancelled by _remove_site when the config entry unloads
+        site.task = self._hass.async_create_task(self._async_poll_site(site))
+
+    async def _async_poll_site(self, site: FleetSite) -> None:
+        site.polling = True
+
+        try:
+            await site.refresh()
+
+        finally:
+            site.polling = False
+            site.task = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "sites": len(self.sites),
+            "max_connections": self._max_connections,
+            "max_per_host": self._max_per_host,
+            "polling": self.polling,
+            "backlog": self.backlog,
+            "backlog_max": self.backlog_max,
+            "overruns": sum(site.overruns for site in self.sites.values()),
+            "cycle_latency_p50_ms": self.cycles.latency_ms(50),
+            "cycle_latency_p95_ms": self.cycles.latency_ms(95),
+            "cycle_latency_max_ms": self.cycles.latency_ms(),
+            "wait_p95_ms": self.waits.latency_ms(95),
+            "failure_rate": self.cycles.failure_rate,
+        }
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> FleetScheduler:
+    """The fleet scheduler shared by all config entries."""
+    if DATA_FLEET not in hass.data:
+        hass.data[DATA_FLEET] = FleetScheduler(hass)
+
+    return hass.data[DATA_FLEET]
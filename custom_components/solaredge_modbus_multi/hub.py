@@ -1,22 +1,107 @@
+import asyncio
 import logging
-import threading
-from collections import OrderedDict
-from typing import Any, Dict, Optional
-
-from homeassistant.core import HomeAssistant
-from pymodbus.client.sync import ModbusTcpClient
-from pymodbus.compat import iteritems
-from pymodbus.constants import Endian
+import time
+from contextlib import AsyncExitStack
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
 from pymodbus.exceptions import ConnectionException, ModbusIOException
-from pymodbus.payload import BinaryPayloadDecoder
 from pymodbus.pdu import ExceptionResponse, ModbusExceptions
 
-from .const import DOMAIN, SunSpecNotImpl
-from .helpers import float_to_hex, parse_modbus_string
+from .capture import CaptureWriter
+from .connection import ModbusConnection
+from .const import (
+    BURST_MAX_LOAD,
+    CYCLE_BUDGET_MIN,
+    CYCLE_BUDGET_RATIO,
+    CYCLE_TIMEOUT_MARGIN,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLEEP_SCAN_INTERVAL,
+    DEFAULT_SLOW_SCAN_INTERVAL,
+    DEVICE_MAX_BACKOFF,
+    DOMAIN,
+    INVERTER_SLEEP_STATUS,
+    INVERTER_WAKE_STATUS,
+    MODBUS_MAX_GAP,
+    SUNSPEC_PHASES,
+    TIER_FAST,
+    TIER_SLOW,
+    SunSpecNotImpl,
+)
+from .helpers import float_to_hex
+from .planner import RegisterBuffer, format_plan, plan_reads
+from .registers import (
+    BATTERY_COMMON,
+    BATTERY_GROUPS,
+    BATTERY_MODEL,
+    COMMON_IDENT,
+    COMMON_MODEL,
+    INVERTER_GROUPS,
+    INVERTER_MODEL,
+    METER_GROUPS,
+    METER_MODEL,
+    MMPPT_COMMON,
+    MODEL_IDENT,
+    RegisterGroup,
+    RegisterRecord,
+)
+from .snapshot import (
+    Accumulators,
+    battery_snapshot,
+    inverter_snapshot,
+    meter_snapshot,
+)
+from .stats import PollStats
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _log_decoded(prefix: str, decoded: RegisterRecord) -> None:
+    """Log every decoded value at debug level."""
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+
+    for name, value in decoded.items():
+        if isinstance(value, float):
+            value = float_to_hex(value)
+        elif isinstance(value, int):
+            value = hex(value)
+
+        _LOGGER.debug(f"{prefix}: {name} {value}")
+
+
+async def _gather_or_cancel(*coros: Awaitable) -> List:
+    """Gather coroutines, cancelling the unfinished ones when one fails."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+
+    try:
+        return await asyncio.gather(*tasks)
+
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        if tasks:
+            await asyncio.wait(tasks)
+        raise
+
+
 class SolarEdgeException(Exception):
     """Base class for other exceptions"""
 
@@ -59,10 +144,30 @@ class DeviceInvalid(SolarEdgeException):
     pass
 
 
+class BurstRefused(SolarEdgeException):
+    """Raised when a burst would overload the connection"""
+
+    pass
+
+
+class Burst(NamedTuple):
+    """Register groups of devices polled at a high rate until a deadline."""
+
+    groups: Dict[Any, FrozenSet[str]]
+    interval: float
+    until: float
+
+
 class SolarEdgeModbusMultiHub:
+    """Discovers and polls the devices behind one Modbus/TCP host.
+
+    Home Assistant is optional, without it the hub and its devices run on
+    any asyncio event loop.
+    """
+
     def __init__(
         self,
-        hass: HomeAssistant,
+        hass: Optional["HomeAssistant"],
         name: str,
         host: str,
         port: int,
@@ -72,6 +177,15 @@ class SolarEdgeModbusMultiHub:
         detect_batteries: bool = False,
         single_device_entity: bool = True,
         keep_modbus_open: bool = False,
+        async_modbus: bool = False,
+        scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        slow_scan_interval: int = DEFAULT_SLOW_SCAN_INTERVAL,
+        sleep_scan_interval: int = DEFAULT_SLEEP_SCAN_INTERVAL,
+        discovery_cache=None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        capture: Optional[CaptureWriter] = None,
+        poll_slot: Optional[Callable[[], AsyncContextManager]] = None,
+        interval_changed: Optional[Callable[[float], None]] = None,
     ):
         """Initialize the Modbus hub."""
         self._hass = hass
@@ -84,17 +198,48 @@ class SolarEdgeModbusMultiHub:
         self._detect_batteries = detect_batteries
         self._single_device_entity = single_device_entity
         self.keep_modbus_open = keep_modbus_open
-        self._lock = threading.Lock()
+        self._async_modbus = async_modbus
+        self._scan_interval = scan_interval
+        self.tier_intervals = {
+            TIER_FAST: 0,
+            TIER_SLOW: max(scan_interval, slow_scan_interval),
+        }
+        self._sleep_scan_interval = sleep_scan_interval
+        self.cycle_budget = max(CYCLE_BUDGET_MIN, scan_interval * CYCLE_BUDGET_RATIO)
+        self.carried_devices = []
+        self.sleeping = False
+        self.burst: Optional[Burst] = None
+        self._discovery_cache = discovery_cache
+        self._discovering = False
+        self.discovered_from_cache = False
+        self._probes = asyncio.Semaphore(max_concurrent_requests)
         self._id = name.lower()
-        self._client = None
+        self.connection = ModbusConnection(
+            hass,
+            host,
+            port,
+            async_modbus,
+            max_concurrent_requests,
+            start_device_id,
+            capture=capture,
+        )
         self.inverters = []
         self.meters = []
         self.batteries = []
         self.inverter_common = {}
         self.mmppt_common = {}
+        self.read_plan = {}
 
         self.initalized = False
         self.online = False
+        self._refresh: Optional[asyncio.Task] = None
+        self._follow_up: Optional[asyncio.Task] = None
+        self._shut_down = False
+        self._refresh_reading = False
+        self._poll_slot = poll_slot
+        self._interval_changed = interval_changed
+        self._refresh_waiters: Dict[asyncio.Task, int] = {}
+        self.coalesced_refreshes = 0
 
         _LOGGER.debug(
             (
@@ -105,6 +250,12 @@ class SolarEdgeModbusMultiHub:
                 f"detect_batteries={self._detect_batteries}, "
                 f"single_device_entity={self._single_device_entity}, "
                 f"keep_modbus_open={self.keep_modbus_open}, "
+                f"async_modbus={self._async_modbus}, "
+                f"tier_intervals={self.tier_intervals}, "
+                f"cycle_budget={self.cycle_budget}, "
+                f"sleep_scan_interval={self._sleep_scan_interval}, "
+                f"max_concurrent_requests={max_concurrent_requests}, "
+                f"capture={capture.path if capture else None}, "
             ),
         )
 
@@ -120,183 +271,376 @@ class SolarEdgeModbusMultiHub:
                 ),
             )
 
-        for inverter_index in range(self._number_of_inverters):
-            inverter_unit_id = inverter_index + self._start_device_id
-
-            try:
-                new_inverter = SolarEdgeInverter(inverter_unit_id, self)
-                await self._hass.async_add_executor_job(new_inverter.init_device)
-                self.inverters.append(new_inverter)
-
-            except ModbusReadError as e:
-                self.disconnect()
-                raise HubInitFailed(f"{e}")
+        self.inverters, self.meters, self.batteries = [], [], []
+        self.discovered_from_cache = False
 
-            except DeviceInvalid as e:
-                """Inverters are required"""
-                _LOGGER.error(f"Inverter device ID {inverter_unit_id}: {e}")
-                raise HubInitFailed(f"{e}")
+        if self._discovery_cache is not None:
+            topology = await self._discovery_cache.async_load()
 
-            if self._detect_meters:
+            if topology is not None:
                 try:
-                    new_meter_1 = SolarEdgeMeter(inverter_unit_id, 1, self)
-                    await self._hass.async_add_executor_job(new_meter_1.init_device)
-
-                    for meter in self.meters:
-                        if new_meter_1.serial == meter.serial:
-                            _LOGGER.warning(
-                                (
-                                    f"Duplicate serial {new_meter_1.serial} "
-                                    f"on meter 1 inverter {inverter_unit_id}"
-                                ),
-                            )
-                            raise DeviceInvalid(
-                                f"Duplicate m1 serial {new_meter_1.serial}"
-                            )
-
-                    self.meters.append(new_meter_1)
-                    _LOGGER.debug(f"Found meter 1 on inverter ID {inverter_unit_id}")
+                    await self._async_init_from_cache(topology)
+                    self.discovered_from_cache = True
+
+                except (DeviceInvalid, KeyError) as e:
+                    _LOGGER.debug(f"Discovery cache not used: {e}")
+                    self.inverters, self.meters, self.batteries = [], [], []
 
                 except ModbusReadError as e:
                     self.disconnect()
                     raise HubInitFailed(f"{e}")
 
-                except DeviceInvalid:
-                    pass
+        if not self.discovered_from_cache:
+            (
+                self.inverters,
+                self.meters,
+                self.batteries,
+            ) = await self._async_discover()
 
-                try:
-                    new_meter_2 = SolarEdgeMeter(inverter_unit_id, 2, self)
-                    await self._hass.async_add_executor_job(new_meter_2.init_device)
-
-                    for meter in self.meters:
-                        if new_meter_2.serial == meter.serial:
-                            _LOGGER.warning(
-                                (
-                                    f"Duplicate serial {new_meter_2.serial} "
-                                    f"on meter 2 inverter {inverter_unit_id}"
-                                ),
-                            )
-                            raise DeviceInvalid(
-                                f"Duplicate m2 serial {new_meter_2.serial}"
-                            )
-
-                    self.meters.append(new_meter_2)
-                    _LOGGER.debug(f"Found meter 2 on inverter ID {inverter_unit_id}")
+            if self._discovery_cache is not None:
+                await self._discovery_cache.async_save(self.topology)
 
-                except ModbusReadError as e:
-                    self.disconnect()
-                    raise HubInitFailed(f"{e}")
+        try:
+            await self._async_read_devices()
 
-                except DeviceInvalid:
-                    pass
+        except ConnectionException as e:
+            self.disconnect()
+            raise HubInitFailed(f"Connection failed: {e}")
 
-                try:
-                    new_meter_3 = SolarEdgeMeter(inverter_unit_id, 3, self)
-                    await self._hass.async_add_executor_job(new_meter_3.init_device)
-
-                    for meter in self.meters:
-                        if new_meter_3.serial == meter.serial:
-                            _LOGGER.warning(
-                                (
-                                    f"Duplicate serial {new_meter_3.serial} "
-                                    f"on meter 3 inverter {inverter_unit_id}"
-                                ),
-                            )
-                            raise DeviceInvalid(
-                                f"Duplicate m3 serial {new_meter_3.serial}"
-                            )
-
-                    self.meters.append(new_meter_3)
-                    _LOGGER.debug(f"Found meter 3 on inverter ID {inverter_unit_id}")
+        self.initalized = True
 
-                except ModbusReadError as e:
-                    self.disconnect()
-                    raise HubInitFailed(f"{e}")
+    async def _async_discover(self) -> Tuple[List, List, List]:
+        """Probe every configured unit ID for inverters, meters and batteries.
 
-                except DeviceInvalid:
-                    pass
+        Up to max_concurrent_requests probes run at the same time, all of them
+        are cancelled when one fails. Duplicate serials are dropped once every
+        probe has finished.
+        """
+        try:
+            results = await _gather_or_cancel(
+                *[
+                    self._async_discover_unit(inverter_index + self._start_device_id)
+                    for inverter_index in range(self._number_of_inverters)
+                ]
+            )
 
-            if self._detect_batteries:
-                try:
-                    new_battery_1 = SolarEdgeBattery(inverter_unit_id, 1, self)
-                    await self._hass.async_add_executor_job(new_battery_1.init_device)
-
-                    for battery in self.batteries:
-                        if new_battery_1.serial == battery.serial:
-                            _LOGGER.warning(
-                                (
-                                    f"Duplicate serial {new_battery_1.serial} "
-                                    f"on battery 1 inverter {inverter_unit_id}"
-                                ),
-                            )
-                            raise DeviceInvalid(
-                                f"Duplicate b1 serial {new_battery_1.serial}"
-                            )
-
-                    self.batteries.append(new_battery_1)
-                    _LOGGER.debug(f"Found battery 1 inverter {inverter_unit_id}")
+        except ModbusReadError as e:
+            self.disconnect()
+            raise HubInitFailed(f"{e}")
 
-                except ModbusReadError as e:
-                    self.disconnect()
-                    raise HubInitFailed(f"{e}")
+        except HubInitFailed:
+            self.disconnect()
+            raise
 
-                except DeviceInvalid:
-                    pass
+        inverters, meters, batteries = [], [], []
 
-                try:
-                    new_battery_2 = SolarEdgeBattery(inverter_unit_id, 2, self)
-                    await self._hass.async_add_executor_job(new_battery_2.init_device)
-
-                    for battery in self.batteries:
-                        if new_battery_2.serial == battery.serial:
-                            _LOGGER.warning(
-                                (
-                                    f"Duplicate serial {new_battery_2.serial} "
-                                    f"on battery 2 inverter {inverter_unit_id}"
-                                ),
-                            )
-                            raise DeviceInvalid(
-                                f"Duplicate b2 serial {new_battery_1.serial}"
-                            )
-
-                    self.batteries.append(new_battery_2)
-                    _LOGGER.debug(f"Found battery 2 inverter {inverter_unit_id}")
+        for inverter, unit_meters, unit_batteries in results:
+            inverters.append(inverter)
 
-                except ModbusReadError as e:
-                    self.disconnect()
-                    raise HubInitFailed(f"{e}")
+            for meter in unit_meters:
+                if meter.serial in [known.serial for known in meters]:
+                    _LOGGER.warning(
+                        (
+                            f"Duplicate serial {meter.serial} "
+                            f"on meter {meter.meter_id} "
+                            f"inverter {meter.inverter_unit_id}"
+                        ),
+                    )
+                    continue
 
-                except DeviceInvalid:
-                    pass
+                meters.append(meter)
+                _LOGGER.debug(
+                    f"Found meter {meter.meter_id} "
+                    f"on inverter ID {meter.inverter_unit_id}"
+                )
 
-        try:
-            for inverter in self.inverters:
-                await self._hass.async_add_executor_job(inverter.read_modbus_data)
+            for battery in unit_batteries:
+                if battery.serial in [known.serial for known in batteries]:
+                    _LOGGER.warning(
+                        (
+                            f"Duplicate serial {battery.serial} "
+                            f"on battery {battery.battery_id} "
+                            f"inverter {battery.inverter_unit_id}"
+                        ),
+                    )
+                    continue
+
+                batteries.append(battery)
+                _LOGGER.debug(
+                    f"Found battery {battery.battery_id} "
+                    f"inverter {battery.inverter_unit_id}"
+                )
 
-            for meter in self.meters:
-                await self._hass.async_add_executor_job(meter.read_modbus_data)
+        return inverters, meters, batteries
 
-            for battery in self.batteries:
-                await self._hass.async_add_executor_job(battery.read_modbus_data)
+    async def _async_discover_unit(self, inverter_unit_id: int) -> Tuple:
+        """Probe an inverter, then its meters and batteries."""
+        inverter = SolarEdgeInverter(inverter_unit_id, self)
 
-        except ModbusReadError as e:
-            self.disconnect()
-            raise HubInitFailed(f"Read error: {e}")
+        try:
+            await self._async_probe(inverter, f"inverter {inverter_unit_id}")
 
         except DeviceInvalid as e:
-            self.disconnect()
-            raise HubInitFailed(f"Invalid device: {e}")
+            """Inverters are required"""
+            _LOGGER.error(f"Inverter device ID {inverter_unit_id}: {e}")
+            raise HubInitFailed(f"{e}")
 
-        except ConnectionException as e:
-            self.disconnect()
-            raise HubInitFailed(f"Connection failed: {e}")
+        probes = []
 
-        self.initalized = True
+        if self._detect_meters:
+            for meter_id in [1, 2, 3]:
+                probes.append(
+                    (
+                        SolarEdgeMeter(inverter_unit_id, meter_id, self),
+                        f"meter {meter_id} on inverter {inverter_unit_id}",
+                    )
+                )
+
+        if self._detect_batteries:
+            for battery_id in [1, 2]:
+                probes.append(
+                    (
+                        SolarEdgeBattery(inverter_unit_id, battery_id, self),
+                        f"battery {battery_id} on inverter {inverter_unit_id}",
+                    )
+                )
+
+        found = await _gather_or_cancel(
+            *[self._async_probe_optional(device, name) for device, name in probes]
+        )
+        devices = [device for device, _ in probes]
+
+        return (
+            inverter,
+            [
+                device
+                for device, ok in zip(devices, found)
+                if ok and isinstance(device, SolarEdgeMeter)
+            ],
+            [
+                device
+                for device, ok in zip(devices, found)
+                if ok and isinstance(device, SolarEdgeBattery)
+            ],
+        )
+
+    async def _async_probe(self, device, name: str) -> None:
+        """Initialize a device, logging how long the probe took."""
+        async with self._probes:
+            start = time.monotonic()
+
+            try:
+                await device.init_device()
+
+            except SolarEdgeException as e:
+                _LOGGER.debug(
+                    f"Probe {name}: {e} after {time.monotonic() - start:.3f}s"
+                )
+                raise
+
+            _LOGGER.debug(f"Probe {name}: found in {time.monotonic() - start:.3f}s")
+
+    async def _async_probe_optional(self, device, name: str) -> bool:
+        """Probe a meter or battery, returning False if it isn't there."""
+        try:
+            await self._async_probe(device, name)
+
+        except DeviceInvalid:
+            return False
+
+        return True
+
+    async def _async_init_from_cache(self, topology: Dict[str, Any]) -> None:
+        """Initialize only the devices found by an earlier discovery."""
+        unit_ids = [cached["unit_id"] for cached in topology["inverters"]]
+
+        if unit_ids != list(
+            range(
+                self._start_device_id,
+                self._start_device_id + self._number_of_inverters,
+            )
+        ):
+            raise DeviceInvalid(f"Cached inverters {unit_ids} not configured")
+
+        if (
+            topology["detect_meters"] != self._detect_meters
+            or topology["detect_batteries"] != self._detect_batteries
+        ):
+            raise DeviceInvalid("Device detection options changed")
+
+        for cached in topology["inverters"]:
+            inverter = SolarEdgeInverter(cached["unit_id"], self)
+            await inverter.init_device()
+            self.inverters.append(inverter)
+
+            for cached_meter in cached["meters"]:
+                meter = SolarEdgeMeter(
+                    cached["unit_id"], cached_meter["meter_id"], self
+                )
+                await meter.init_device()
+                self.meters.append(meter)
+
+            for cached_battery in cached["batteries"]:
+                battery = SolarEdgeBattery(
+                    cached["unit_id"], cached_battery["battery_id"], self
+                )
+                await battery.init_device()
+                self.batteries.append(battery)
+
+        if self.topology != topology:
+            raise DeviceInvalid("Devices changed since last discovery")
+
+        _LOGGER.debug(f"Initialized {len(unit_ids)} inverters from discovery cache")
+
+    def _topology(self, inverters, meters, batteries) -> Dict[str, Any]:
+        return {
+            "detect_meters": self._detect_meters,
+            "detect_batteries": self._detect_batteries,
+            "inverters": [
+                {
+                    "unit_id": inverter.inverter_unit_id,
+                    "serial": inverter.serial,
+                    "mmppt_units": (
+                        None
+                        if inverter.decoded_mmppt is None
+                        else inverter.decoded_mmppt["mmppt_Units"]
+                    ),
+                    "meters": [
+                        {
+                            "meter_id": meter.meter_id,
+                            "serial": meter.serial,
+                            "start_address": meter.start_address,
+                        }
+                        for meter in meters
+                        if meter.inverter_unit_id == inverter.inverter_unit_id
+                    ],
+                    "batteries": [
+                        {"battery_id": battery.battery_id, "serial": battery.serial}
+                        for battery in batteries
+                        if battery.inverter_unit_id == inverter.inverter_unit_id
+                    ],
+                }
+                for inverter in inverters
+            ],
+        }
+
+    @property
+    def topology(self) -> Dict[str, Any]:
+        """Discovered devices, as saved in the discovery cache."""
+        return self._topology(self.inverters, self.meters, self.batteries)
+
+    async def async_rediscover(self) -> bool:
+        """Run a full discovery, returning True if the devices changed."""
+        self._discovering = True
+
+        try:
+            await self.connect()
+            topology = self._topology(*await self._async_discover())
+
+        except (SolarEdgeException, ConnectionException) as e:
+            _LOGGER.warning(f"Background discovery failed: {e}")
+            return False
+
+        finally:
+            self._discovering = False
+
+        if self._discovery_cache is not None:
+            await self._discovery_cache.async_save(topology)
+
+        if topology != self.topology:
+            _LOGGER.info("Devices changed since last discovery")
+            return True
+
+        return False
 
     async def async_refresh_modbus_data(self, _now: Optional[int] = None) -> bool:
-        if not self.is_socket_open():
+        """Refresh the devices, at most one refresh running and one queued.
+
+        A refresh requested before the running one starts reading, while it
+        waits for its poll slot, shares it. Requested later, it queues a
+        follow-up refresh and further requests share the queued one. Shared
+        requests count as coalesced.
+        """
+        if self._shut_down:
+            raise DataUpdateFailed("Hub is shut down")
+
+        if self._follow_up is not None and not self._follow_up.done():
+            task = self._follow_up
+
+        elif self._refresh is not None and not self._refresh.done():
+            if self._refresh_reading:
+                task = self._follow_up = asyncio.get_running_loop().create_task(
+                    self._async_refresh_cycle(self._refresh)
+                )
+            else:
+                task = self._refresh
+
+        else:
+            task = self._refresh = asyncio.get_running_loop().create_task(
+                self._async_refresh_cycle()
+            )
+
+        if task in self._refresh_waiters:
+            self.coalesced_refreshes += 1
+            _LOGGER.debug(f"Refresh coalesced ({self.coalesced_refreshes} total)")
+
+        return await self._async_wait_refresh(task)
+
+    async def _async_wait_refresh(self, task: asyncio.Task) -> bool:
+        """Wait for a shared refresh, cancelling it if no one else waits."""
+        self._refresh_waiters[task] = self._refresh_waiters.get(task, 0) + 1
+
+        try:
+            return await asyncio.shield(task)
+
+        except asyncio.CancelledError:
+            if self._refresh_waiters[task] == 1:
+                task.cancel()
+            raise
+
+        finally:
+            self._refresh_waiters[task] -= 1
+            if not self._refresh_waiters[task]:
+                del self._refresh_waiters[task]
+
+    async def _async_refresh_cycle(
+        self, previous: Optional[asyncio.Task] = None
+    ) -> bool:
+        if previous is not None:
+            await asyncio.wait([previous])
+            self._refresh, self._follow_up = self._follow_up, None
+
+        self._refresh_reading = False
+
+        try:
+            async with AsyncExitStack() as stack:
+                if self._poll_slot is not None:
+                    await stack.enter_async_context(self._poll_slot())
+
+                self._refresh_reading = True
+
+                return await asyncio.wait_for(
+                    self._async_refresh_modbus_data(), self.cycle_timeout
+                )
+
+        finally:
+            await self.connection.async_flush_capture()
+
+    async def _async_refresh_modbus_data(self) -> bool:
+        if self.burst is not None and time.monotonic() >= self.burst.until:
+            self.stop_burst()
+
+        try:
             await self.connect()
 
+        except ConnectionException as e:
+            self.online = False
+
+            if not self.initalized:
+                raise HubInitFailed(f"Setup failed: {e}")
+
+            raise DataUpdateFailed(f"{e}")
+
         if not self.initalized:
             try:
                 await self._async_init_solaredge()
@@ -305,42 +649,384 @@ class SolarEdgeModbusMultiHub:
                 self.disconnect()
                 raise HubInitFailed(f"Setup failed: {e}")
 
-        if not self.is_socket_open():
+        self.online = True
+        try:
+            await self._async_read_devices()
+
+        except ConnectionException as e:
             self.online = False
-            raise DataUpdateFailed(
-                f"Could not open Modbus/TCP connection to {self._host}"
+            self.disconnect()
+            raise DataUpdateFailed(f"Connection failed: {e}")
+
+        if not self.keep_modbus_open and not self._discovering:
+            self.disconnect()
+
+        return True
+
+    @property
+    def scan_interval(self) -> int:
+        return self._scan_interval
+
+    @property
+    def cycle_interval(self) -> float:
+        """Seconds between refreshes, shorter during a burst."""
+        if self.burst is not None:
+            return self.burst.interval
+
+        return self._scan_interval
+
+    def group_interval(self, device, group: RegisterGroup) -> float:
+        """Seconds between reads of a register group."""
+        interval = self.tier_intervals[group.tier]
+
+        if self.burst is not None:
+            if group.name in self.burst.groups.get(device, ()):
+                return self.burst.interval
+
+            # other fast tier groups stay at the scan interval, not every cycle
+            interval = max(interval, self._scan_interval)
+
+        if self.sleeping and group.name in device.sleep_groups:
+            interval = max(interval, self._sleep_scan_interval)
+
+        return interval
+
+    def poll_intervals(self, device) -> Dict[str, int]:
+        """Current polling interval of each register group of a device."""
+        return {
+            group.name: max(self.cycle_interval, self.group_interval(device, group))
+            for group in device.register_groups
+        }
+
+    def _groups_due(self, device, now: float) -> List[RegisterGroup]:
+        """Register groups of a device whose interval has elapsed."""
+        if not device.decoded_model:
+            return list(device.register_groups)
+
+        # allow for coordinator jitter so a tier matching the scan
+        # interval doesn't slip to every other cycle
+        tolerance = self.cycle_interval / 2
+
+        return [
+            group
+            for group in device.register_groups
+            if (device.needed_groups is None or group.name in device.needed_groups)
+            and (
+                group.name not in device.last_read
+                or now - device.last_read[group.name]
+                >= self.group_interval(device, group) - tolerance
+            )
+        ]
+
+    def plan_burst(
+        self, groups: Dict[Any, FrozenSet[str]], interval: float, duration: float
+    ) -> Burst:
+        """A burst of register groups per device, if the connection can take it."""
+        burst = Burst(groups, interval, time.monotonic() + duration)
+        load = self.bus_load(burst)
+
+        if load is None:
+            raise BurstRefused(
+                "Read latency of the burst devices is not measured yet, "
+                "try again after they were polled"
             )
 
-        else:
-            self.online = True
+        if load > BURST_MAX_LOAD:
+            raise BurstRefused(
+                f"Estimated bus load of {load:.0%} with the burst exceeds "
+                f"{BURST_MAX_LOAD:.0%} of the measured read capacity"
+            )
+
+        return burst
+
+    def start_burst(self, burst: Burst) -> None:
+        """Poll the register groups of a burst at its interval until it ends."""
+        self.burst = burst
+
+        for device, groups in burst.groups.items():
+            _LOGGER.debug(
+                f"{device.name} burst every {burst.interval}s: {sorted(groups)}"
+            )
+
+        if self._interval_changed is not None:
+            self._interval_changed(self.cycle_interval)
+
+    def stop_burst(self) -> None:
+        """Return to the scan interval."""
+        if self.burst is None:
+            return
+
+        _LOGGER.debug("Burst ended")
+        self.burst = None
+
+        if self._interval_changed is not None:
+            self._interval_changed(self.cycle_interval)
+
+    def bus_load(self, burst: Optional[Burst] = None) -> Optional[float]:
+        """Estimated share of time the connection is busy reading.
+
+        Needed register groups are counted at the scan interval and burst
+        groups also at the burst interval, every read taking the p95 latency
+        of its device. None when a burst device has no measured latency.
+        """
+        load = 0.0
+
+        for device in [*self.inverters, *self.meters, *self.batteries]:
+            latency = device.stats.latency_ms(95)
+            bursting = burst is not None and device in burst.groups
+
+            if latency is None:
+                if bursting:
+                    return None
+                continue
+
+            needed = [
+                group
+                for group in device.register_groups
+                if device.needed_groups is None or group.name in device.needed_groups
+            ]
+            reads = len(self._device_ranges(device, needed))
+            load += reads * latency / 1000 / self._scan_interval
+
+            if bursting:
+                groups = [
+                    group
+                    for group in device.register_groups
+                    if group.name in burst.groups[device]
+                ]
+                reads = len(self._device_ranges(device, groups))
+                load += reads * latency / 1000 / burst.interval
+
+        return load
+
+    @staticmethod
+    def _device_ranges(
+        device, groups: Iterable[RegisterGroup]
+    ) -> List[Tuple[int, int]]:
+        """Reads of register groups of a device."""
+        # registers between groups of one model are always readable, so
+        # read through short gaps left by groups that are not read
+        return plan_reads(
+            [
+                (device.model_address + group.offset, group.map.count)
+                for group in groups
+            ],
+            max_gap=MODBUS_MAX_GAP,
+        )
+
+    def set_needed_fields(self, device, fields: Iterable[str]) -> None:
+        """Only poll register groups with fields that entities use."""
+        fields = set(fields) | device.required_fields
+        needed = {
+            group.name
+            for group in device.register_groups
+            if fields.intersection(group.map.fields)
+        }
+
+        if needed != device.needed_groups:
+            skipped = [g.name for g in device.register_groups if g.name not in needed]
+            _LOGGER.debug(f"{device.name} not polling register groups {skipped}")
+            device.needed_groups = needed
+
+    def _update_sleeping(self) -> None:
+        """Slow inverter polling once all inverters are off or sleeping."""
+        status = [
+            inverter.decoded_model["I_Status"]
+            for inverter in self.inverters
+            if not inverter.failures and "I_Status" in inverter.decoded_model
+        ]
+
+        if not status:
+            return
+
+        if self.sleeping and any(s in INVERTER_WAKE_STATUS for s in status):
+            _LOGGER.debug(f"Inverters waking up, status {status}")
+            self.sleeping = False
+
+        elif not self.sleeping and all(s in INVERTER_SLEEP_STATUS for s in status):
+            _LOGGER.debug(f"Inverters sleeping, status {status}")
+            self.sleeping = True
+
+    async def _async_read_devices(self, deadline: Optional[float] = None) -> None:
+        """Read the register groups that are due and decode every device.
+
+        A device whose reads or data fail is marked unavailable and retried
+        with a backoff while the other devices keep updating. Errors are only
+        raised when the connection fails.
+
+        Devices that don't fit in the cycle budget are not read and go first
+        in the next cycle. Devices that were never decoded are always read
+        completely, whatever the budget.
+        """
+        now = time.monotonic()
+        if deadline is None:
+            deadline = now + self.cycle_budget
+
+        devices = [
+            device
+            for device in [*self.inverters, *self.meters, *self.batteries]
+            if now >= device.retry_at - self._scan_interval / 2
+        ]
+        due = {}
+        device_ranges = {}
+
+        for device in devices:
+            due[device] = self._groups_due(device, now)
+            device_ranges[device] = self._device_ranges(device, due[device])
+
+        # during a burst most cycles only read the burst devices
+        devices = [device for device in devices if due[device]]
+
+        devices, skipped = self._fit_budget(devices, device_ranges, deadline - now)
+        ranges = {}
+        spans = {}
+
+        for device in devices:
+            ranges.setdefault(device.inverter_unit_id, []).extend(device_ranges[device])
+            spans.setdefault(device.inverter_unit_id, []).extend(
+                (address, address + count, device)
+                for address, count in device_ranges[device]
+            )
+
+        self.read_plan = {unit: plan_reads(ranges[unit]) for unit in ranges}
+        buffers = {}
+        failed = {}
+
+        for unit, plan in self.read_plan.items():
+            _LOGGER.debug(f"Unit {unit} read plan: {format_plan(plan)}")
+            buffer = buffers[unit] = RegisterBuffer()
+
+            for address, count in plan:
+                readers = {
+                    device
+                    for start, end, device in spans[unit]
+                    if start < address + count and address < end
+                }
+                started = time.monotonic()
+
+                if started >= deadline and all(d.decoded_model for d in readers):
+                    skipped.extend(d for d in readers if d not in skipped)
+                    continue
+
+                try:
+                    result = await self.async_read_holding_registers(
+                        unit=unit, address=address, count=count
+                    )
+
+                except (ConnectionException, asyncio.CancelledError) as e:
+                    # cancelled when the cycle overruns the coordinator timeout
+                    for device in readers:
+                        device.stats.add_error(e)
+                    raise
+
+                finally:
+                    for device in readers:
+                        device.stats.add_read(time.monotonic() - started)
+
+                if result.isError():
+                    _LOGGER.debug(f"Unit {unit} read {address}+{count}: {result}")
+                    for device in readers:
+                        failed[device] = ModbusReadError(
+                            f"Unit {unit} read error: {result}"
+                        )
+                    continue
+
+                buffer.add(address, result.registers)
+
+        skipped = [device for device in skipped if device not in failed]
+        devices = [device for device in devices if device not in skipped]
+        self.carried_devices = skipped
+
+        if skipped:
+            _LOGGER.debug(
+                f"Cycle budget of {self.cycle_budget}s exceeded, carrying "
+                f"{', '.join(device.name for device in skipped)} to the next cycle"
+            )
+
+        for device in devices:
+            if device in failed:
+                continue
+
             try:
-                for inverter in self.inverters:
-                    await self._hass.async_add_executor_job(inverter.read_modbus_data)
-                for meter in self.meters:
-                    await self._hass.async_add_executor_job(meter.read_modbus_data)
-                for battery in self.batteries:
-                    await self._hass.async_add_executor_job(battery.read_modbus_data)
-
-            except ModbusReadError as e:
-                self.online = False
-                self.disconnect()
-                raise DataUpdateFailed(f"Update failed: {e}")
+                device.decode_modbus_data(buffers[device.inverter_unit_id], due[device])
 
             except DeviceInvalid as e:
-                self.online = False
-                if not self.keep_modbus_open:
-                    self.disconnect()
-                raise DataUpdateFailed(f"Invalid device: {e}")
+                failed[device] = e
 
-            except ConnectionException as e:
-                self.online = False
-                self.disconnect()
-                raise DataUpdateFailed(f"Connection failed: {e}")
+        for device, error in failed.items():
+            device.stats.add_error(error)
 
-        if not self.keep_modbus_open:
-            self.disconnect()
+        for device in devices:
+            if device in failed:
+                self._device_failed(device, failed[device], now)
+                continue
 
-        return True
+            if device.failures:
+                _LOGGER.info(f"{device.name} is available again")
+                device.failures = 0
+
+            device.stats.add_success()
+
+            for group in due[device]:
+                device.last_read[group.name] = now
+
+        self._update_sleeping()
+
+    def _fit_budget(
+        self, devices: List, device_ranges: Dict, budget: float
+    ) -> Tuple[List, List]:
+        """Split devices into those to read now and those to carry over.
+
+        Devices carried from the last cycle go first, then inverters, meters
+        and batteries. Read time is estimated from each device's p95 latency.
+        Devices that were never decoded are never carried over.
+        """
+        carried = [device for device in self.carried_devices if device in devices]
+        devices = carried + [device for device in devices if device not in carried]
+        selected = []
+        skipped = []
+        estimate = 0.0
+
+        for device in devices:
+            latency = device.stats.latency_ms(95) or 0
+            cost = len(device_ranges[device]) * latency / 1000
+
+            if selected and estimate + cost > budget and device.decoded_model:
+                skipped.append(device)
+                continue
+
+            selected.append(device)
+            estimate += cost
+
+        return selected, skipped
+
+    def _device_failed(self, device, error: SolarEdgeException, now: float) -> None:
+        """Mark a device unavailable and back off before polling it again."""
+        device.failures += 1
+        backoff = min(
+            self._scan_interval * 2 ** (device.failures - 1),
+            max(self._scan_interval, DEVICE_MAX_BACKOFF),
+        )
+        device.retry_at = now + backoff
+
+        if device.failures == 1:
+            _LOGGER.warning(f"{device.name} is unavailable: {error}")
+
+        _LOGGER.debug(
+            f"{device.name} failed {device.failures} times, retry in {backoff}s"
+        )
+
+    @property
+    def cycle_timeout(self) -> Optional[float]:
+        """Hard limit for one refresh, allowing the last read to time out.
+
+        None before the hub is initialized, so discovery and the first
+        complete read of every device are only limited by read timeouts.
+        """
+        if not self.initalized:
+            return None
+
+        return self.cycle_budget + CYCLE_TIMEOUT_MARGIN
 
     @property
     def name(self):
@@ -353,36 +1039,44 @@ class SolarEdgeModbusMultiHub:
 
     def disconnect(self) -> None:
         """Disconnect modbus client."""
-        with self._lock:
-            self._client.close()
+        self.connection.close()
 
     async def connect(self) -> None:
-        """Connect modbus client."""
-        with self._lock:
-            if self._client is None:
-                self._client = ModbusTcpClient(host=self._host, port=self._port)
-
-            await self._hass.async_add_executor_job(self._client.connect)
+        """Borrow an open and responding connection."""
+        await self.connection.async_ready()
 
     def is_socket_open(self) -> bool:
         """Check modbus client connection status."""
-        with self._lock:
-            if self._client is None:
-                return False
+        return self.connection.is_open()
 
-            return self._client.is_socket_open()
+    async def async_keepalive(self, _now: Optional[int] = None) -> None:
+        """Keep an idle connection open between polls."""
+        if self.initalized and self.is_socket_open():
+            if not await self.connection.async_keepalive():
+                self.disconnect()
 
     async def shutdown(self) -> None:
-        """Shut down the hub."""
+        """Shut down the hub, cancelling its running and queued refresh."""
+        self._shut_down = True
+        refreshes = [
+            task
+            for task in (self._follow_up, self._refresh)
+            if task is not None and not task.done()
+        ]
+
+        for task in refreshes:
+            task.cancel()
+
+        if refreshes:
+            await asyncio.wait(refreshes)
+
         self.online = False
         self.disconnect()
-        self._client = None
+        await self.connection.async_flush_capture()
 
-    def read_holding_registers(self, unit, address, count):
-        """Read holding registers."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_holding_registers(address, count, **kwargs)
+    async def async_read_holding_registers(self, unit, address, count):
+        """Read holding registers on the event loop or in the executor."""
+        return await self.connection.async_read_holding_registers(unit, address, count)
 
 
 class SolarEdgeInverter:
@@ -390,13 +1084,27 @@ class SolarEdgeInverter:
         self.inverter_unit_id = device_id
         self.hub = hub
         self.decoded_common = []
-        self.decoded_model = []
+        self.decoded_model = {}
+        self.last_read = {}
+        self.snapshot = {}
+        self._accum = Accumulators()
+        self.stats = PollStats()
+        self.failures = 0
+        self.retry_at = 0.0
         self.decoded_mmppt = []
         self.has_parent = False
+        self.model_address = 40069
+        self.model_map = INVERTER_MODEL
+        self.register_groups = INVERTER_GROUPS
+        self.required_fields = {"C_SunSpec_DID", "C_SunSpec_Length", "I_Status"}
+        self.needed_groups = None
+        self.sleep_groups = {
+            group.name for group in INVERTER_GROUPS if group.name != "status"
+        }
 
-    def init_device(self) -> None:
-        inverter_data = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id, address=40000, count=4
+    async def init_device(self) -> None:
+        inverter_data = await self.hub.async_read_holding_registers(
+            unit=self.inverter_unit_id, address=40000, count=COMMON_IDENT.count
         )
         if inverter_data.isError():
             _LOGGER.debug(f"Inverter {self.inverter_unit_id}: {inverter_data}")
@@ -417,25 +1125,9 @@ class SolarEdgeInverter:
             else:
                 raise ModbusReadError(inverter_data)
 
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            inverter_data.registers, byteorder=Endian.Big
-        )
+        decoded_ident = COMMON_IDENT.decode(inverter_data.registers)
 
-        decoded_ident = OrderedDict(
-            [
-                ("C_SunSpec_ID", decoder.decode_32bit_uint()),
-                ("C_SunSpec_DID", decoder.decode_16bit_uint()),
-                ("C_SunSpec_Length", decoder.decode_16bit_uint()),
-            ]
-        )
-
-        for name, value in iteritems(decoded_ident):
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id}: "
-                    f"{name} {hex(value) if isinstance(value, int) else value}"
-                ),
-            )
+        _log_decoded(f"Inverter {self.inverter_unit_id}", decoded_ident)
 
         if (
             decoded_ident["C_SunSpec_ID"] == SunSpecNotImpl.UINT32
@@ -448,46 +1140,21 @@ class SolarEdgeInverter:
                 f"ID {self.inverter_unit_id} is not a SunSpec inverter."
             )
 
-        inverter_data = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id, address=40004, count=65
+        inverter_data = await self.hub.async_read_holding_registers(
+            unit=self.inverter_unit_id, address=40004, count=COMMON_MODEL.count
         )
         if inverter_data.isError():
             _LOGGER.debug(f"Inverter {self.inverter_unit_id}: {inverter_data}")
             raise ModbusReadError(inverter_data)
 
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            inverter_data.registers, byteorder=Endian.Big
-        )
+        self.decoded_common = COMMON_MODEL.decode(inverter_data.registers)
 
-        self.decoded_common = OrderedDict(
-            [
-                (
-                    "C_Manufacturer",
-                    parse_modbus_string(decoder.decode_string(32)),
-                ),
-                ("C_Model", parse_modbus_string(decoder.decode_string(32))),
-                ("C_Option", parse_modbus_string(decoder.decode_string(16))),
-                ("C_Version", parse_modbus_string(decoder.decode_string(16))),
-                (
-                    "C_SerialNumber",
-                    parse_modbus_string(decoder.decode_string(32)),
-                ),
-                ("C_Device_address", decoder.decode_16bit_uint()),
-            ]
-        )
-
-        for name, value in iteritems(self.decoded_common):
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id}: "
-                    f"{name} {hex(value) if isinstance(value, int) else value}"
-                ),
-            )
+        _log_decoded(f"Inverter {self.inverter_unit_id}", self.decoded_common)
 
         self.hub.inverter_common[self.inverter_unit_id] = self.decoded_common
 
-        mmppt_common = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id, address=40121, count=10
+        mmppt_common = await self.hub.async_read_holding_registers(
+            unit=self.inverter_unit_id, address=40121, count=MMPPT_COMMON.count
         )
         if mmppt_common.isError():
             _LOGGER.debug(f"Inverter {self.inverter_unit_id} MMPPT: {inverter_data}")
@@ -500,31 +1167,9 @@ class SolarEdgeInverter:
                 raise ModbusReadError(mmppt_common)
 
         else:
-            decoder = BinaryPayloadDecoder.fromRegisters(
-                mmppt_common.registers, byteorder=Endian.Big
-            )
+            self.decoded_mmppt = MMPPT_COMMON.decode(mmppt_common.registers)
 
-            self.decoded_mmppt = OrderedDict(
-                [
-                    ("mmppt_DID", decoder.decode_16bit_uint()),
-                    ("mmppt_Length", decoder.decode_16bit_uint()),
-                    ("mmppt_DCA_SF", decoder.decode_16bit_int()),
-                    ("mmppt_DCV_SF", decoder.decode_16bit_int()),
-                    ("mmppt_DCW_SF", decoder.decode_16bit_int()),
-                    ("mmppt_DCWH_SF", decoder.decode_16bit_int()),
-                    ("mmppt_Events", decoder.decode_32bit_uint()),
-                    ("mmppt_Units", decoder.decode_16bit_uint()),
-                    ("mmppt_TmsPer", decoder.decode_16bit_uint()),
-                ]
-            )
-
-            for name, value in iteritems(self.decoded_mmppt):
-                _LOGGER.debug(
-                    (
-                        f"Inverter {self.inverter_unit_id} MMPPT: "
-                        f"{name} {hex(value) if isinstance(value, int) else value}"
-                    ),
-                )
+            _log_decoded(f"Inverter {self.inverter_unit_id} MMPPT", self.decoded_mmppt)
 
             if (
                 self.decoded_mmppt["mmppt_DID"] == SunSpecNotImpl.UINT16
@@ -557,106 +1202,38 @@ class SolarEdgeInverter:
             "hw_version": self.option,
         }
 
-    def read_modbus_data(self) -> None:
-        inverter_data = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id, address=40069, count=2
-        )
-        if inverter_data.isError():
-            _LOGGER.debug(f"Inverter {self.inverter_unit_id}: {inverter_data}")
-            raise ModbusReadError(inverter_data)
-
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            inverter_data.registers, byteorder=Endian.Big
-        )
-
-        decoded_ident = OrderedDict(
-            [
-                ("C_SunSpec_DID", decoder.decode_16bit_uint()),
-                ("C_SunSpec_Length", decoder.decode_16bit_uint()),
-            ]
-        )
-
-        for name, value in iteritems(decoded_ident):
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id}: "
-                    f"{name} {hex(value) if isinstance(value, int) else value}"
-                ),
+    def decode_modbus_data(
+        self, buffer: RegisterBuffer, groups: List[RegisterGroup]
+    ) -> None:
+        for group in groups:
+            record = group.map.decode(
+                buffer.get(self.model_address + group.offset, group.map.count)
             )
+            _log_decoded(f"Inverter {self.inverter_unit_id}", record)
+            self.decoded_model.update(record.items())
 
         if (
-            decoded_ident["C_SunSpec_DID"] == SunSpecNotImpl.UINT16
-            or decoded_ident["C_SunSpec_DID"] not in [101, 102, 103]
-            or decoded_ident["C_SunSpec_Length"] != 50
+            self.decoded_model["C_SunSpec_DID"] == SunSpecNotImpl.UINT16
+            or self.decoded_model["C_SunSpec_DID"] not in [101, 102, 103]
+            or self.decoded_model["C_SunSpec_Length"] != 50
         ):
             raise DeviceInvalid(f"Inverter {self.inverter_unit_id} not usable.")
 
-        inverter_data = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id, address=40071, count=38
-        )
-        if inverter_data.isError():
-            _LOGGER.debug(f"Inverter {self.inverter_unit_id}: {inverter_data}")
-            raise ModbusReadError(inverter_data)
-
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            inverter_data.registers, byteorder=Endian.Big
-        )
+        self.snapshot = inverter_snapshot(self.decoded_model, self._accum, self.phases)
 
-        self.decoded_model = OrderedDict(
-            [
-                ("C_SunSpec_DID", decoded_ident["C_SunSpec_DID"]),
-                ("AC_Current", decoder.decode_16bit_uint()),
-                ("AC_Current_A", decoder.decode_16bit_uint()),
-                ("AC_Current_B", decoder.decode_16bit_uint()),
-                ("AC_Current_C", decoder.decode_16bit_uint()),
-                ("AC_Current_SF", decoder.decode_16bit_int()),
-                ("AC_Voltage_AB", decoder.decode_16bit_uint()),
-                ("AC_Voltage_BC", decoder.decode_16bit_uint()),
-                ("AC_Voltage_CA", decoder.decode_16bit_uint()),
-                ("AC_Voltage_AN", decoder.decode_16bit_uint()),
-                ("AC_Voltage_BN", decoder.decode_16bit_uint()),
-                ("AC_Voltage_CN", decoder.decode_16bit_uint()),
-                ("AC_Voltage_SF", decoder.decode_16bit_int()),
-                ("AC_Power", decoder.decode_16bit_int()),
-                ("AC_Power_SF", decoder.decode_16bit_int()),
-                ("AC_Frequency", decoder.decode_16bit_uint()),
-                ("AC_Frequency_SF", decoder.decode_16bit_int()),
-                ("AC_VA", decoder.decode_16bit_int()),
-                ("AC_VA_SF", decoder.decode_16bit_int()),
-                ("AC_var", decoder.decode_16bit_int()),
-                ("AC_var_SF", decoder.decode_16bit_int()),
-                ("AC_PF", decoder.decode_16bit_int()),
-                ("AC_PF_SF", decoder.decode_16bit_int()),
-                ("AC_Energy_WH", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_SF", decoder.decode_16bit_uint()),
-                ("I_DC_Current", decoder.decode_16bit_uint()),
-                ("I_DC_Current_SF", decoder.decode_16bit_int()),
-                ("I_DC_Voltage", decoder.decode_16bit_uint()),
-                ("I_DC_Voltage_SF", decoder.decode_16bit_int()),
-                ("I_DC_Power", decoder.decode_16bit_int()),
-                ("I_DC_Power_SF", decoder.decode_16bit_int()),
-                ("I_Temp_Cab", decoder.decode_16bit_int()),
-                ("I_Temp_Sink", decoder.decode_16bit_int()),
-                ("I_Temp_Trns", decoder.decode_16bit_int()),
-                ("I_Temp_Other", decoder.decode_16bit_int()),
-                ("I_Temp_SF", decoder.decode_16bit_int()),
-                ("I_Status", decoder.decode_16bit_int()),
-                ("I_Status_Vendor", decoder.decode_16bit_int()),
-            ]
-        )
+    @property
+    def online(self) -> bool:
+        """Device is online and has been decoded."""
+        return self.hub.online and self.failures == 0 and bool(self.snapshot)
 
-        for name, value in iteritems(self.decoded_model):
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id}: "
-                    f"{name} {hex(value) if isinstance(value, int) else value}"
-                ),
-            )
+    @property
+    def phases(self) -> Optional[FrozenSet[str]]:
+        """Phases and lines the device has, None if it has all of them."""
+        return SUNSPEC_PHASES.get(self.decoded_model.get("C_SunSpec_DID"))
 
     @property
-    def online(self) -> bool:
-        """Device is online."""
-        return self.hub.online
+    def poll_intervals(self) -> Dict[str, int]:
+        return self.hub.poll_intervals(self)
 
     @property
     def device_info(self) -> Optional[Dict[str, Any]]:
@@ -674,7 +1251,13 @@ class SolarEdgeMeter:
         self.inverter_unit_id = device_id
         self.hub = hub
         self.decoded_common = []
-        self.decoded_model = []
+        self.decoded_model = {}
+        self.last_read = {}
+        self.snapshot = {}
+        self._accum = Accumulators()
+        self.stats = PollStats()
+        self.failures = 0
+        self.retry_at = 0.0
         self.start_address = 40000
         self.meter_id = meter_id
         self.has_parent = True
@@ -702,9 +1285,18 @@ class SolarEdgeMeter:
                     f"Invalid mmppt_Units value {self.mmppt_common['mmppt_Units']}"
                 )
 
-    def init_device(self) -> None:
-        meter_info = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id, address=self.start_address, count=2
+        self.model_address = self.start_address + 67
+        self.model_map = METER_MODEL
+        self.register_groups = METER_GROUPS
+        self.required_fields = {"C_SunSpec_DID", "C_SunSpec_Length"}
+        self.needed_groups = None
+        self.sleep_groups = set()
+
+    async def init_device(self) -> None:
+        meter_info = await self.hub.async_read_holding_registers(
+            unit=self.inverter_unit_id,
+            address=self.start_address,
+            count=MODEL_IDENT.count,
         )
         if meter_info.isError():
             _LOGGER.debug(
@@ -720,23 +1312,11 @@ class SolarEdgeMeter:
             else:
                 raise ModbusReadError(meter_info)
 
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            meter_info.registers, byteorder=Endian.Big
-        )
-        decoded_ident = OrderedDict(
-            [
-                ("C_SunSpec_DID", decoder.decode_16bit_uint()),
-                ("C_SunSpec_Length", decoder.decode_16bit_uint()),
-            ]
-        )
+        decoded_ident = MODEL_IDENT.decode(meter_info.registers)
 
-        for name, value in iteritems(decoded_ident):
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id} meter {self.meter_id}: "
-                    f"{name} {hex(value) if isinstance(value, int) else value}"
-                ),
-            )
+        _log_decoded(
+            f"Inverter {self.inverter_unit_id} meter {self.meter_id}", decoded_ident
+        )
 
         if (
             decoded_ident["C_SunSpec_DID"] == SunSpecNotImpl.UINT16
@@ -745,42 +1325,21 @@ class SolarEdgeMeter:
         ):
             raise DeviceInvalid("Meter {self.meter_id} not usable.")
 
-        meter_info = self.hub.read_holding_registers(
+        meter_info = await self.hub.async_read_holding_registers(
             unit=self.inverter_unit_id,
             address=self.start_address + 2,
-            count=65,
+            count=COMMON_MODEL.count,
         )
         if meter_info.isError():
             _LOGGER.debug(meter_info)
             raise ModbusReadError(meter_info)
 
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            meter_info.registers, byteorder=Endian.Big
-        )
-        self.decoded_common = OrderedDict(
-            [
-                (
-                    "C_Manufacturer",
-                    parse_modbus_string(decoder.decode_string(32)),
-                ),
-                ("C_Model", parse_modbus_string(decoder.decode_string(32))),
-                ("C_Option", parse_modbus_string(decoder.decode_string(16))),
-                ("C_Version", parse_modbus_string(decoder.decode_string(16))),
-                (
-                    "C_SerialNumber",
-                    parse_modbus_string(decoder.decode_string(32)),
-                ),
-                ("C_Device_address", decoder.decode_16bit_uint()),
-            ]
-        )
+        self.decoded_common = COMMON_MODEL.decode(meter_info.registers)
 
-        for name, value in iteritems(self.decoded_common):
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id} meter {self.meter_id}: "
-                    f"{name} {hex(value) if isinstance(value, int) else value}"
-                ),
-            )
+        _log_decoded(
+            f"Inverter {self.inverter_unit_id} meter {self.meter_id}",
+            self.decoded_common,
+        )
 
         self.manufacturer = self.decoded_common["C_Manufacturer"]
         self.model = self.decoded_common["C_Model"]
@@ -803,152 +1362,42 @@ class SolarEdgeMeter:
             "hw_version": self.option,
         }
 
-    def read_modbus_data(self) -> None:
-        meter_data = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id,
-            address=self.start_address + 67,
-            count=2,
-        )
-        if meter_data.isError():
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id} "
-                    f"meter {self.meter_id}: {meter_data}"
-                ),
+    def decode_modbus_data(
+        self, buffer: RegisterBuffer, groups: List[RegisterGroup]
+    ) -> None:
+        for group in groups:
+            record = group.map.decode(
+                buffer.get(self.model_address + group.offset, group.map.count)
             )
-            raise ModbusReadError(f"Meter read error: {meter_data}")
-
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            meter_data.registers, byteorder=Endian.Big
-        )
-
-        decoded_ident = OrderedDict(
-            [
-                ("C_SunSpec_DID", decoder.decode_16bit_uint()),
-                ("C_SunSpec_Length", decoder.decode_16bit_uint()),
-            ]
-        )
-
-        for name, value in iteritems(decoded_ident):
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id} meter {self.meter_id}: "
-                    f"{name} {hex(value) if isinstance(value, int) else value}"
-                ),
+            _log_decoded(
+                f"Inverter {self.inverter_unit_id} meter {self.meter_id}", record
             )
+            self.decoded_model.update(record.items())
 
         if (
-            decoded_ident["C_SunSpec_DID"] == SunSpecNotImpl.UINT16
-            or decoded_ident["C_SunSpec_DID"] not in [201, 202, 203, 204]
-            or decoded_ident["C_SunSpec_Length"] != 105
+            self.decoded_model["C_SunSpec_DID"] == SunSpecNotImpl.UINT16
+            or self.decoded_model["C_SunSpec_DID"] not in [201, 202, 203, 204]
+            or self.decoded_model["C_SunSpec_Length"] != 105
         ):
             raise DeviceInvalid(
                 f"Meter on inverter {self.inverter_unit_id} not usable."
             )
 
-        meter_data = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id,
-            address=self.start_address + 69,
-            count=105,
-        )
-        if meter_data.isError():
-            _LOGGER.error(f"Meter read error: {meter_data}")
-            raise ModbusReadError(f"Meter read error: {meter_data}")
+        self.snapshot = meter_snapshot(self.decoded_model, self._accum, self.phases)
 
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            meter_data.registers, byteorder=Endian.Big
-        )
-
-        self.decoded_model = OrderedDict(
-            [
-                ("C_SunSpec_DID", decoded_ident["C_SunSpec_DID"]),
-                ("AC_Current", decoder.decode_16bit_int()),
-                ("AC_Current_A", decoder.decode_16bit_int()),
-                ("AC_Current_B", decoder.decode_16bit_int()),
-                ("AC_Current_C", decoder.decode_16bit_int()),
-                ("AC_Current_SF", decoder.decode_16bit_int()),
-                ("AC_Voltage_LN", decoder.decode_16bit_int()),
-                ("AC_Voltage_AN", decoder.decode_16bit_int()),
-                ("AC_Voltage_BN", decoder.decode_16bit_int()),
-                ("AC_Voltage_CN", decoder.decode_16bit_int()),
-                ("AC_Voltage_LL", decoder.decode_16bit_int()),
-                ("AC_Voltage_AB", decoder.decode_16bit_int()),
-                ("AC_Voltage_BC", decoder.decode_16bit_int()),
-                ("AC_Voltage_CA", decoder.decode_16bit_int()),
-                ("AC_Voltage_SF", decoder.decode_16bit_int()),
-                ("AC_Frequency", decoder.decode_16bit_int()),
-                ("AC_Frequency_SF", decoder.decode_16bit_int()),
-                ("AC_Power", decoder.decode_16bit_int()),
-                ("AC_Power_A", decoder.decode_16bit_int()),
-                ("AC_Power_B", decoder.decode_16bit_int()),
-                ("AC_Power_C", decoder.decode_16bit_int()),
-                ("AC_Power_SF", decoder.decode_16bit_int()),
-                ("AC_VA", decoder.decode_16bit_int()),
-                ("AC_VA_A", decoder.decode_16bit_int()),
-                ("AC_VA_B", decoder.decode_16bit_int()),
-                ("AC_VA_C", decoder.decode_16bit_int()),
-                ("AC_VA_SF", decoder.decode_16bit_int()),
-                ("AC_var", decoder.decode_16bit_int()),
-                ("AC_var_A", decoder.decode_16bit_int()),
-                ("AC_var_B", decoder.decode_16bit_int()),
-                ("AC_var_C", decoder.decode_16bit_int()),
-                ("AC_var_SF", decoder.decode_16bit_int()),
-                ("AC_PF", decoder.decode_16bit_int()),
-                ("AC_PF_A", decoder.decode_16bit_int()),
-                ("AC_PF_B", decoder.decode_16bit_int()),
-                ("AC_PF_C", decoder.decode_16bit_int()),
-                ("AC_PF_SF", decoder.decode_16bit_int()),
-                ("AC_Energy_WH_Exported", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_Exported_A", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_Exported_B", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_Exported_C", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_Imported", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_Imported_A", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_Imported_B", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_Imported_C", decoder.decode_32bit_uint()),
-                ("AC_Energy_WH_SF", decoder.decode_16bit_int()),
-                ("M_VAh_Exported", decoder.decode_32bit_uint()),
-                ("M_VAh_Exported_A", decoder.decode_32bit_uint()),
-                ("M_VAh_Exported_B", decoder.decode_32bit_uint()),
-                ("M_VAh_Exported_C", decoder.decode_32bit_uint()),
-                ("M_VAh_Imported", decoder.decode_32bit_uint()),
-                ("M_VAh_Imported_A", decoder.decode_32bit_uint()),
-                ("M_VAh_Imported_B", decoder.decode_32bit_uint()),
-                ("M_VAh_Imported_C", decoder.decode_32bit_uint()),
-                ("M_VAh_SF", decoder.decode_16bit_int()),
-                ("M_varh_Import_Q1", decoder.decode_32bit_uint()),
-                ("M_varh_Import_Q1_A", decoder.decode_32bit_uint()),
-                ("M_varh_Import_Q1_B", decoder.decode_32bit_uint()),
-                ("M_varh_Import_Q1_C", decoder.decode_32bit_uint()),
-                ("M_varh_Import_Q2", decoder.decode_32bit_uint()),
-                ("M_varh_Import_Q2_A", decoder.decode_32bit_uint()),
-                ("M_varh_Import_Q2_B", decoder.decode_32bit_uint()),
-                ("M_varh_Import_Q2_C", decoder.decode_32bit_uint()),
-                ("M_varh_Export_Q3", decoder.decode_32bit_uint()),
-                ("M_varh_Export_Q3_A", decoder.decode_32bit_uint()),
-                ("M_varh_Export_Q3_B", decoder.decode_32bit_uint()),
-                ("M_varh_Export_Q3_C", decoder.decode_32bit_uint()),
-                ("M_varh_Export_Q4", decoder.decode_32bit_uint()),
-                ("M_varh_Export_Q4_A", decoder.decode_32bit_uint()),
-                ("M_varh_Export_Q4_B", decoder.decode_32bit_uint()),
-                ("M_varh_Export_Q4_C", decoder.decode_32bit_uint()),
-                ("M_varh_SF", decoder.decode_16bit_int()),
-                ("M_Events", decoder.decode_32bit_uint()),
-            ]
-        )
+    @property
+    def online(self) -> bool:
+        """Device is online and has been decoded."""
+        return self.hub.online and self.failures == 0 and bool(self.snapshot)
 
-        for name, value in iteritems(self.decoded_model):
-            _LOGGER.debug(
-                (
-                    f"Inverter {self.inverter_unit_id} meter {self.meter_id}: "
-                    f"{name} {hex(value) if isinstance(value, int) else value}"
-                ),
-            )
+    @property
+    def phases(self) -> Optional[FrozenSet[str]]:
+        """Phases and lines the device has, None if it has all of them."""
+        return SUNSPEC_PHASES.get(self.decoded_model.get("C_SunSpec_DID"))
 
     @property
-    def online(self) -> bool:
-        """Device is online."""
-        return self.hub.online
+    def poll_intervals(self) -> Dict[str, int]:
+        return self.hub.poll_intervals(self)
 
     @property
     def device_info(self) -> Optional[Dict[str, Any]]:
@@ -966,7 +1415,13 @@ class SolarEdgeBattery:
         self.inverter_unit_id = device_id
         self.hub = hub
         self.decoded_common = []
-        self.decoded_model = []
+        self.decoded_model = {}
+        self.last_read = {}
+        self.snapshot = {}
+        self._accum = Accumulators()
+        self.stats = PollStats()
+        self.failures = 0
+        self.retry_at = 0.0
         self.start_address = None
         self.battery_id = battery_id
         self.has_parent = True
@@ -979,9 +1434,18 @@ class SolarEdgeBattery:
         else:
             raise ValueError("Invalid battery_id {self.battery_id}")
 
-    def init_device(self) -> None:
-        battery_info = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id, address=self.start_address, count=76
+        self.model_address = self.start_address + 108
+        self.model_map = BATTERY_MODEL
+        self.register_groups = BATTERY_GROUPS
+        self.required_fields = {"B_Status"}
+        self.needed_groups = None
+        self.sleep_groups = set()
+
+    async def init_device(self) -> None:
+        battery_info = await self.hub.async_read_holding_registers(
+            unit=self.inverter_unit_id,
+            address=self.start_address,
+            count=BATTERY_COMMON.count,
         )
         if battery_info.isError():
             _LOGGER.debug(
@@ -997,61 +1461,22 @@ class SolarEdgeBattery:
             else:
                 raise ModbusReadError(battery_info)
 
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            battery_info.registers,
-            byteorder=Endian.Big,
-            wordorder=Endian.Little,
-        )
-        self.decoded_common = OrderedDict(
-            [
-                (
-                    "B_Manufacturer",
-                    parse_modbus_string(decoder.decode_string(32)),
-                ),
-                ("B_Model", parse_modbus_string(decoder.decode_string(32))),
-                ("B_Version", parse_modbus_string(decoder.decode_string(32))),
-                (
-                    "B_SerialNumber",
-                    parse_modbus_string(decoder.decode_string(32)),
-                ),
-                ("B_Device_Address", decoder.decode_16bit_uint()),
-                ("Reserved", decoder.decode_16bit_uint()),
-                ("B_RatedEnergy", decoder.decode_32bit_float()),
-                ("B_MaxChargePower", decoder.decode_32bit_float()),
-                ("B_MaxDischargePower", decoder.decode_32bit_float()),
-                ("B_MaxChargePeakPower", decoder.decode_32bit_float()),
-                ("B_MaxDischargePeakPower", decoder.decode_32bit_float()),
-            ]
-        )
-
-        for name, value in iteritems(self.decoded_common):
-            if isinstance(value, float):
-                _LOGGER.debug(
-                    (
-                        f"Inverter {self.inverter_unit_id} batt {self.battery_id}: "
-                        f"{name} {float_to_hex(value)}"
-                    ),
-                )
+        decoded_common = BATTERY_COMMON.decode(battery_info.registers)
 
-            else:
-                _LOGGER.debug(
-                    (
-                        f"Inverter {self.inverter_unit_id} batt {self.battery_id}: "
-                        f"{name} {hex(value) if isinstance(value, int) else value}"
-                    ),
-                )
-
-        self.decoded_common["B_Manufacturer"] = self.decoded_common[
-            "B_Manufacturer"
-        ].removesuffix(self.decoded_common["B_SerialNumber"])
-        self.decoded_common["B_Model"] = self.decoded_common["B_Model"].removesuffix(
-            self.decoded_common["B_SerialNumber"]
+        _log_decoded(
+            f"Inverter {self.inverter_unit_id} batt {self.battery_id}",
+            decoded_common,
         )
 
         ascii_ctrl_chars = dict.fromkeys(range(32))
-        self.decoded_common["B_Manufacturer"] = self.decoded_common[
-            "B_Manufacturer"
-        ].translate(ascii_ctrl_chars)
+        self.decoded_common = decoded_common._replace(
+            B_Manufacturer=decoded_common["B_Manufacturer"]
+            .removesuffix(decoded_common["B_SerialNumber"])
+            .translate(ascii_ctrl_chars),
+            B_Model=decoded_common["B_Model"].removesuffix(
+                decoded_common["B_SerialNumber"]
+            ),
+        )
 
         if (
             len(self.decoded_common["B_Manufacturer"]) == 0
@@ -1080,77 +1505,34 @@ class SolarEdgeBattery:
             "sw_version": self.fw_version,
         }
 
-    def read_modbus_data(self) -> None:
-        battery_data = self.hub.read_holding_registers(
-            unit=self.inverter_unit_id,
-            address=self.start_address + 108,
-            count=46,
-        )
-        if battery_data.isError():
-            _LOGGER.error(f"Battery read error: {battery_data}")
-            raise ModbusReadError(f"Battery read error: {battery_data}")
-
-        decoder = BinaryPayloadDecoder.fromRegisters(
-            battery_data.registers,
-            byteorder=Endian.Big,
-            wordorder=Endian.Little,
-        )
+    def decode_modbus_data(
+        self, buffer: RegisterBuffer, groups: List[RegisterGroup]
+    ) -> None:
+        for group in groups:
+            record = group.map.decode(
+                buffer.get(self.model_address + group.offset, group.map.count)
+            )
+            _log_decoded(
+                f"Inverter {self.inverter_unit_id} batt {self.battery_id}", record
+            )
+            self.decoded_model.update(record.items())
 
-        self.decoded_model = OrderedDict(
-            [
-                ("B_Temp_Average", decoder.decode_32bit_float()),
-                ("B_Temp_Max", decoder.decode_32bit_float()),
-                ("B_DC_Voltage", decoder.decode_32bit_float()),
-                ("B_DC_Current", decoder.decode_32bit_float()),
-                ("B_DC_Power", decoder.decode_32bit_float()),
-                ("B_Export_Energy_WH", decoder.decode_64bit_uint()),
-                ("B_Import_Energy_WH", decoder.decode_64bit_uint()),
-                ("B_Energy_Max", decoder.decode_32bit_float()),
-                ("B_Energy_Available", decoder.decode_32bit_float()),
-                ("B_SOH", decoder.decode_32bit_float()),
-                ("B_SOE", decoder.decode_32bit_float()),
-                ("B_Status", decoder.decode_32bit_uint()),
-                ("B_Status_Vendor", decoder.decode_32bit_uint()),
-                ("B_Event_Log1", decoder.decode_16bit_uint()),
-                ("B_Event_Log2", decoder.decode_16bit_uint()),
-                ("B_Event_Log3", decoder.decode_16bit_uint()),
-                ("B_Event_Log4", decoder.decode_16bit_uint()),
-                ("B_Event_Log5", decoder.decode_16bit_uint()),
-                ("B_Event_Log6", decoder.decode_16bit_uint()),
-                ("B_Event_Log7", decoder.decode_16bit_uint()),
-                ("B_Event_Log8", decoder.decode_16bit_uint()),
-                ("B_Event_Log_Vendor1", decoder.decode_16bit_uint()),
-                ("B_Event_Log_Vendor2", decoder.decode_16bit_uint()),
-                ("B_Event_Log_Vendor3", decoder.decode_16bit_uint()),
-                ("B_Event_Log_Vendor4", decoder.decode_16bit_uint()),
-                ("B_Event_Log_Vendor5", decoder.decode_16bit_uint()),
-                ("B_Event_Log_Vendor6", decoder.decode_16bit_uint()),
-                ("B_Event_Log_Vendor7", decoder.decode_16bit_uint()),
-                ("B_Event_Log_Vendor8", decoder.decode_16bit_uint()),
-            ]
+        self.snapshot = battery_snapshot(
+            self.decoded_model, self.decoded_common, self._accum
         )
 
-        for name, value in iteritems(self.decoded_model):
-            if isinstance(value, float):
-                _LOGGER.debug(
-                    (
-                        f"Inverter {self.inverter_unit_id} batt {self.battery_id}: "
-                        f"{name} {float_to_hex(value)}"
-                    ),
-                )
+    @property
+    def online(self) -> bool:
+        """Device is online and has been decoded."""
+        return self.hub.online and self.failures == 0 and bool(self.snapshot)
 
-            else:
-                _LOGGER.debug(
-                    (
-                        f"Inverter {self.inverter_unit_id} batt {self.battery_id}: "
-                        f"{name} {hex(value) if isinstance(value, int) else value}"
-                    ),
-                )
+    @property
+    def phases(self) -> Optional[FrozenSet[str]]:
+        return None
 
     @property
-    def online(self) -> bool:
-        """Device is online."""
-        return self.hub.online
+    def poll_intervals(self) -> Dict[str, int]:
+        return self.hub.poll_intervals(self)
 
     @property
     def device_info(self) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,111 @@
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .const import MODBUS_MAX_READ_REGISTERS
+
+
+def plan_reads(
+    ranges: Iterable[Tuple[int, int]],
+    max_count: int = MODBUS_MAX_READ_REGISTERS,
+    max_gap: int = 0,
+) -> List[Tuple[int, int]]:
+    """Merge register ranges into the fewest reads that fit in one request.
+
+    Ranges that overlap, touch, or are at most max_gap registers apart are
+    read together as long as the merged read stays within max_count.
+    Registers in a bridged gap are read but never decoded, so only allow a
+    gap where every register in between is known to be readable.
+    """
+    plan = []
+
+    for address, count in sorted(ranges):
+        while count > max_count:
+            plan.append((address, max_count))
+            address += max_count
+            count -= max_count
+
+        if plan:
+            last_address, last_count = plan[-1]
+            last_end = last_address + last_count
+            end = max(last_end, address + count)
+
+            if address - last_end <= max_gap and end - last_address <= max_count:
+                plan[-1] = (last_address, end - last_address)
+                continue
+
+        plan.append((address, count))
+
+    return plan
+
+
+def format_plan(plan: List[Tuple[int, int]]) -> str:
+    """Describe planned reads for debug logging."""
+    return ", ".join(f"{address}+{count}" for address, count in plan)
+
+
+class RegisterBuffer:
+    """Registers read for one unit ID, shared by all devices on that unit."""
+
+    def __init__(self) -> None:
+        self._blocks = []
+
+    def add(self, address: int, registers: List[int]) -> None:
+        self._blocks.append((address, registers))
+
+    def get(self, address: int, count: int) -> List[int]:
+        """Return count registers starting at address.
+
+        A range plan_reads split into several reads is joined from the
+        adjacent blocks.
+        """
+        registers = []
+
+        while len(registers) < count:
+            start = address + len(registers)
+
+            for block_address, block in self._blocks:
+                offset = start - block_address
+
+                if 0 <= offset < len(block):
+                    registers.extend(block[offset : offset + count - len(registers)])
+                    break
+
+            else:
+                raise KeyError(f"Registers {address}+{count} were not read")
+
+        return registers
+
+
+class RegisterCache:
+    """Latest value of every register read from each unit and when it was read."""
+
+    def __init__(self) -> None:
+        self._units: Dict[int, Dict[int, Tuple[int, float]]] = {}
+
+    def update(self, unit: int, address: int, registers: List[int]) -> None:
+        now = time.monotonic()
+        values = self._units.setdefault(unit, {})
+
+        for offset, value in enumerate(registers):
+            values[address + offset] = (value, now)
+
+    def get(
+        self, unit: int, address: int, count: int, max_age: float
+    ) -> Optional[List[int]]:
+        """Return count registers read at most max_age seconds ago, else None."""
+        values = self._units.get(unit)
+        if values is None:
+            return None
+
+        oldest = time.monotonic() - max_age
+        registers = []
+
+        for register in range(address, address + count):
+            cached = values.get(register)
+
+            if cached is None or cached[1] < oldest:
+                return None
+
+            registers.append(cached[0])
+
+        return registers
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import struct
+from typing import AsyncContextManager, Callable, Dict, Optional, Set, Tuple
+
+from pymodbus.exceptions import ConnectionException
+from pymodbus.pdu import ExceptionResponse, ModbusExceptions
+
+from .connection import ModbusConnection
+from .const import MODBUS_MAX_READ_REGISTERS
+from .planner import RegisterCache
+from .transport import MBAP_HEADER
+
+_LOGGER = logging.getLogger(__name__)
+
+READ_HOLDING_REGISTERS = 3
+
+# function code, address and count
+READ_REQUEST = struct.Struct(">BHH")
+
+
+def exception_pdu(function_code: int, exception_code: int) -> bytes:
+    return struct.pack(">BB", function_code | 0x80, exception_code)
+
+
+def registers_pdu(registers) -> bytes:
+    return struct.pack(
+        f">BB{len(registers)}H",
+        READ_HOLDING_REGISTERS,
+        2 * len(registers),
+        *registers,
+    )
+
+
+class ModbusProxy:
+    """Modbus/TCP server sharing the hub connection with other clients.
+
+    Holding register reads are answered from the registers the hub read at
+    most max_age seconds ago. Other reads go to the inverter over the hub
+    connection once they hold its host slot, so they queue behind the polls
+    of the hub, and identical reads waiting at the same time are sent once.
+    The proxy never opens the connection itself, reads while it is closed
+    are answered with GatewayPathUnavailable. Other function codes are
+    answered with an IllegalFunction exception.
+    """
+
+    def __init__(
+        self,
+        connection: ModbusConnection,
+        host_slot: Callable[[], AsyncContextManager],
+        address: str,
+        port: int,
+        max_age: float,
+    ) -> None:
+        self._connection = connection
+        self._host_slot = host_slot
+        self._address = address
+        self._port = port
+        self._max_age = max_age
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._upstream: Dict[Tuple[int, int, int], asyncio.Task] = {}
+        self.clients: Set["ModbusProxyProtocol"] = set()
+        self.cache = RegisterCache()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def async_start(self) -> None:
+        """Listen for clients on the configured address."""
+        self._connection.cache = self.cache
+        self._server = await asyncio.get_running_loop().create_server(
+            lambda: ModbusProxyProtocol(self), host=self._address, port=self._port
+        )
+        _LOGGER.debug(
+            f"Modbus/TCP proxy listening on {self._address}:{self._port}, "
+            f"max_age={self._max_age}"
+        )
+
+    async def async_stop(self) -> None:
+        """Stop listening and disconnect clients."""
+        self._connection.cache = None
+
+        if self._server is None:
+            return
+
+        self._server.close()
+
+        for client in list(self.clients):
+            client.close()
+
+        await self._server.wait_closed()
+        self._server = None
+
+    async def async_answer(self, unit: int, pdu: bytes) -> bytes:
+        """Response PDU to a request PDU."""
+        function_code = pdu[0] if pdu else 0
+
+        if function_code != READ_HOLDING_REGISTERS:
+            return exception_pdu(function_code, ModbusExceptions.IllegalFunction)
+
+        if len(pdu) != READ_REQUEST.size:
+            return exception_pdu(function_code, ModbusExceptions.IllegalValue)
+
+        _, address, count = READ_REQUEST.unpack(pdu)
+
+        if not 1 <= count <= MODBUS_MAX_READ_REGISTERS:
+            return exception_pdu(function_code, ModbusExceptions.IllegalValue)
+
+        registers = self.cache.get(unit, address, count, self._max_age)
+        if registers is not None:
+            self.hits += 1
+            return registers_pdu(registers)
+
+        self.misses += 1
+
+        try:
+            result = await self._async_read_upstream(unit, address, count)
+
+        except ConnectionException as e:
+            _LOGGER.debug(f"Proxy read {unit}:{address}+{count} failed: {e}")
+            self.errors += 1
+            return exception_pdu(function_code, ModbusExceptions.GatewayPathUnavailable)
+
+        if isinstance(result, ExceptionResponse):
+            return exception_pdu(function_code, result.exception_code)
+
+        if result.isError():
+            _LOGGER.debug(f"Proxy read {unit}:{address}+{count} failed: {result}")
+            self.errors += 1
+            return exception_pdu(function_code, ModbusExceptions.GatewayNoResponse)
+
+        return registers_pdu(result.registers)
+
+    async def _async_read_upstream(self, unit: int, address: int, count: int):
+        key = (unit, address, count)
+        task = self._upstream.get(key)
+
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._async_read_connection(unit, address, count)
+            )
+            task.add_done_callback(lambda _: self._upstream.pop(key, None))
+            self._upstream[key] = task
+
+        return await asyncio.shield(task)
+
+    async def _async_read_connection(self, unit: int, address: int, count: int):
+        async with self._host_slot():
+            if not self._connection.is_open():
+                raise ConnectionException("Hub connection is closed")
+
+            # a failed proxy read must not hold off the polls of the hub
+            return await self._connection.async_read_holding_registers(
+                unit, address, count, backoff=False
+            )
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "address": self._address,
+            "port": self._port,
+            "max_age": self._max_age,
+            "clients": len(self.clients),
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+
+
+class ModbusProxyProtocol(asyncio.Protocol):
+    """One client connection of the proxy."""
+
+    def __init__(self, proxy: ModbusProxy) -> None:
+        self._proxy = proxy
+        self._transport = None
+        self._buffer = bytearray()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def connection_made(self, transport) -> None:
+        self._transport = transport
+        self._proxy.clients.add(self)
+        _LOGGER.debug(f"Proxy client {transport.get_extra_info('peername')}")
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._transport = None
+        self._proxy.clients.discard(self)
+
+        for task in self._tasks:
+            task.cancel()
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer.extend(data)
+
+        while len(self._buffer) >= MBAP_HEADER.size:
+            tid, protocol, length, unit = MBAP_HEADER.unpack_from(self._buffer)
+
+            if protocol != 0 or length < 2:
+                _LOGGER.debug("Proxy client sent an invalid frame, closing")
+                self.close()
+                return
+
+            frame_end = 6 + length
+            if len(self._buffer) < frame_end:
+                break
+
+            pdu = bytes(self._buffer[MBAP_HEADER.size : frame_end])
+            del self._buffer[:frame_end]
+
+            task = asyncio.get_running_loop().create_task(
+                self._async_respond(tid, unit, pdu)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _async_respond(self, tid: int, unit: int, pdu: bytes) -> None:
+        response = await self._proxy.async_answer(unit, pdu)
+
+        if self._transport is not None:
+            self._transport.write(
+                MBAP_HEADER.pack(tid, 0, len(response) + 1, unit) + response
+            )
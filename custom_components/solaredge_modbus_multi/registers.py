@@ -0,0 +1,417 @@
+import struct
+from collections import namedtuple
+from typing import List, NamedTuple, Sequence, Tuple
+
+from .const import TIER_FAST, TIER_SLOW
+from .helpers import parse_modbus_string
+
+# register field types and their struct format codes
+FIELD_FORMATS = {
+    "uint16": "H",
+    "int16": "h",
+    "uint32": "I",
+    "int32": "i",
+    "uint64": "Q",
+    "float32": "f",
+}
+
+
+class RegisterRecord(tuple):
+    """Decoded register block, indexable by field name like a dict."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+
+        return tuple.__getitem__(self, key)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def items(self):
+        return zip(self._fields, self)
+
+
+class RegisterMap:
+    """Contiguous register block compiled into a single struct format.
+
+    Fields are (name, type) pairs where type is one of FIELD_FORMATS or
+    "stringN" for a string of N registers. With word_order "<" multi-register
+    values have their least significant word first, as in the battery blocks.
+    """
+
+    __slots__ = (
+        "name",
+        "fields",
+        "layout",
+        "word_order",
+        "count",
+        "record",
+        "_struct",
+        "_words",
+        "_strings",
+        "_swap_strings",
+    )
+
+    def __init__(
+        self, name: str, fields: Sequence[Tuple[str, str]], word_order: str = ">"
+    ) -> None:
+        self.name = name
+        self.fields = tuple(field for field, _ in fields)
+        self.layout = tuple(fields)
+        self.word_order = word_order
+
+        formats = []
+        self._strings = []
+
+        for index, (field, field_type) in enumerate(fields):
+            if field_type.startswith("string"):
+                formats.append(f"{int(field_type[6:]) * 2}s")
+                self._strings.append((index, int(field_type[6:]) * 2))
+            else:
+                formats.append(FIELD_FORMATS[field_type])
+
+        self._struct = struct.Struct(word_order + "".join(formats))
+        self.count = self._struct.size // 2
+        self._words = struct.Struct(f"{word_order}{self.count}H")
+        self._strings = tuple(self._strings)
+        self._swap_strings = word_order == "<"
+
+        self.record = type(
+            name,
+            (RegisterRecord, namedtuple(name, self.fields)),
+            {"__slots__": ()},
+        )
+
+    def decode(self, registers: List[int]) -> RegisterRecord:
+        """Decode registers with one struct unpack."""
+        values = self._struct.unpack(self._words.pack(*registers))
+
+        if self._strings:
+            values = list(values)
+
+            for index, _ in self._strings:
+                value = values[index]
+
+                if self._swap_strings:
+                    value = self._swap_bytes(value)
+
+                values[index] = parse_modbus_string(value)
+
+        return self.record._make(values)
+
+    def encode(self, values) -> List[int]:
+        """Encode field values, by name or in field order, to registers."""
+        if isinstance(values, dict):
+            values = [values[field] for field in self.fields]
+
+        values = list(values)
+
+        for index, size in self._strings:
+            value = values[index].encode().ljust(size, b"\x00")[:size]
+
+            if self._swap_strings:
+                value = self._swap_bytes(value)
+
+            values[index] = value
+
+        return list(self._words.unpack(self._struct.pack(*values)))
+
+    @staticmethod
+    def _swap_bytes(value: bytes) -> bytes:
+        # strings are stored big endian in every register
+        value = bytearray(value)
+        value[0::2], value[1::2] = value[1::2], value[0::2]
+        return bytes(value)
+
+    def split(
+        self, groups: Sequence[Tuple[str, str, str]]
+    ) -> Tuple["RegisterGroup", ...]:
+        """Split into groups given as (name, tier, first field), in field order.
+
+        Each group runs from its first field up to the next group's first field.
+        """
+        starts = [self.fields.index(first) for _, _, first in groups]
+        ends = starts[1:] + [len(self.fields)]
+        split = []
+        offset = 0
+
+        for (name, tier, _), start, end in zip(groups, starts, ends):
+            register_map = RegisterMap(
+                f"{self.name}{name.title()}",
+                self.layout[start:end],
+                self.word_order,
+            )
+            split.append(RegisterGroup(name, tier, offset, register_map))
+            offset += register_map.count
+
+        return tuple(split)
+
+
+class RegisterGroup(NamedTuple):
+    """Part of a model block polled at the rate of its tier."""
+
+    name: str
+    tier: str
+    offset: int
+    map: RegisterMap
+
+
+COMMON_IDENT = RegisterMap(
+    "CommonIdent",
+    [
+        ("C_SunSpec_ID", "uint32"),
+        ("C_SunSpec_DID", "uint16"),
+        ("C_SunSpec_Length", "uint16"),
+    ],
+)
+
+MODEL_IDENT = RegisterMap(
+    "ModelIdent",
+    [
+        ("C_SunSpec_DID", "uint16"),
+        ("C_SunSpec_Length", "uint16"),
+    ],
+)
+
+COMMON_MODEL = RegisterMap(
+    "CommonModel",
+    [
+        ("C_Manufacturer", "string16"),
+        ("C_Model", "string16"),
+        ("C_Option", "string8"),
+        ("C_Version", "string8"),
+        ("C_SerialNumber", "string16"),
+        ("C_Device_address", "uint16"),
+    ],
+)
+
+INVERTER_MODEL = RegisterMap(
+    "InverterModel",
+    [
+        ("C_SunSpec_DID", "uint16"),
+        ("C_SunSpec_Length", "uint16"),
+        ("AC_Current", "uint16"),
+        ("AC_Current_A", "uint16"),
+        ("AC_Current_B", "uint16"),
+        ("AC_Current_C", "uint16"),
+        ("AC_Current_SF", "int16"),
+        ("AC_Voltage_AB", "uint16"),
+        ("AC_Voltage_BC", "uint16"),
+        ("AC_Voltage_CA", "uint16"),
+        ("AC_Voltage_AN", "uint16"),
+        ("AC_Voltage_BN", "uint16"),
+        ("AC_Voltage_CN", "uint16"),
+        ("AC_Voltage_SF", "int16"),
+        ("AC_Power", "int16"),
+        ("AC_Power_SF", "int16"),
+        ("AC_Frequency", "uint16"),
+        ("AC_Frequency_SF", "int16"),
+        ("AC_VA", "int16"),
+        ("AC_VA_SF", "int16"),
+        ("AC_var", "int16"),
+        ("AC_var_SF", "int16"),
+        ("AC_PF", "int16"),
+        ("AC_PF_SF", "int16"),
+        ("AC_Energy_WH", "uint32"),
+        ("AC_Energy_WH_SF", "uint16"),
+        ("I_DC_Current", "uint16"),
+        ("I_DC_Current_SF", "int16"),
+        ("I_DC_Voltage", "uint16"),
+        ("I_DC_Voltage_SF", "int16"),
+        ("I_DC_Power", "int16"),
+        ("I_DC_Power_SF", "int16"),
+        ("I_Temp_Cab", "int16"),
+        ("I_Temp_Sink", "int16"),
+        ("I_Temp_Trns", "int16"),
+        ("I_Temp_Other", "int16"),
+        ("I_Temp_SF", "int16"),
+        ("I_Status", "int16"),
+        ("I_Status_Vendor", "int16"),
+    ],
+)
+
+INVERTER_GROUPS = INVERTER_MODEL.split(
+    [
+        ("ac", TIER_FAST, "C_SunSpec_DID"),
+        ("energy", TIER_SLOW, "AC_Energy_WH"),
+        ("dc", TIER_FAST, "I_DC_Current"),
+        ("temperature", TIER_SLOW, "I_Temp_Cab"),
+        ("status", TIER_FAST, "I_Status"),
+    ]
+)
+
+MMPPT_COMMON = RegisterMap(
+    "MMPPTCommon",
+    [
+        ("mmppt_DID", "uint16"),
+        ("mmppt_Length", "uint16"),
+        ("mmppt_DCA_SF", "int16"),
+        ("mmppt_DCV_SF", "int16"),
+        ("mmppt_DCW_SF", "int16"),
+        ("mmppt_DCWH_SF", "int16"),
+        ("mmppt_Events", "uint32"),
+        ("mmppt_Units", "uint16"),
+        ("mmppt_TmsPer", "uint16"),
+    ],
+)
+
+METER_MODEL = RegisterMap(
+    "MeterModel",
+    [
+        ("C_SunSpec_DID", "uint16"),
+        ("C_SunSpec_Length", "uint16"),
+        ("AC_Current", "int16"),
+        ("AC_Current_A", "int16"),
+        ("AC_Current_B", "int16"),
+        ("AC_Current_C", "int16"),
+        ("AC_Current_SF", "int16"),
+        ("AC_Voltage_LN", "int16"),
+        ("AC_Voltage_AN", "int16"),
+        ("AC_Voltage_BN", "int16"),
+        ("AC_Voltage_CN", "int16"),
+        ("AC_Voltage_LL", "int16"),
+        ("AC_Voltage_AB", "int16"),
+        ("AC_Voltage_BC", "int16"),
+        ("AC_Voltage_CA", "int16"),
+        ("AC_Voltage_SF", "int16"),
+        ("AC_Frequency", "int16"),
+        ("AC_Frequency_SF", "int16"),
+        ("AC_Power", "int16"),
+        ("AC_Power_A", "int16"),
+        ("AC_Power_B", "int16"),
+        ("AC_Power_C", "int16"),
+        ("AC_Power_SF", "int16"),
+        ("AC_VA", "int16"),
+        ("AC_VA_A", "int16"),
+        ("AC_VA_B", "int16"),
+        ("AC_VA_C", "int16"),
+        ("AC_VA_SF", "int16"),
+        ("AC_var", "int16"),
+        ("AC_var_A", "int16"),
+        ("AC_var_B", "int16"),
+        ("AC_var_C", "int16"),
+        ("AC_var_SF", "int16"),
+        ("AC_PF", "int16"),
+        ("AC_PF_A", "int16"),
+        ("AC_PF_B", "int16"),
+        ("AC_PF_C", "int16"),
+        ("AC_PF_SF", "int16"),
+        ("AC_Energy_WH_Exported", "uint32"),
+        ("AC_Energy_WH_Exported_A", "uint32"),
+        ("AC_Energy_WH_Exported_B", "uint32"),
+        ("AC_Energy_WH_Exported_C", "uint32"),
+        ("AC_Energy_WH_Imported", "uint32"),
+        ("AC_Energy_WH_Imported_A", "uint32"),
+        ("AC_Energy_WH_Imported_B", "uint32"),
+        ("AC_Energy_WH_Imported_C", "uint32"),
+        ("AC_Energy_WH_SF", "int16"),
+        ("M_VAh_Exported", "uint32"),
+        ("M_VAh_Exported_A", "uint32"),
+        ("M_VAh_Exported_B", "uint32"),
+        ("M_VAh_Exported_C", "uint32"),
+        ("M_VAh_Imported", "uint32"),
+        ("M_VAh_Imported_A", "uint32"),
+        ("M_VAh_Imported_B", "uint32"),
+        ("M_VAh_Imported_C", "uint32"),
+        ("M_VAh_SF", "int16"),
+        ("M_varh_Import_Q1", "uint32"),
+        ("M_varh_Import_Q1_A", "uint32"),
+        ("M_varh_Import_Q1_B", "uint32"),
+        ("M_varh_Import_Q1_C", "uint32"),
+        ("M_varh_Import_Q2", "uint32"),
+        ("M_varh_Import_Q2_A", "uint32"),
+        ("M_varh_Import_Q2_B", "uint32"),
+        ("M_varh_Import_Q2_C", "uint32"),
+        ("M_varh_Export_Q3", "uint32"),
+        ("M_varh_Export_Q3_A", "uint32"),
+        ("M_varh_Export_Q3_B", "uint32"),
+        ("M_varh_Export_Q3_C", "uint32"),
+        ("M_varh_Export_Q4", "uint32"),
+        ("M_varh_Export_Q4_A", "uint32"),
+        ("M_varh_Export_Q4_B", "uint32"),
+        ("M_varh_Export_Q4_C", "uint32"),
+        ("M_varh_SF", "int16"),
+        ("M_Events", "uint32"),
+    ],
+)
+
+METER_GROUPS = METER_MODEL.split(
+    [
+        ("ac", TIER_FAST, "C_SunSpec_DID"),
+        ("energy", TIER_SLOW, "AC_Energy_WH_Exported"),
+        ("apparent_energy", TIER_SLOW, "M_VAh_Exported"),
+        ("reactive_energy", TIER_SLOW, "M_varh_Import_Q1"),
+        ("events", TIER_SLOW, "M_Events"),
+    ]
+)
+
+BATTERY_COMMON = RegisterMap(
+    "BatteryCommon",
+    [
+        ("B_Manufacturer", "string16"),
+        ("B_Model", "string16"),
+        ("B_Version", "string16"),
+        ("B_SerialNumber", "string16"),
+        ("B_Device_Address", "uint16"),
+        ("Reserved", "uint16"),
+        ("B_RatedEnergy", "float32"),
+        ("B_MaxChargePower", "float32"),
+        ("B_MaxDischargePower", "float32"),
+        ("B_MaxChargePeakPower", "float32"),
+        ("B_MaxDischargePeakPower", "float32"),
+    ],
+    word_order="<",
+)
+
+BATTERY_MODEL = RegisterMap(
+    "BatteryModel",
+    [
+        ("B_Temp_Average", "float32"),
+        ("B_Temp_Max", "float32"),
+        ("B_DC_Voltage", "float32"),
+        ("B_DC_Current", "float32"),
+        ("B_DC_Power", "float32"),
+        ("B_Export_Energy_WH", "uint64"),
+        ("B_Import_Energy_WH", "uint64"),
+        ("B_Energy_Max", "float32"),
+        ("B_Energy_Available", "float32"),
+        ("B_SOH", "float32"),
+        ("B_SOE", "float32"),
+        ("B_Status", "uint32"),
+        ("B_Status_Vendor", "uint32"),
+        ("B_Event_Log1", "uint16"),
+        ("B_Event_Log2", "uint16"),
+        ("B_Event_Log3", "uint16"),
+        ("B_Event_Log4", "uint16"),
+        ("B_Event_Log5", "uint16"),
+        ("B_Event_Log6", "uint16"),
+        ("B_Event_Log7", "uint16"),
+        ("B_Event_Log8", "uint16"),
+        ("B_Event_Log_Vendor1", "uint16"),
+        ("B_Event_Log_Vendor2", "uint16"),
+        ("B_Event_Log_Vendor3", "uint16"),
+        ("B_Event_Log_Vendor4", "uint16"),
+        ("B_Event_Log_Vendor5", "uint16"),
+        ("B_Event_Log_Vendor6", "uint16"),
+        ("B_Event_Log_Vendor7", "uint16"),
+        ("B_Event_Log_Vendor8", "uint16"),
+    ],
+    word_order="<",
+)
+
+BATTERY_GROUPS = BATTERY_MODEL.split(
+    [
+        ("temperature", TIER_SLOW, "B_Temp_Average"),
+        ("dc", TIER_FAST, "B_DC_Voltage"),
+        ("energy", TIER_SLOW, "B_Export_Energy_WH"),
+        ("soe", TIER_FAST, "B_Energy_Available"),
+        ("status", TIER_FAST, "B_Status"),
+        ("events", TIER_SLOW, "B_Event_Log1"),
+    ]
+)
@@ -1,9 +1,12 @@
 import logging
-import re
+from dataclasses import dataclass, replace
+from typing import FrozenSet, Iterable, Optional, Tuple
 
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -17,31 +20,385 @@ from homeassistant.const import (
     POWER_VOLT_AMPERE_REACTIVE,
     POWER_WATT,
     TEMP_CELSIUS,
+    TIME_MILLISECONDS,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     BATTERY_STATUS,
+    CONF_STATE_DEADBAND,
+    CONF_STATE_REFRESH_CYCLES,
+    DEFAULT_STATE_DEADBAND,
+    DEFAULT_STATE_REFRESH_CYCLES,
     DEVICE_STATUS,
     DEVICE_STATUS_DESC,
     DOMAIN,
     ENERGY_VOLT_AMPERE_HOUR,
     ENERGY_VOLT_AMPERE_REACTIVE_HOUR,
     METER_EVENTS,
+    STATE_DEADBANDS,
     SUNSPEC_DID,
-    SUNSPEC_SF_RANGE,
     VENDOR_STATUS,
-    BatteryLimit,
-    SunSpecAccum,
     SunSpecNotImpl,
 )
-from .helpers import float_to_hex, scale_factor, update_accum, watts_to_kilowatts
+from .helpers import float_to_hex
 
 _LOGGER = logging.getLogger(__name__)
 
+# DIDs of three phase inverters and meters, and of three phase wye meters
+THREE_PHASE_DIDS = frozenset({103, 203, 204})
+THREE_PHASE_METER_DIDS = frozenset({203, 204})
+
+
+@dataclass
+class SolarEdgeSensorRequiredKeysMixin:
+    """Snapshot field shown by a sensor."""
+
+    register_field: str
+
+
+@dataclass
+class SolarEdgeSensorEntityDescription(
+    SensorEntityDescription, SolarEdgeSensorRequiredKeysMixin
+):
+    """Describes a sensor showing one field of a device snapshot."""
+
+    enabled_dids: FrozenSet[int] = frozenset()
+    phase: Optional[str] = None
+
+
+def _per_phase(
+    description: SolarEdgeSensorEntityDescription, phases: Iterable[str], **changes
+) -> Tuple[SolarEdgeSensorEntityDescription, ...]:
+    """Copies of a description for each phase or line."""
+    return tuple(
+        replace(
+            description,
+            key=f"{description.key}_{phase.lower()}",
+            name=f"{description.name} {phase}",
+            register_field=f"{description.register_field}_{phase}",
+            phase=phase,
+            **changes,
+        )
+        for phase in phases
+    )
+
+
+def _counters(
+    description: SolarEdgeSensorEntityDescription, directions: Iterable[str], **changes
+) -> Tuple[SolarEdgeSensorEntityDescription, ...]:
+    """Copies of a meter counter for each direction, total and per phase.
+
+    changes apply to the B and C phase counters.
+    """
+    descriptions = []
+
+    for direction in directions:
+        if direction.lower().startswith("import"):
+            icon = "mdi:transmission-tower-export"
+        else:
+            icon = "mdi:transmission-tower-import"
+
+        for phase in ("", "_A", "_B", "_C"):
+            descriptions.append(
+                replace(
+                    description,
+                    key=f"{direction.lower()}{phase.lower()}_{description.key}",
+                    name=f"{direction}{phase} {description.name}".replace("_", " "),
+                    register_field=f"{description.register_field}_{direction}{phase}",
+                    icon=icon,
+                    phase=phase.lstrip("_") or None,
+                    **(changes if phase in ("_B", "_C") else {}),
+                )
+            )
+
+    return tuple(descriptions)
+
+
+AC_CURRENT = SolarEdgeSensorEntityDescription(
+    key="ac_current",
+    name="AC Current",
+    register_field="AC_Current",
+    device_class=SensorDeviceClass.CURRENT,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=ELECTRIC_CURRENT_AMPERE,
+)
+
+AC_VOLTAGE = SolarEdgeSensorEntityDescription(
+    key="ac_voltage",
+    name="AC Voltage",
+    register_field="AC_Voltage",
+    device_class=SensorDeviceClass.VOLTAGE,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
+)
+
+AC_POWER = SolarEdgeSensorEntityDescription(
+    key="ac_power",
+    name="AC Power",
+    register_field="AC_Power",
+    device_class=SensorDeviceClass.POWER,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=POWER_WATT,
+    icon="mdi:solar-power",
+)
+
+AC_FREQUENCY = SolarEdgeSensorEntityDescription(
+    key="ac_frequency",
+    name="AC Frequency",
+    register_field="AC_Frequency",
+    device_class=SensorDeviceClass.FREQUENCY,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=FREQUENCY_HERTZ,
+)
+
+AC_VA = SolarEdgeSensorEntityDescription(
+    key="ac_va",
+    name="AC VA",
+    register_field="AC_VA",
+    device_class=SensorDeviceClass.APPARENT_POWER,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=POWER_VOLT_AMPERE,
+    entity_registry_enabled_default=False,
+)
+
+AC_VAR = SolarEdgeSensorEntityDescription(
+    key="ac_var",
+    name="AC var",
+    register_field="AC_var",
+    device_class=SensorDeviceClass.REACTIVE_POWER,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=POWER_VOLT_AMPERE_REACTIVE,
+    entity_registry_enabled_default=False,
+)
+
+AC_PF = SolarEdgeSensorEntityDescription(
+    key="ac_pf",
+    name="AC PF",
+    register_field="AC_PF",
+    device_class=SensorDeviceClass.POWER_FACTOR,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=PERCENTAGE,
+    entity_registry_enabled_default=False,
+)
+
+METER_ENERGY = SolarEdgeSensorEntityDescription(
+    key="kwh",
+    name="kWh",
+    register_field="AC_Energy_WH",
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
+)
+
+METER_VAH = SolarEdgeSensorEntityDescription(
+    key="vah",
+    name="VAh",
+    register_field="M_VAh",
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    native_unit_of_measurement=ENERGY_VOLT_AMPERE_HOUR,
+    entity_registry_enabled_default=False,
+)
+
+METER_VARH = SolarEdgeSensorEntityDescription(
+    key="varh",
+    name="varh",
+    register_field="M_varh",
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.TOTAL_INCREASING,
+    native_unit_of_measurement=ENERGY_VOLT_AMPERE_REACTIVE_HOUR,
+    entity_registry_enabled_default=False,
+)
+
+DC_CURRENT = SolarEdgeSensorEntityDescription(
+    key="dc_current",
+    name="DC Current",
+    register_field="I_DC_Current",
+    device_class=SensorDeviceClass.CURRENT,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=ELECTRIC_CURRENT_AMPERE,
+    icon="mdi:current-dc",
+)
+
+DC_VOLTAGE = SolarEdgeSensorEntityDescription(
+    key="dc_voltage",
+    name="DC Voltage",
+    register_field="I_DC_Voltage",
+    device_class=SensorDeviceClass.VOLTAGE,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=ELECTRIC_POTENTIAL_VOLT,
+)
+
+DC_POWER = SolarEdgeSensorEntityDescription(
+    key="dc_power",
+    name="DC Power",
+    register_field="I_DC_Power",
+    device_class=SensorDeviceClass.POWER,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=POWER_WATT,
+    icon="mdi:solar-power",
+)
+
+TEMPERATURE = SolarEdgeSensorEntityDescription(
+    key="temp_sink",
+    name="Temp Sink",
+    register_field="I_Temp_Sink",
+    device_class=SensorDeviceClass.TEMPERATURE,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=TEMP_CELSIUS,
+)
+
+BATTERY_ENERGY = SolarEdgeSensorEntityDescription(
+    key="max_energy",
+    name="Maximum Energy",
+    register_field="B_Energy_Max",
+    device_class=SensorDeviceClass.ENERGY,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
+)
+
+INVERTER_SENSORS = (
+    AC_CURRENT,
+    *_per_phase(
+        AC_CURRENT,
+        ("A", "B", "C"),
+        entity_registry_enabled_default=False,
+        enabled_dids=THREE_PHASE_DIDS,
+    ),
+    *_per_phase(AC_VOLTAGE, ("AB",)),
+    *_per_phase(
+        AC_VOLTAGE,
+        ("BC", "CA", "AN", "BN", "CN"),
+        entity_registry_enabled_default=False,
+        enabled_dids=THREE_PHASE_DIDS,
+    ),
+    AC_POWER,
+    AC_FREQUENCY,
+    AC_VA,
+    AC_VAR,
+    AC_PF,
+    replace(
+        METER_ENERGY,
+        key="ac_energy_kwh",
+        name="AC Energy kWh",
+        register_field="AC_Energy_WH",
+    ),
+    DC_CURRENT,
+    DC_VOLTAGE,
+    DC_POWER,
+    TEMPERATURE,
+)
+
+METER_SENSORS = (
+    AC_CURRENT,
+    *_per_phase(
+        AC_CURRENT,
+        ("A", "B", "C"),
+        entity_registry_enabled_default=False,
+        enabled_dids=THREE_PHASE_DIDS,
+    ),
+    *_per_phase(AC_VOLTAGE, ("LN",)),
+    *_per_phase(
+        AC_VOLTAGE,
+        ("AN", "BN", "CN"),
+        entity_registry_enabled_default=False,
+        enabled_dids=THREE_PHASE_DIDS,
+    ),
+    *_per_phase(AC_VOLTAGE, ("LL", "AB")),
+    *_per_phase(
+        AC_VOLTAGE,
+        ("BC", "CA"),
+        entity_registry_enabled_default=False,
+        enabled_dids=THREE_PHASE_DIDS,
+    ),
+    AC_FREQUENCY,
+    AC_POWER,
+    *_per_phase(
+        AC_POWER,
+        ("A", "B", "C"),
+        entity_registry_enabled_default=False,
+        enabled_dids=THREE_PHASE_METER_DIDS,
+    ),
+    AC_VA,
+    *_per_phase(AC_VA, ("A", "B", "C")),
+    AC_VAR,
+    *_per_phase(AC_VAR, ("A", "B", "C")),
+    AC_PF,
+    *_per_phase(AC_PF, ("A", "B", "C")),
+    *_counters(
+        METER_ENERGY,
+        ("Exported", "Imported"),
+        entity_registry_enabled_default=False,
+        enabled_dids=THREE_PHASE_METER_DIDS,
+    ),
+    *_counters(METER_VAH, ("Exported", "Imported")),
+    *_counters(METER_VARH, ("Import_Q1", "Import_Q2", "Export_Q3", "Export_Q4")),
+)
+
+BATTERY_SENSORS = (
+    replace(
+        TEMPERATURE,
+        key="avg_temp",
+        name="Average Temperature",
+        register_field="B_Temp_Average",
+    ),
+    replace(
+        TEMPERATURE,
+        key="max_temp",
+        name="Max Temperature",
+        register_field="B_Temp_Max",
+        entity_registry_enabled_default=False,
+    ),
+    replace(DC_VOLTAGE, register_field="B_DC_Voltage"),
+    replace(DC_CURRENT, register_field="B_DC_Current"),
+    replace(DC_POWER, register_field="B_DC_Power", icon="mdi:lightning-bolt"),
+    replace(
+        BATTERY_ENERGY,
+        key="energy_export",
+        name="Energy Export",
+        register_field="B_Export_Energy_WH",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:battery-charging-20",
+    ),
+    replace(
+        BATTERY_ENERGY,
+        key="energy_import",
+        name="Energy Import",
+        register_field="B_Import_Energy_WH",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:battery-charging-100",
+    ),
+    BATTERY_ENERGY,
+    replace(
+        BATTERY_ENERGY,
+        key="avail_energy",
+        name="Available Energy",
+        register_field="B_Energy_Available",
+    ),
+    SolarEdgeSensorEntityDescription(
+        key="battery_soh",
+        name="State of Health",
+        register_field="B_SOH",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:battery-heart-outline",
+    ),
+    SolarEdgeSensorEntityDescription(
+        key="battery_soe",
+        name="State of Energy",
+        register_field="B_SOE",
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -65,28 +422,12 @@ async def async_setup_entry(
             entities.append(DeviceAddress(inverter, config_entry, coordinator))
             entities.append(SunspecDID(inverter, config_entry, coordinator))
         entities.append(Version(inverter, config_entry, coordinator))
+        entities.extend(poll_sensors(inverter, config_entry, coordinator))
         entities.append(Status(inverter, config_entry, coordinator))
         entities.append(StatusVendor(inverter, config_entry, coordinator))
-        entities.append(ACCurrentSensor(inverter, config_entry, coordinator))
-        entities.append(ACCurrentSensor(inverter, config_entry, coordinator, "A"))
-        entities.append(ACCurrentSensor(inverter, config_entry, coordinator, "B"))
-        entities.append(ACCurrentSensor(inverter, config_entry, coordinator, "C"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "AB"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "BC"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "CA"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "AN"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "BN"))
-        entities.append(VoltageSensor(inverter, config_entry, coordinator, "CN"))
-        entities.append(ACPower(inverter, config_entry, coordinator))
-        entities.append(ACFrequency(inverter, config_entry, coordinator))
-        entities.append(ACVoltAmp(inverter, config_entry, coordinator))
-        entities.append(ACVoltAmpReactive(inverter, config_entry, coordinator))
-        entities.append(ACPowerFactor(inverter, config_entry, coordinator))
-        entities.append(ACEnergy(inverter, config_entry, coordinator))
-        entities.append(DCCurrent(inverter, config_entry, coordinator))
-        entities.append(DCVoltage(inverter, config_entry, coordinator))
-        entities.append(DCPower(inverter, config_entry, coordinator))
-        entities.append(HeatSinkTemperature(inverter, config_entry, coordinator))
+        entities.extend(
+            snapshot_sensors(inverter, config_entry, coordinator, INVERTER_SENSORS)
+        )
 
     for meter in hub.meters:
         if meter.single_device_entity:
@@ -101,68 +442,11 @@ async def async_setup_entry(
             entities.append(DeviceAddressParent(meter, config_entry, coordinator))
             entities.append(SunspecDID(meter, config_entry, coordinator))
         entities.append(Version(meter, config_entry, coordinator))
+        entities.extend(poll_sensors(meter, config_entry, coordinator))
         entities.append(MeterEvents(meter, config_entry, coordinator))
-        entities.append(ACCurrentSensor(meter, config_entry, coordinator))
-        entities.append(ACCurrentSensor(meter, config_entry, coordinator, "A"))
-        entities.append(ACCurrentSensor(meter, config_entry, coordinator, "B"))
-        entities.append(ACCurrentSensor(meter, config_entry, coordinator, "C"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "LN"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "AN"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "BN"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "CN"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "LL"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "AB"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "BC"))
-        entities.append(VoltageSensor(meter, config_entry, coordinator, "CA"))
-        entities.append(ACFrequency(meter, config_entry, coordinator))
-        entities.append(ACPower(meter, config_entry, coordinator))
-        entities.append(ACPower(meter, config_entry, coordinator, "A"))
-        entities.append(ACPower(meter, config_entry, coordinator, "B"))
-        entities.append(ACPower(meter, config_entry, coordinator, "C"))
-        entities.append(ACVoltAmp(meter, config_entry, coordinator))
-        entities.append(ACVoltAmp(meter, config_entry, coordinator, "A"))
-        entities.append(ACVoltAmp(meter, config_entry, coordinator, "B"))
-        entities.append(ACVoltAmp(meter, config_entry, coordinator, "C"))
-        entities.append(ACVoltAmpReactive(meter, config_entry, coordinator))
-        entities.append(ACVoltAmpReactive(meter, config_entry, coordinator, "A"))
-        entities.append(ACVoltAmpReactive(meter, config_entry, coordinator, "B"))
-        entities.append(ACVoltAmpReactive(meter, config_entry, coordinator, "C"))
-        entities.append(ACPowerFactor(meter, config_entry, coordinator))
-        entities.append(ACPowerFactor(meter, config_entry, coordinator, "A"))
-        entities.append(ACPowerFactor(meter, config_entry, coordinator, "B"))
-        entities.append(ACPowerFactor(meter, config_entry, coordinator, "C"))
-        entities.append(ACEnergy(meter, config_entry, coordinator, "Exported"))
-        entities.append(ACEnergy(meter, config_entry, coordinator, "Exported_A"))
-        entities.append(ACEnergy(meter, config_entry, coordinator, "Exported_B"))
-        entities.append(ACEnergy(meter, config_entry, coordinator, "Exported_C"))
-        entities.append(ACEnergy(meter, config_entry, coordinator, "Imported"))
-        entities.append(ACEnergy(meter, config_entry, coordinator, "Imported_A"))
-        entities.append(ACEnergy(meter, config_entry, coordinator, "Imported_B"))
-        entities.append(ACEnergy(meter, config_entry, coordinator, "Imported_C"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Exported"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Exported_A"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Exported_B"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Exported_C"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Imported"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Imported_A"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Imported_B"))
-        entities.append(MeterVAhIE(meter, config_entry, coordinator, "Imported_C"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q1"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q1_A"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q1_B"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q1_C"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q2"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q2_A"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q2_B"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Import_Q2_C"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q3"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q3_A"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q3_B"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q3_C"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q4"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q4_A"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q4_B"))
-        entities.append(MetervarhIE(meter, config_entry, coordinator, "Export_Q4_C"))
+        entities.extend(
+            snapshot_sensors(meter, config_entry, coordinator, METER_SENSORS)
+        )
 
     for battery in hub.batteries:
         if battery.single_device_entity:
@@ -175,29 +459,92 @@ async def async_setup_entry(
             entities.append(DeviceAddress(battery, config_entry, coordinator))
             entities.append(DeviceAddressParent(battery, config_entry, coordinator))
         entities.append(Version(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryAvgTemp(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryMaxTemp(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryVoltage(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryCurrent(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatteryPower(battery, config_entry, coordinator))
-        entities.append(
-            SolarEdgeBatteryEnergyExport(battery, config_entry, coordinator)
-        )
-        entities.append(
-            SolarEdgeBatteryEnergyImport(battery, config_entry, coordinator)
+        entities.extend(poll_sensors(battery, config_entry, coordinator))
+        entities.extend(
+            snapshot_sensors(battery, config_entry, coordinator, BATTERY_SENSORS)
         )
-        entities.append(SolarEdgeBatteryMaxEnergy(battery, config_entry, coordinator))
-        entities.append(
-            SolarEdgeBatteryAvailableEnergy(battery, config_entry, coordinator)
-        )
-        entities.append(SolarEdgeBatterySOH(battery, config_entry, coordinator))
-        entities.append(SolarEdgeBatterySOE(battery, config_entry, coordinator))
         entities.append(SolarEdgeBatteryStatus(battery, config_entry, coordinator))
 
+    async_track_register_fields(hass, config_entry, hub, entities)
+
     if entities:
         async_add_entities(entities)
 
 
+def snapshot_sensors(platform, config_entry, coordinator, descriptions) -> list:
+    """Sensors of the described fields, leaving out phases the device lacks."""
+    phases = platform.phases
+
+    return [
+        SolarEdgeSensor(platform, config_entry, coordinator, description)
+        for description in descriptions
+        if description.phase is None or phases is None or description.phase in phases
+    ]
+
+
+def poll_sensors(platform, config_entry, coordinator) -> list:
+    """Diagnostic sensors of a device's poll statistics."""
+    return [
+        PollLatency(platform, config_entry, coordinator, 50),
+        PollLatency(platform, config_entry, coordinator, 95),
+        PollLatency(platform, config_entry, coordinator),
+        PollFailureRate(platform, config_entry, coordinator),
+        LastPollSuccess(platform, config_entry, coordinator),
+    ]
+
+
+@callback
+def async_track_register_fields(
+    hass: HomeAssistant, config_entry: ConfigEntry, hub, entities: list
+) -> None:
+    """Only poll register groups backing enabled entities.
+
+    Updated as entities are enabled or disabled, so the next poll reads the
+    registers of a newly enabled entity.
+    """
+    registry = er.async_get(hass)
+
+    @callback
+    def async_update_fields(_event=None) -> None:
+        fields = {
+            device: set() for device in [*hub.inverters, *hub.meters, *hub.batteries]
+        }
+
+        for entity in entities:
+            if entity.register_field is None:
+                continue
+
+            entity_id = registry.async_get_entity_id(
+                SENSOR_DOMAIN, DOMAIN, entity.unique_id
+            )
+            if entity_id is None:
+                enabled = entity.entity_registry_enabled_default
+            else:
+                enabled = not registry.async_get(entity_id).disabled
+
+            if enabled:
+                fields[entity.platform_device].add(entity.register_field)
+
+        for device, device_fields in fields.items():
+            hub.set_needed_fields(device, device_fields)
+
+    @callback
+    def async_disabled_changed(event) -> bool:
+        return event.data["action"] == "update" and "disabled_by" in event.data.get(
+            "changes", {}
+        )
+
+    async_update_fields()
+
+    config_entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            async_update_fields,
+            event_filter=async_disabled_changed,
+        )
+    )
+
+
 class SolarEdgeSensorBase(CoordinatorEntity, SensorEntity):
     should_poll = False
     _attr_has_entity_name = True
@@ -208,11 +555,30 @@ class SolarEdgeSensorBase(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         self._platform = platform
         self._config_entry = config_entry
+        self._last_state = None
+        self._skipped_writes = 0
+        self._refresh_cycles = config_entry.options.get(
+            CONF_STATE_REFRESH_CYCLES, DEFAULT_STATE_REFRESH_CYCLES
+        )
+
+        if config_entry.options.get(CONF_STATE_DEADBAND, DEFAULT_STATE_DEADBAND):
+            self._deadband = STATE_DEADBANDS.get(self.device_class)
+        else:
+            self._deadband = None
 
     @property
     def device_info(self):
         return self._platform.device_info
 
+    @property
+    def platform_device(self):
+        return self._platform
+
+    @property
+    def register_field(self) -> Optional[str]:
+        """Model register field this sensor shows, None if it uses none."""
+        return None
+
     @property
     def config_entry_id(self):
         return self._config_entry.entry_id
@@ -225,11 +591,83 @@ class SolarEdgeSensorBase(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         return self._platform.online
 
+    def _state_unchanged(self, state) -> bool:
+        """Compare with the last written state, allowing the deadband."""
+        if self._last_state is None:
+            return False
+
+        available, value, attrs = state
+        last_available, last_value, last_attrs = self._last_state
+
+        if available != last_available or attrs != last_attrs:
+            return False
+
+        if value == last_value:
+            return True
+
+        return (
+            self._deadband is not None
+            and isinstance(value, (int, float))
+            and isinstance(last_value, (int, float))
+            and abs(value - last_value) < self._deadband
+        )
+
     @callback
     def _handle_coordinator_update(self) -> None:
+        if self.available:
+            state = (True, self.native_value, self.extra_state_attributes)
+        else:
+            state = (False, None, None)
+
+        if (
+            self._state_unchanged(state)
+            and self._skipped_writes + 1 < self._refresh_cycles
+        ):
+            self._skipped_writes += 1
+            return
+
+        self._last_state = state
+        self._skipped_writes = 0
         self.async_write_ha_state()
 
 
+class SolarEdgeSensor(SolarEdgeSensorBase):
+    """Sensor showing one snapshot field, as described by its description."""
+
+    entity_description: SolarEdgeSensorEntityDescription
+
+    def __init__(
+        self,
+        platform,
+        config_entry,
+        coordinator,
+        description: SolarEdgeSensorEntityDescription,
+    ):
+        self.entity_description = description
+        super().__init__(platform, config_entry, coordinator)
+        """Initialize the sensor."""
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._platform.uid_base}_{self.entity_description.key}"
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        return (
+            self.entity_description.entity_registry_enabled_default
+            or self._platform.decoded_model.get("C_SunSpec_DID")
+            in self.entity_description.enabled_dids
+        )
+
+    @property
+    def register_field(self) -> str:
+        return self.entity_description.register_field
+
+    @property
+    def native_value(self):
+        return self._platform.snapshot[self.entity_description.register_field]
+
+
 class SolarEdgeDevice(SolarEdgeSensorBase):
     entity_category = EntityCategory.DIAGNOSTIC
 
@@ -313,6 +751,7 @@ class SolarEdgeDevice(SolarEdgeSensorBase):
             attrs["parent_device_id"] = self._platform.inverter_unit_id
 
         attrs["serial_number"] = self._platform.serial
+        attrs["poll_intervals"] = self._platform.poll_intervals
 
         try:
             if self._platform.decoded_model["C_SunSpec_DID"] in SUNSPEC_DID:
@@ -543,240 +982,115 @@ class SunspecDID(SolarEdgeSensorBase):
             return None
 
 
-class ACCurrentSensor(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.CURRENT
+class PollLatency(SolarEdgeSensorBase):
+    device_class = SensorDeviceClass.DURATION
     state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = ELECTRIC_CURRENT_AMPERE
+    native_unit_of_measurement = TIME_MILLISECONDS
+    entity_category = EntityCategory.DIAGNOSTIC
+    icon = "mdi:timer-outline"
 
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
+    def __init__(self, platform, config_entry, coordinator, percentile=None):
         super().__init__(platform, config_entry, coordinator)
         """Initialize the sensor."""
-        self._phase = phase
+        self._percentile = percentile
 
-        if self._platform.decoded_model["C_SunSpec_DID"] in [101, 102, 103]:
-            self.SUNSPEC_NOT_IMPL = SunSpecNotImpl.UINT16
-        elif self._platform.decoded_model["C_SunSpec_DID"] in [201, 202, 203, 204]:
-            self.SUNSPEC_NOT_IMPL = SunSpecNotImpl.INT16
-        else:
-            raise RuntimeError(
-                "ACCurrentSensor C_SunSpec_DID "
-                f"{self._platform.decoded_model['C_SunSpec_DID']}"
-            )
+    @property
+    def _stat(self) -> str:
+        if self._percentile is None:
+            return "max"
+
+        return f"p{self._percentile}"
 
     @property
     def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_current"
-        else:
-            return f"{self._platform.uid_base}_ac_current_{self._phase.lower()}"
+        return f"{self._platform.uid_base}_poll_latency_{self._stat}"
 
     @property
-    def entity_registry_enabled_default(self) -> bool:
-        if self._phase is None:
-            return True
-
-        elif self._platform.decoded_model["C_SunSpec_DID"] in [
-            103,
-            203,
-            204,
-        ] and self._phase in [
-            "A",
-            "B",
-            "C",
-        ]:
-            return True
+    def name(self) -> str:
+        return f"Poll Latency {self._stat}"
 
-        else:
-            return False
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        return False
 
     @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Current"
-        else:
-            return f"AC Current {self._phase.upper()}"
+    def available(self) -> bool:
+        return True
 
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_Current"
-        else:
-            model_key = f"AC_Current_{self._phase.upper()}"
-
-        try:
-            if (
-                self._platform.decoded_model[model_key] == self.SUNSPEC_NOT_IMPL
-                or self._platform.decoded_model["AC_Current_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_Current_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
-            else:
-                return scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_Current_SF"],
-                )
-
-        except TypeError:
-            return None
+        return self._platform.stats.latency_ms(self._percentile)
 
 
-class VoltageSensor(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.VOLTAGE
+class PollFailureRate(SolarEdgeSensorBase):
     state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = ELECTRIC_POTENTIAL_VOLT
+    native_unit_of_measurement = PERCENTAGE
+    entity_category = EntityCategory.DIAGNOSTIC
+    icon = "mdi:lan-disconnect"
 
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
+    def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         """Initialize the sensor."""
-        self._phase = phase
-
-        if self._platform.decoded_model["C_SunSpec_DID"] in [101, 102, 103]:
-            self.SUNSPEC_NOT_IMPL = SunSpecNotImpl.UINT16
-        elif self._platform.decoded_model["C_SunSpec_DID"] in [201, 202, 203, 204]:
-            self.SUNSPEC_NOT_IMPL = SunSpecNotImpl.INT16
-        else:
-            raise RuntimeError(
-                "ACCurrentSensor C_SunSpec_DID "
-                f"{self._platform.decoded_model['C_SunSpec_DID']}"
-            )
 
     @property
     def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_voltage"
-        else:
-            return f"{self._platform.uid_base}_ac_voltage_{self._phase.lower()}"
+        return f"{self._platform.uid_base}_poll_failure_rate"
 
     @property
-    def entity_registry_enabled_default(self) -> bool:
-        if self._phase is None:
-            raise NotImplementedError
-
-        elif self._phase in ["LN", "LL", "AB"]:
-            return True
-
-        elif self._platform.decoded_model["C_SunSpec_DID"] in [
-            103,
-            203,
-            204,
-        ] and self._phase in [
-            "BC",
-            "CA",
-            "AN",
-            "BN",
-            "CN",
-        ]:
-            return True
+    def name(self) -> str:
+        return "Poll Failure Rate"
 
-        else:
-            return False
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        return False
 
     @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Voltage"
-        else:
-            return f"AC Voltage {self._phase.upper()}"
+    def available(self) -> bool:
+        return True
 
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_Voltage"
-        else:
-            model_key = f"AC_Voltage_{self._phase.upper()}"
-
-        try:
-            if (
-                self._platform.decoded_model[model_key] == self.SUNSPEC_NOT_IMPL
-                or self._platform.decoded_model["AC_Voltage_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_Voltage_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
+        return self._platform.stats.failure_rate
 
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_Voltage_SF"],
-                )
-                return round(value, abs(self._platform.decoded_model["AC_Voltage_SF"]))
-
-        except TypeError:
-            return None
+    @property
+    def extra_state_attributes(self):
+        return {
+            "errors": dict(self._platform.stats.errors),
+            "last_error": self._platform.stats.last_error,
+        }
 
 
-class ACPower(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.POWER
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = POWER_WATT
-    icon = "mdi:solar-power"
+class LastPollSuccess(SolarEdgeSensorBase):
+    device_class = SensorDeviceClass.TIMESTAMP
+    entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
+    def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         """Initialize the sensor."""
-        self._phase = phase
 
     @property
     def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_power"
-        else:
-            return f"{self._platform.uid_base}_ac_power_{self._phase.lower()}"
+        return f"{self._platform.uid_base}_last_poll_success"
 
     @property
-    def entity_registry_enabled_default(self) -> bool:
-        if self._phase is None:
-            return True
-
-        elif self._platform.decoded_model["C_SunSpec_DID"] in [
-            203,
-            204,
-        ] and self._phase in [
-            "A",
-            "B",
-            "C",
-        ]:
-            return True
+    def name(self) -> str:
+        return "Last Successful Poll"
 
-        else:
-            return False
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        return False
 
     @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Power"
-        else:
-            return f"AC Power {self._phase.upper()}"
+    def available(self) -> bool:
+        return True
 
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_Power"
-        else:
-            model_key = f"AC_Power_{self._phase.upper()}"
-
-        try:
-            if (
-                self._platform.decoded_model[model_key] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_Power_SF"] == SunSpecNotImpl.INT16
-            ):
-                return None
-
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_Power_SF"],
-                )
-                return round(value, abs(self._platform.decoded_model["AC_Power_SF"]))
-
-        except TypeError:
-            return None
+        return self._platform.stats.last_success
 
 
-class ACFrequency(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.FREQUENCY
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = FREQUENCY_HERTZ
+class Status(SolarEdgeSensorBase):
+    entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
@@ -784,352 +1098,83 @@ class ACFrequency(SolarEdgeSensorBase):
 
     @property
     def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_ac_frequency"
+        return f"{self._platform.uid_base}_status"
 
     @property
     def name(self) -> str:
-        return "AC Frequency"
+        return "Status"
+
+    @property
+    def register_field(self) -> str:
+        return "I_Status"
 
     @property
     def native_value(self):
+        return self._platform.snapshot[self.register_field]
+
+    @property
+    def extra_state_attributes(self):
+        attrs = {}
+
         try:
-            if (
-                self._platform.decoded_model["AC_Frequency"] == SunSpecNotImpl.UINT16
-                or self._platform.decoded_model["AC_Frequency_SF"]
-                == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_Frequency_SF"]
-                not in SUNSPEC_SF_RANGE
-            ):
-                return None
+            if self._platform.decoded_model["I_Status"] in DEVICE_STATUS_DESC:
+                attrs["description"] = DEVICE_STATUS_DESC[
+                    self._platform.decoded_model["I_Status"]
+                ]
 
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model["AC_Frequency"],
-                    self._platform.decoded_model["AC_Frequency_SF"],
-                )
-                return round(
-                    value, abs(self._platform.decoded_model["AC_Frequency_SF"])
-                )
+            if self._platform.decoded_model["I_Status"] in DEVICE_STATUS:
+                attrs["status_text"] = DEVICE_STATUS[
+                    self._platform.decoded_model["I_Status"]
+                ]
 
-        except TypeError:
-            return None
+        except KeyError:
+            pass
 
+        return attrs
 
-class ACVoltAmp(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.APPARENT_POWER
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = POWER_VOLT_AMPERE
 
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
+class StatusVendor(SolarEdgeSensorBase):
+    entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         """Initialize the sensor."""
-        self._phase = phase
 
     @property
     def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_va"
-        else:
-            return f"{self._platform.uid_base}_ac_va_{self._phase.lower()}"
+        return f"{self._platform.uid_base}_status_vendor"
 
     @property
     def name(self) -> str:
-        if self._phase is None:
-            return "AC VA"
-        else:
-            return f"AC VA {self._phase.upper()}"
+        return "Status Vendor"
 
     @property
-    def entity_registry_enabled_default(self) -> bool:
-        return False
-
-    @property
-    def native_value(self):
-        if self._phase is None:
-            model_key = "AC_VA"
-        else:
-            model_key = f"AC_VA_{self._phase.upper()}"
-
-        try:
-            if (
-                self._platform.decoded_model[model_key] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_VA_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_VA_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_VA_SF"],
-                )
-                return round(value, abs(self._platform.decoded_model["AC_VA_SF"]))
-
-        except TypeError:
-            return None
-
-
-class ACVoltAmpReactive(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.REACTIVE_POWER
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = POWER_VOLT_AMPERE_REACTIVE
-
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-        self._phase = phase
-
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_var"
-        else:
-            return f"{self._platform.uid_base}_ac_var_{self._phase.lower()}"
-
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC var"
-        else:
-            return f"AC var {self._phase.upper()}"
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        return False
-
-    @property
-    def native_value(self):
-        if self._phase is None:
-            model_key = "AC_var"
-        else:
-            model_key = f"AC_var_{self._phase.upper()}"
-
-        try:
-            if (
-                self._platform.decoded_model[model_key] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_var_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_var_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_var_SF"],
-                )
-                return round(value, abs(self._platform.decoded_model["AC_var_SF"]))
-
-        except TypeError:
-            return None
-
-
-class ACPowerFactor(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.POWER_FACTOR
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = PERCENTAGE
-
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-        self._phase = phase
-
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_pf"
-        else:
-            return f"{self._platform.uid_base}_ac_pf_{self._phase.lower()}"
-
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC PF"
-        else:
-            return f"AC PF {self._phase.upper()}"
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        return False
+    def register_field(self) -> str:
+        return "I_Status_Vendor"
 
     @property
     def native_value(self):
-        if self._phase is None:
-            model_key = "AC_PF"
-        else:
-            model_key = f"AC_PF_{self._phase.upper()}"
-
-        try:
-            if (
-                self._platform.decoded_model[model_key] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_PF_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["AC_PF_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_PF_SF"],
-                )
-                return round(value, abs(self._platform.decoded_model["AC_PF_SF"]))
-
-        except TypeError:
-            return None
-
-
-class ACEnergy(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.ENERGY
-    state_class = SensorStateClass.TOTAL_INCREASING
-    native_unit_of_measurement = ENERGY_KILO_WATT_HOUR
-
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-        self._phase = phase
-        self.last = None
-
-        if self._platform.decoded_model["C_SunSpec_DID"] in [101, 102, 103]:
-            self.SUNSPEC_NOT_IMPL = SunSpecNotImpl.UINT16
-        elif self._platform.decoded_model["C_SunSpec_DID"] in [201, 202, 203, 204]:
-            self.SUNSPEC_NOT_IMPL = SunSpecNotImpl.INT16
-        else:
-            raise RuntimeError(
-                "ACEnergy C_SunSpec_DID ",
-                f"{self._platform.decoded_model['C_SunSpec_DID']}",
-            )
-
-    @property
-    def icon(self) -> str:
-        if self._phase is None:
-            return None
-
-        elif re.match("import", self._phase.lower()):
-            return "mdi:transmission-tower-export"
-
-        elif re.match("export", self._phase.lower()):
-            return "mdi:transmission-tower-import"
-
-        else:
-            return None
-
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            return f"{self._platform.uid_base}_ac_energy_kwh"
-        else:
-            return f"{self._platform.uid_base}_{self._phase.lower()}_kwh"
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        if self._phase is None or self._phase in [
-            "Exported",
-            "Imported",
-            "Exported_A",
-            "Imported_A",
-        ]:
-            return True
-
-        elif self._platform.decoded_model["C_SunSpec_DID"] in [
-            203,
-            204,
-        ] and self._phase in [
-            "Exported_B",
-            "Exported_C",
-            "Imported_B",
-            "Imported_C",
-        ]:
-            return True
-
-        else:
-            return False
-
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            return "AC Energy kWh"
-        else:
-            return f"{re.sub('_', ' ', self._phase)} kWh"
+        return self._platform.snapshot[self.register_field]
 
     @property
-    def native_value(self):
-        if self._phase is None:
-            model_key = "AC_Energy_WH"
-        else:
-            model_key = f"AC_Energy_WH_{self._phase}"
-
+    def extra_state_attributes(self):
         try:
-            if (
-                self._platform.decoded_model[model_key] == SunSpecAccum.NA32
-                or self._platform.decoded_model[model_key] > SunSpecAccum.LIMIT32
-                or self._platform.decoded_model["AC_Energy_WH_SF"]
-                == self.SUNSPEC_NOT_IMPL
-                or self._platform.decoded_model["AC_Energy_WH_SF"]
-                not in SUNSPEC_SF_RANGE
-            ):
-                return None
+            if self._platform.decoded_model["I_Status_Vendor"] in VENDOR_STATUS:
+                return {
+                    "description": VENDOR_STATUS[
+                        self._platform.decoded_model["I_Status_Vendor"]
+                    ]
+                }
 
             else:
-                value = scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["AC_Energy_WH_SF"],
-                )
-
-                try:
-                    return watts_to_kilowatts(update_accum(self, value))
-                except Exception:
-                    return None
-
-        except TypeError:
-            return None
-
-
-class DCCurrent(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.CURRENT
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = ELECTRIC_CURRENT_AMPERE
-    icon = "mdi:current-dc"
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_dc_current"
-
-    @property
-    def name(self) -> str:
-        return "DC Current"
-
-    @property
-    def native_value(self):
-        try:
-            if (
-                self._platform.decoded_model["I_DC_Current"] == SunSpecNotImpl.UINT16
-                or self._platform.decoded_model["I_DC_Current_SF"]
-                == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["I_DC_Current_SF"]
-                not in SUNSPEC_SF_RANGE
-            ):
                 return None
 
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model["I_DC_Current"],
-                    self._platform.decoded_model["I_DC_Current_SF"],
-                )
-                return round(
-                    value, abs(self._platform.decoded_model["I_DC_Current_SF"])
-                )
-
-        except TypeError:
+        except KeyError:
             return None
 
 
-class DCVoltage(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.VOLTAGE
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = ELECTRIC_POTENTIAL_VOLT
+class MeterEvents(SolarEdgeSensorBase):
+    entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
@@ -1137,750 +1182,50 @@ class DCVoltage(SolarEdgeSensorBase):
 
     @property
     def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_dc_voltage"
+        return f"{self._platform.uid_base}_meter_events"
 
     @property
     def name(self) -> str:
-        return "DC Voltage"
-
-    @property
-    def native_value(self):
-        try:
-            if (
-                self._platform.decoded_model["I_DC_Voltage"] == SunSpecNotImpl.UINT16
-                or self._platform.decoded_model["I_DC_Voltage_SF"]
-                == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["I_DC_Voltage_SF"]
-                not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model["I_DC_Voltage"],
-                    self._platform.decoded_model["I_DC_Voltage_SF"],
-                )
-                return round(
-                    value, abs(self._platform.decoded_model["I_DC_Voltage_SF"])
-                )
-
-        except TypeError:
-            return None
-
-
-class DCPower(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.POWER
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = POWER_WATT
-    icon = "mdi:solar-power"
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_dc_power"
+        return "Meter Events"
 
     @property
-    def name(self) -> str:
-        return "DC Power"
+    def register_field(self) -> str:
+        return "M_Events"
 
     @property
     def native_value(self):
-        try:
-            if (
-                self._platform.decoded_model["I_DC_Power"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["I_DC_Power_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["I_DC_Power_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model["I_DC_Power"],
-                    self._platform.decoded_model["I_DC_Power_SF"],
-                )
-                return round(value, abs(self._platform.decoded_model["I_DC_Power_SF"]))
-
-        except TypeError:
-            return None
-
-
-class HeatSinkTemperature(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.TEMPERATURE
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = TEMP_CELSIUS
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_temp_sink"
+        return self._platform.snapshot[self.register_field]
 
     @property
-    def name(self) -> str:
-        return "Temp Sink"
-
-    @property
-    def native_value(self):
+    def extra_state_attributes(self):
         try:
-            if (
-                self._platform.decoded_model["I_Temp_Sink"] == 0x0
-                or self._platform.decoded_model["I_Temp_Sink"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["I_Temp_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["I_Temp_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
+            m_events_active = []
+            if int(str(self._platform.decoded_model["M_Events"]), 16) == 0x0:
+                return {"description": str(m_events_active)}
             else:
-                value = scale_factor(
-                    self._platform.decoded_model["I_Temp_Sink"],
-                    self._platform.decoded_model["I_Temp_SF"],
-                )
-                return round(value, abs(self._platform.decoded_model["I_Temp_SF"]))
+                for i in range(2, 31):
+                    if int(str(self._platform.decoded_model["M_Events"]), 16) & (
+                        1 << i
+                    ):
+                        m_events_active.append(METER_EVENTS[i])
+                return {"description": str(m_events_active)}
 
-        except TypeError:
+        except KeyError:
             return None
 
 
-class Status(SolarEdgeSensorBase):
-    entity_category = EntityCategory.DIAGNOSTIC
-
+class SolarEdgeBatteryStatus(Status):
     def __init__(self, platform, config_entry, coordinator):
         super().__init__(platform, config_entry, coordinator)
         """Initialize the sensor."""
 
     @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_status"
-
-    @property
-    def name(self) -> str:
-        return "Status"
+    def register_field(self) -> str:
+        return "B_Status"
 
     @property
     def native_value(self):
-        try:
-            if self._platform.decoded_model["I_Status"] == SunSpecNotImpl.INT16:
-                return None
-
-            else:
-                return str(self._platform.decoded_model["I_Status"])
-
-        except TypeError:
-            return None
-
-    @property
-    def extra_state_attributes(self):
-        attrs = {}
-
-        try:
-            if self._platform.decoded_model["I_Status"] in DEVICE_STATUS_DESC:
-                attrs["description"] = DEVICE_STATUS_DESC[
-                    self._platform.decoded_model["I_Status"]
-                ]
-
-            if self._platform.decoded_model["I_Status"] in DEVICE_STATUS:
-                attrs["status_text"] = DEVICE_STATUS[
-                    self._platform.decoded_model["I_Status"]
-                ]
-
-        except KeyError:
-            pass
-
-        return attrs
-
-
-class StatusVendor(SolarEdgeSensorBase):
-    entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_status_vendor"
-
-    @property
-    def name(self) -> str:
-        return "Status Vendor"
-
-    @property
-    def native_value(self):
-        try:
-            if self._platform.decoded_model["I_Status_Vendor"] == SunSpecNotImpl.INT16:
-                return None
-
-            else:
-                return str(self._platform.decoded_model["I_Status_Vendor"])
-
-        except TypeError:
-            return None
-
-    @property
-    def extra_state_attributes(self):
-        try:
-            if self._platform.decoded_model["I_Status_Vendor"] in VENDOR_STATUS:
-                return {
-                    "description": VENDOR_STATUS[
-                        self._platform.decoded_model["I_Status_Vendor"]
-                    ]
-                }
-
-            else:
-                return None
-
-        except KeyError:
-            return None
-
-
-class MeterEvents(SolarEdgeSensorBase):
-    entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_meter_events"
-
-    @property
-    def name(self) -> str:
-        return "Meter Events"
-
-    @property
-    def native_value(self):
-        try:
-            if self._platform.decoded_model["M_Events"] == SunSpecNotImpl.UINT32:
-                return None
-
-            else:
-                return self._platform.decoded_model["M_Events"]
-
-        except TypeError:
-            return None
-
-    @property
-    def extra_state_attributes(self):
-        try:
-            m_events_active = []
-            if int(str(self._platform.decoded_model["M_Events"]), 16) == 0x0:
-                return {"description": str(m_events_active)}
-            else:
-                for i in range(2, 31):
-                    if int(str(self._platform.decoded_model["M_Events"]), 16) & (
-                        1 << i
-                    ):
-                        m_events_active.append(METER_EVENTS[i])
-                return {"description": str(m_events_active)}
-
-        except KeyError:
-            return None
-
-
-class MeterVAhIE(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.ENERGY
-    state_class = SensorStateClass.TOTAL_INCREASING
-    native_unit_of_measurement = ENERGY_VOLT_AMPERE_HOUR
-
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-        self._phase = phase
-        self.last = None
-
-    @property
-    def icon(self) -> str:
-        if self._phase is None:
-            return None
-
-        elif re.match("import", self._phase.lower()):
-            return "mdi:transmission-tower-export"
-
-        elif re.match("export", self._phase.lower()):
-            return "mdi:transmission-tower-import"
-
-        else:
-            return None
-
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            return f"{self._platform.uid_base}_" f"{self._phase.lower()}_vah"
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        return False
-
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            return f"{re.sub('_', ' ', self._phase)} VAh"
-
-    @property
-    def native_value(self):
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            model_key = f"M_VAh_{self._phase}"
-
-        try:
-            if (
-                self._platform.decoded_model[model_key] == SunSpecAccum.NA32
-                or self._platform.decoded_model[model_key] > SunSpecAccum.LIMIT32
-                or self._platform.decoded_model["M_VAh_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["M_VAh_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["M_VAh_SF"],
-                )
-
-                try:
-                    return update_accum(self, value, value)
-                except Exception:
-                    return None
-
-        except TypeError:
-            return None
-
-
-class MetervarhIE(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.ENERGY
-    state_class = SensorStateClass.TOTAL_INCREASING
-    native_unit_of_measurement = ENERGY_VOLT_AMPERE_REACTIVE_HOUR
-
-    def __init__(self, platform, config_entry, coordinator, phase: str = None):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-        self._phase = phase
-        self.last = None
-
-    @property
-    def icon(self) -> str:
-        if self._phase is None:
-            return None
-
-        elif re.match("import", self._phase.lower()):
-            return "mdi:transmission-tower-export"
-
-        elif re.match("export", self._phase.lower()):
-            return "mdi:transmission-tower-import"
-
-        else:
-            return None
-
-    @property
-    def unique_id(self) -> str:
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            return f"{self._platform.uid_base}_{self._phase.lower()}_varh"
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        return False
-
-    @property
-    def name(self) -> str:
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            return f"{re.sub('_', ' ', self._phase)} varh"
-
-    @property
-    def native_value(self):
-        if self._phase is None:
-            raise NotImplementedError
-        else:
-            model_key = f"M_varh_{self._phase}"
-
-        try:
-            if (
-                self._platform.decoded_model[model_key] == SunSpecAccum.NA32
-                or self._platform.decoded_model[model_key] > SunSpecAccum.LIMIT32
-                or self._platform.decoded_model["M_varh_SF"] == SunSpecNotImpl.INT16
-                or self._platform.decoded_model["M_varh_SF"] not in SUNSPEC_SF_RANGE
-            ):
-                return None
-
-            else:
-                value = scale_factor(
-                    self._platform.decoded_model[model_key],
-                    self._platform.decoded_model["M_varh_SF"],
-                )
-
-                try:
-                    return update_accum(self, value, value)
-                except Exception:
-                    return None
-
-        except TypeError:
-            return None
-
-
-class SolarEdgeBatteryAvgTemp(HeatSinkTemperature):
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_avg_temp"
-
-    @property
-    def name(self) -> str:
-        return "Average Temperature"
-
-    @property
-    def native_value(self):
-        try:
-            if (
-                float_to_hex(self._platform.decoded_model["B_Temp_Average"])
-                == hex(SunSpecNotImpl.FLOAT32)
-                or self._platform.decoded_model["B_Temp_Average"] < BatteryLimit.Tmin
-                or self._platform.decoded_model["B_Temp_Average"] > BatteryLimit.Tmax
-            ):
-                return None
-
-            else:
-                return round(self._platform.decoded_model["B_Temp_Average"], 1)
-
-        except TypeError:
-            return None
-
-
-class SolarEdgeBatteryMaxTemp(HeatSinkTemperature):
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_max_temp"
-
-    @property
-    def name(self) -> str:
-        return "Max Temperature"
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        return False
-
-    @property
-    def native_value(self):
-        try:
-            if (
-                float_to_hex(self._platform.decoded_model["B_Temp_Max"])
-                == hex(SunSpecNotImpl.FLOAT32)
-                or self._platform.decoded_model["B_Temp_Max"] < BatteryLimit.Tmin
-                or self._platform.decoded_model["B_Temp_Max"] > BatteryLimit.Tmax
-            ):
-                return None
-
-            else:
-                return round(self._platform.decoded_model["B_Temp_Max"], 1)
-
-        except TypeError:
-            return None
-
-
-class SolarEdgeBatteryVoltage(DCVoltage):
-    @property
-    def native_value(self):
-        try:
-            if (
-                float_to_hex(self._platform.decoded_model["B_DC_Voltage"])
-                == hex(SunSpecNotImpl.FLOAT32)
-                or self._platform.decoded_model["B_DC_Voltage"] < BatteryLimit.Vmin
-                or self._platform.decoded_model["B_DC_Voltage"] > BatteryLimit.Vmax
-            ):
-
-                return None
-
-            elif self._platform.decoded_model["B_Status"] in [0]:
-                return None
-
-            else:
-                return round(self._platform.decoded_model["B_DC_Voltage"], 2)
-
-        except TypeError:
-            return None
-
-
-class SolarEdgeBatteryCurrent(DCCurrent):
-    @property
-    def native_value(self):
-        try:
-            if (
-                float_to_hex(self._platform.decoded_model["B_DC_Current"])
-                == hex(SunSpecNotImpl.FLOAT32)
-                or self._platform.decoded_model["B_DC_Current"] < BatteryLimit.Amin
-                or self._platform.decoded_model["B_DC_Current"] > BatteryLimit.Amax
-            ):
-                return None
-
-            elif self._platform.decoded_model["B_Status"] in [0]:
-                return None
-
-            else:
-                return round(self._platform.decoded_model["B_DC_Current"], 2)
-
-        except TypeError:
-            return None
-
-
-class SolarEdgeBatteryPower(DCPower):
-    icon = "mdi:lightning-bolt"
-
-    @property
-    def native_value(self):
-        try:
-            if (
-                float_to_hex(self._platform.decoded_model["B_DC_Power"])
-                == hex(SunSpecNotImpl.FLOAT32)
-                or float_to_hex(self._platform.decoded_model["B_DC_Power"])
-                == "0xff7fffff"
-                or float_to_hex(self._platform.decoded_model["B_DC_Power"])
-                == "0x7f7fffff"
-            ):
-                return None
-
-            elif self._platform.decoded_model["B_Status"] in [0]:
-                return None
-
-            else:
-                return round(self._platform.decoded_model["B_DC_Power"], 2)
-
-        except TypeError:
-            return None
-
-
-class SolarEdgeBatteryEnergyExport(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.ENERGY
-    state_class = SensorStateClass.TOTAL_INCREASING
-    native_unit_of_measurement = ENERGY_KILO_WATT_HOUR
-    icon = "mdi:battery-charging-20"
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-        self.last = None
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_energy_export"
-
-    @property
-    def name(self) -> str:
-        return "Energy Export"
-
-    @property
-    def native_value(self):
-        try:
-            if self._platform.decoded_model["B_Export_Energy_WH"] == 0xFFFFFFFFFFFFFFFF:
-                return None
-
-            else:
-                try:
-                    return watts_to_kilowatts(
-                        update_accum(
-                            self, self._platform.decoded_model["B_Export_Energy_WH"]
-                        )
-                    )
-                except Exception:
-                    return None
-
-        except TypeError:
-            return None
-
-
-class SolarEdgeBatteryEnergyImport(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.ENERGY
-    state_class = SensorStateClass.TOTAL_INCREASING
-    native_unit_of_measurement = ENERGY_KILO_WATT_HOUR
-    icon = "mdi:battery-charging-100"
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-        self.last = None
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_energy_import"
-
-    @property
-    def name(self) -> str:
-        return "Energy Import"
-
-    @property
-    def native_value(self):
-        try:
-            if self._platform.decoded_model["B_Import_Energy_WH"] == 0xFFFFFFFFFFFFFFFF:
-                return None
-
-            else:
-                try:
-                    return watts_to_kilowatts(
-                        update_accum(
-                            self, self._platform.decoded_model["B_Import_Energy_WH"]
-                        )
-                    )
-                except Exception:
-                    return None
-
-        except TypeError:
-            return None
-
-
-class SolarEdgeBatteryMaxEnergy(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.ENERGY
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = ENERGY_KILO_WATT_HOUR
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_max_energy"
-
-    @property
-    def name(self) -> str:
-        return "Maximum Energy"
-
-    @property
-    def native_value(self):
-        if (
-            float_to_hex(self._platform.decoded_model["B_Energy_Max"])
-            == hex(SunSpecNotImpl.FLOAT32)
-            or self._platform.decoded_model["B_Energy_Max"] < 0
-            or self._platform.decoded_model["B_Energy_Max"]
-            > self._platform.decoded_common["B_RatedEnergy"]
-        ):
-            return None
-
-        else:
-            return watts_to_kilowatts(self._platform.decoded_model["B_Energy_Max"])
-
-
-class SolarEdgeBatteryAvailableEnergy(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.ENERGY
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = ENERGY_KILO_WATT_HOUR
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_avail_energy"
-
-    @property
-    def name(self) -> str:
-        return "Available Energy"
-
-    @property
-    def native_value(self):
-        if (
-            float_to_hex(self._platform.decoded_model["B_Energy_Available"])
-            == hex(SunSpecNotImpl.FLOAT32)
-            or self._platform.decoded_model["B_Energy_Available"] < 0
-            or self._platform.decoded_model["B_Energy_Available"]
-            > self._platform.decoded_common["B_RatedEnergy"]
-        ):
-            return None
-
-        else:
-            return watts_to_kilowatts(
-                self._platform.decoded_model["B_Energy_Available"]
-            )
-
-
-class SolarEdgeBatterySOH(SolarEdgeSensorBase):
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = PERCENTAGE
-    entity_category = EntityCategory.DIAGNOSTIC
-    icon = "mdi:battery-heart-outline"
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_battery_soh"
-
-    @property
-    def name(self) -> str:
-        return "State of Health"
-
-    @property
-    def native_value(self):
-        if (
-            float_to_hex(self._platform.decoded_model["B_SOH"])
-            == hex(SunSpecNotImpl.FLOAT32)
-            or self._platform.decoded_model["B_SOH"] < 0
-            or self._platform.decoded_model["B_SOH"] > 100
-        ):
-            return None
-        else:
-            return round(self._platform.decoded_model["B_SOH"], 0)
-
-
-class SolarEdgeBatterySOE(SolarEdgeSensorBase):
-    device_class = SensorDeviceClass.BATTERY
-    state_class = SensorStateClass.MEASUREMENT
-    native_unit_of_measurement = PERCENTAGE
-
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._platform.uid_base}_battery_soe"
-
-    @property
-    def name(self) -> str:
-        return "State of Energy"
-
-    @property
-    def native_value(self):
-        if (
-            float_to_hex(self._platform.decoded_model["B_SOE"])
-            == hex(SunSpecNotImpl.FLOAT32)
-            or self._platform.decoded_model["B_SOE"] < 0
-            or self._platform.decoded_model["B_SOE"] > 100
-        ):
-            return None
-        else:
-            return round(self._platform.decoded_model["B_SOE"], 0)
-
-
-class SolarEdgeBatteryStatus(Status):
-    def __init__(self, platform, config_entry, coordinator):
-        super().__init__(platform, config_entry, coordinator)
-        """Initialize the sensor."""
-
-    @property
-    def native_value(self):
-        try:
-            if self._platform.decoded_model["B_Status"] == SunSpecNotImpl.UINT32:
-                return None
-
-            else:
-                return str(self._platform.decoded_model["B_Status"])
-
-        except TypeError:
-            return None
+        return self._platform.snapshot[self.register_field]
 
     @property
     def extra_state_attributes(self):
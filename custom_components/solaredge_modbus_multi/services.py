@@ -0,0 +1,164 @@
+"""Services of the SolarEdge Modbus Multi integration."""
+import logging
+from typing import Any, Dict, FrozenSet, List, Optional
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    BURST_MAX_DURATION,
+    BURST_MIN_INTERVAL,
+    DEFAULT_BURST_DURATION,
+    DEFAULT_BURST_INTERVAL,
+    DOMAIN,
+)
+from .hub import Burst, BurstRefused
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_BURST = "burst"
+
+ATTR_GROUPS = "groups"
+ATTR_INTERVAL = "interval"
+ATTR_DURATION = "duration"
+
+BURST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_GROUPS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_INTERVAL, default=DEFAULT_BURST_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=BURST_MIN_INTERVAL)
+        ),
+        vol.Optional(ATTR_DURATION, default=DEFAULT_BURST_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=BURST_MAX_DURATION)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_burst(call: ServiceCall) -> None:
+        targets = _burst_targets(
+            hass, call.data[ATTR_DEVICE_ID], call.data.get(ATTR_GROUPS)
+        )
+        duration = call.data[ATTR_DURATION]
+        bursts = {}
+
+        # check every config entry before starting any burst
+        for entry_id, groups in targets.items():
+            hub = hass.data[DOMAIN][entry_id]["hub"]
+
+            if not duration:
+                continue
+
+            try:
+                bursts[entry_id] = hub.plan_burst(
+                    groups, call.data[ATTR_INTERVAL], duration
+                )
+
+            except BurstRefused as e:
+                raise HomeAssistantError(f"Burst refused for {hub.name}: {e}")
+
+        for entry_id in targets:
+            _async_start_burst(hass, entry_id, bursts.get(entry_id), duration)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_BURST, async_burst, schema=BURST_SCHEMA
+    )
+
+
+def _burst_targets(
+    hass: HomeAssistant, device_ids: List[str], group_names: Optional[List[str]]
+) -> Dict[str, Dict[Any, FrozenSet[str]]]:
+    """Register groups to burst by config entry and hub device."""
+    device_registry = dr.async_get(hass)
+    targets = {}
+
+    for device_id in device_ids:
+        device_entry = device_registry.async_get(device_id)
+
+        if device_entry is None:
+            raise HomeAssistantError(f"Unknown device {device_id}")
+
+        for entry_id in device_entry.config_entries:
+            hub = hass.data.get(DOMAIN, {}).get(entry_id, {}).get("hub")
+
+            if hub is None:
+                continue
+
+            device = next(
+                (
+                    device
+                    for device in [*hub.inverters, *hub.meters, *hub.batteries]
+                    if (DOMAIN, device.uid_base) in device_entry.identifiers
+                ),
+                None,
+            )
+
+            if device is not None:
+                break
+
+        else:
+            raise HomeAssistantError(
+                f"{device_entry.name} is not a loaded SolarEdge Modbus device"
+            )
+
+        # groups without enabled entities are not polled at all
+        groups = {
+            group.name
+            for group in device.register_groups
+            if device.needed_groups is None or group.name in device.needed_groups
+        }
+
+        if group_names:
+            groups.intersection_update(group_names)
+
+        if not groups:
+            raise HomeAssistantError(
+                f"{device.name} polls none of the register groups {group_names}"
+            )
+
+        targets.setdefault(entry_id, {})[device] = frozenset(groups)
+
+    return targets
+
+
+@callback
+def _async_start_burst(
+    hass: HomeAssistant, entry_id: str, burst: Optional[Burst], duration: int
+) -> None:
+    """Start a burst on a config entry, ending a running one.
+
+    The hub sets the fleet interval of the config entry when a burst starts
+    and ends, also when it expires in a refresh before the timer runs.
+    """
+    entry_data = hass.data[DOMAIN][entry_id]
+    hub = entry_data["hub"]
+
+    if cancel := entry_data.pop("burst_end", None):
+        cancel()
+
+    @callback
+    def async_end_burst(_now=None) -> None:
+        entry_data.pop("burst_end", None)
+        hub.stop_burst()
+
+    if burst is None:
+        async_end_burst()
+        return
+
+    hub.start_burst(burst)
+    entry_data["burst_end"] = async_call_later(hass, duration, async_end_burst)
+
+    _LOGGER.info(
+        f"Polling {', '.join(device.name for device in burst.groups)} "
+        f"every {burst.interval}s for {duration}s"
+    )
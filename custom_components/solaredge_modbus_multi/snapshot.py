@@ -0,0 +1,255 @@
+from typing import Any, Dict, FrozenSet, Optional
+
+from .const import SUNSPEC_SF_RANGE, BatteryLimit, SunSpecAccum, SunSpecNotImpl
+from .helpers import float_to_hex, scale_factor, watts_to_kilowatts
+
+SF_RANGE = frozenset(SUNSPEC_SF_RANGE)
+FLOAT32_NOT_IMPL = hex(SunSpecNotImpl.FLOAT32)
+FLOAT32_LIMITS = ("0xff7fffff", "0x7f7fffff")
+PHASES = ("", "_A", "_B", "_C")
+
+
+class Accumulators:
+    """Last accepted value of each energy counter on a device."""
+
+    def __init__(self) -> None:
+        self._last = {}
+
+    def update(self, key: str, value) -> Optional[float]:
+        """Return value if it is positive and not below the last accepted one."""
+        if value is None or not value > 0:
+            return None
+
+        if value < self._last.get(key, 0):
+            # doesn't check accumulator rollover, but it would probably take
+            # several decades to roll over to 0 so we'll worry about it later
+            return None
+
+        self._last[key] = value
+        return value
+
+
+def _scaled(model, key: str, sf_key: str, not_impl: int, rounded: bool = True):
+    value = model.get(key)
+    sf = model.get(sf_key)
+
+    if value is None or value == not_impl or sf not in SF_RANGE:
+        return None
+
+    value = scale_factor(value, sf)
+
+    if rounded:
+        return round(value, abs(sf))
+
+    return value
+
+
+def _counter(model, key: str, sf_key: str, accum: Accumulators):
+    value = model.get(key)
+    sf = model.get(sf_key)
+
+    if value is None or sf not in SF_RANGE:
+        return None
+
+    if value == SunSpecAccum.NA32 or value > SunSpecAccum.LIMIT32:
+        return None
+
+    return accum.update(key, scale_factor(value, sf))
+
+
+def _reported(phase: str, phases: Optional[FrozenSet[str]]) -> bool:
+    """Whether a device has a phase or line, totals always."""
+    phase = phase.lstrip("_")
+    return not phase or phases is None or phase in phases
+
+
+def _kwh(value) -> Optional[float]:
+    if value is None:
+        return None
+
+    return watts_to_kilowatts(value)
+
+
+def _status(value: Optional[int], not_impl: int) -> Optional[str]:
+    if value is None or value == not_impl:
+        return None
+
+    return str(value)
+
+
+def _float(value: Optional[float], low=None, high=None, digits=None):
+    if value is None or float_to_hex(value) == FLOAT32_NOT_IMPL:
+        return None
+
+    if (low is not None and value < low) or (high is not None and value > high):
+        return None
+
+    if digits is None:
+        return value
+
+    return round(value, digits)
+
+
+def inverter_snapshot(
+    model, accum: Accumulators, phases: Optional[FrozenSet[str]] = None
+) -> Dict[str, Any]:
+    """Scaled inverter values keyed by register field, None if not available.
+
+    Fields of register groups that were never read are None as well, so are
+    fields of phases and lines missing from phases.
+    """
+    snapshot = {}
+
+    for phase in PHASES:
+        key = f"AC_Current{phase}"
+        if not _reported(phase, phases):
+            snapshot[key] = None
+            continue
+
+        snapshot[key] = _scaled(
+            model, key, "AC_Current_SF", SunSpecNotImpl.UINT16, rounded=False
+        )
+
+    for phase in ("AB", "BC", "CA", "AN", "BN", "CN"):
+        key = f"AC_Voltage_{phase}"
+        if not _reported(phase, phases):
+            snapshot[key] = None
+            continue
+
+        snapshot[key] = _scaled(model, key, "AC_Voltage_SF", SunSpecNotImpl.UINT16)
+
+    for key in ("AC_Power", "AC_VA", "AC_var", "AC_PF", "I_DC_Power"):
+        snapshot[key] = _scaled(model, key, f"{key}_SF", SunSpecNotImpl.INT16)
+
+    for key in ("AC_Frequency", "I_DC_Current", "I_DC_Voltage"):
+        snapshot[key] = _scaled(model, key, f"{key}_SF", SunSpecNotImpl.UINT16)
+
+    snapshot["AC_Energy_WH"] = _kwh(
+        _counter(model, "AC_Energy_WH", "AC_Energy_WH_SF", accum)
+    )
+
+    if model.get("I_Temp_Sink") == 0x0:
+        snapshot["I_Temp_Sink"] = None
+    else:
+        snapshot["I_Temp_Sink"] = _scaled(
+            model, "I_Temp_Sink", "I_Temp_SF", SunSpecNotImpl.INT16
+        )
+
+    snapshot["I_Status"] = _status(model.get("I_Status"), SunSpecNotImpl.INT16)
+    snapshot["I_Status_Vendor"] = _status(
+        model.get("I_Status_Vendor"), SunSpecNotImpl.INT16
+    )
+
+    return snapshot
+
+
+def meter_snapshot(
+    model, accum: Accumulators, phases: Optional[FrozenSet[str]] = None
+) -> Dict[str, Any]:
+    """Scaled meter values keyed by register field, None if not available.
+
+    Fields of phases and lines missing from phases are None.
+    """
+    snapshot = {}
+
+    for phase in PHASES:
+        if not _reported(phase, phases):
+            for name in ("AC_Current", "AC_Power", "AC_VA", "AC_var", "AC_PF"):
+                snapshot[f"{name}{phase}"] = None
+            continue
+
+        key = f"AC_Current{phase}"
+        snapshot[key] = _scaled(
+            model, key, "AC_Current_SF", SunSpecNotImpl.INT16, rounded=False
+        )
+
+        for name in ("AC_Power", "AC_VA", "AC_var", "AC_PF"):
+            key = f"{name}{phase}"
+            snapshot[key] = _scaled(model, key, f"{name}_SF", SunSpecNotImpl.INT16)
+
+    for phase in ("LN", "AN", "BN", "CN", "LL", "AB", "BC", "CA"):
+        key = f"AC_Voltage_{phase}"
+        if not _reported(phase, phases):
+            snapshot[key] = None
+            continue
+
+        snapshot[key] = _scaled(model, key, "AC_Voltage_SF", SunSpecNotImpl.INT16)
+
+    snapshot["AC_Frequency"] = _scaled(
+        model, "AC_Frequency", "AC_Frequency_SF", SunSpecNotImpl.UINT16
+    )
+
+    for direction in ("Exported", "Imported"):
+        for phase in PHASES:
+            energy = f"AC_Energy_WH_{direction}{phase}"
+            apparent = f"M_VAh_{direction}{phase}"
+            if not _reported(phase, phases):
+                snapshot[energy] = snapshot[apparent] = None
+                continue
+
+            snapshot[energy] = _kwh(_counter(model, energy, "AC_Energy_WH_SF", accum))
+            snapshot[apparent] = _counter(model, apparent, "M_VAh_SF", accum)
+
+    for quadrant in ("Import_Q1", "Import_Q2", "Export_Q3", "Export_Q4"):
+        for phase in PHASES:
+            key = f"M_varh_{quadrant}{phase}"
+            if not _reported(phase, phases):
+                snapshot[key] = None
+                continue
+
+            snapshot[key] = _counter(model, key, "M_varh_SF", accum)
+
+    if model.get("M_Events") == SunSpecNotImpl.UINT32:
+        snapshot["M_Events"] = None
+    else:
+        snapshot["M_Events"] = model.get("M_Events")
+
+    return snapshot
+
+
+def battery_snapshot(model, common, accum: Accumulators) -> Dict[str, Any]:
+    """Validated battery values keyed by register field, None if not available."""
+    snapshot = {}
+    idle = model.get("B_Status") in [0]
+    rated_energy = common["B_RatedEnergy"]
+
+    snapshot["B_Temp_Average"] = _float(
+        model.get("B_Temp_Average"), BatteryLimit.Tmin, BatteryLimit.Tmax, 1
+    )
+    snapshot["B_Temp_Max"] = _float(
+        model.get("B_Temp_Max"), BatteryLimit.Tmin, BatteryLimit.Tmax, 1
+    )
+
+    if idle:
+        snapshot["B_DC_Voltage"] = None
+        snapshot["B_DC_Current"] = None
+        snapshot["B_DC_Power"] = None
+
+    else:
+        snapshot["B_DC_Voltage"] = _float(
+            model.get("B_DC_Voltage"), BatteryLimit.Vmin, BatteryLimit.Vmax, 2
+        )
+        snapshot["B_DC_Current"] = _float(
+            model.get("B_DC_Current"), BatteryLimit.Amin, BatteryLimit.Amax, 2
+        )
+
+        power = model.get("B_DC_Power")
+        if power is not None and float_to_hex(power) in FLOAT32_LIMITS:
+            snapshot["B_DC_Power"] = None
+        else:
+            snapshot["B_DC_Power"] = _float(power, digits=2)
+
+    for key in ("B_Export_Energy_WH", "B_Import_Energy_WH"):
+        if model.get(key) == 0xFFFFFFFFFFFFFFFF:
+            snapshot[key] = None
+        else:
+            snapshot[key] = _kwh(accum.update(key, model.get(key)))
+
+    for key in ("B_Energy_Max", "B_Energy_Available"):
+        snapshot[key] = _kwh(_float(model.get(key), 0, rated_energy))
+
+    snapshot["B_SOH"] = _float(model.get("B_SOH"), 0, 100, 0)
+    snapshot["B_SOE"] = _float(model.get("B_SOE"), 0, 100, 0)
+    snapshot["B_Status"] = _status(model.get("B_Status"), SunSpecNotImpl.UINT32)
+
+    return snapshot
@@ -0,0 +1,66 @@
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from .const import POLL_STATS_WINDOW
+
+
+class PollStats:
+    """Rolling read latency and poll results of one device."""
+
+    def __init__(self, window: int = POLL_STATS_WINDOW) -> None:
+        self._latency = deque(maxlen=window)
+        self._results = deque(maxlen=window)
+        self.errors = Counter()
+        self.last_error: Optional[str] = None
+        self.last_success: Optional[datetime] = None
+
+    def add_read(self, seconds: float) -> None:
+        """Record the round trip time of a read."""
+        self._latency.append(seconds)
+
+    def add_success(self) -> None:
+        """Record a poll that read and decoded the device."""
+        self._results.append(True)
+        self.last_success = datetime.now(timezone.utc)
+
+    def add_error(self, error: BaseException) -> None:
+        """Record a failed poll by error class."""
+        self._results.append(False)
+        self.errors[type(error).__name__] += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+
+    def latency_ms(self, percentile: Optional[int] = None) -> Optional[float]:
+        """Nearest rank latency percentile in milliseconds, maximum if None."""
+        if not self._latency:
+            return None
+
+        if percentile is None:
+            return round(max(self._latency) * 1000, 1)
+
+        ordered = sorted(self._latency)
+        rank = max(0, -(-len(ordered) * percentile // 100) - 1)
+        return round(ordered[rank] * 1000, 1)
+
+    @property
+    def failure_rate(self) -> Optional[float]:
+        """Percentage of recent polls that failed."""
+        if not self._results:
+            return None
+
+        return round(100 * self._results.count(False) / len(self._results), 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "reads": len(self._latency),
+            "polls": len(self._results),
+            "latency_p50_ms": self.latency_ms(50),
+            "latency_p95_ms": self.latency_ms(95),
+            "latency_max_ms": self.latency_ms(),
+            "failure_rate": self.failure_rate,
+            "errors": dict(self.errors),
+            "last_error": self.last_error,
+            "last_success": (
+                self.last_success.isoformat() if self.last_success else None
+            ),
+        }
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import struct
+from typing import Dict, Optional
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+from pymodbus.factory import ClientDecoder
+from pymodbus.register_read_message import ReadHoldingRegistersRequest
+
+_LOGGER = logging.getLogger(__name__)
+
+# transaction id, protocol id, length, unit id
+MBAP_HEADER = struct.Struct(">HHHB")
+
+
+class AsyncModbusTcpClient(asyncio.Protocol):
+    """Modbus/TCP client that runs on the asyncio event loop.
+
+    Responses are matched to requests by transaction id and decoded with the
+    pymodbus client decoder, so callers get the same response objects as from
+    the synchronous ModbusTcpClient.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 3) -> None:
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._transport = None
+        self._buffer = bytearray()
+        self._transactions: Dict[int, asyncio.Future] = {}
+        self._next_tid = 0
+        self._decoder = ClientDecoder()
+
+    async def connect(self) -> bool:
+        """Connect to the Modbus/TCP server."""
+        if self.is_socket_open():
+            return True
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            await asyncio.wait_for(
+                loop.create_connection(lambda: self, self._host, self._port),
+                self._timeout,
+            )
+
+        except (OSError, asyncio.TimeoutError) as e:
+            _LOGGER.debug(f"Connection to {self._host}:{self._port} failed: {e}")
+            return False
+
+        return True
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def is_socket_open(self) -> bool:
+        """Check connection status."""
+        return self._transport is not None and not self._transport.is_closing()
+
+    async def read_holding_registers(
+        self, address: int, count: int, unit: int = 1
+    ) -> Optional[object]:
+        """Read holding registers."""
+        if not self.is_socket_open():
+            raise ConnectionException(f"Not connected to {self._host}:{self._port}")
+
+        request = ReadHoldingRegistersRequest(address, count, unit=unit)
+        pdu = struct.pack(">B", request.function_code) + request.encode()
+
+        tid = self._next_tid
+        self._next_tid = (self._next_tid + 1) & 0xFFFF
+
+        future = asyncio.get_running_loop().create_future()
+        self._transactions[tid] = future
+        self._transport.write(MBAP_HEADER.pack(tid, 0, len(pdu) + 1, unit) + pdu)
+
+        try:
+            return await asyncio.wait_for(future, self._timeout)
+
+        except asyncio.TimeoutError:
+            return ModbusIOException(
+                f"No response from unit {unit}", request.function_code
+            )
+
+        finally:
+            self._transactions.pop(tid, None)
+
+    def connection_made(self, transport) -> None:
+        self._transport = transport
+        self._buffer.clear()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._transport = None
+
+        for future in self._transactions.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionException(f"Connection lost to {self._host}: {exc}")
+                )
+
+        self._transactions.clear()
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer.extend(data)
+
+        while len(self._buffer) >= MBAP_HEADER.size:
+            tid, _, length, unit = MBAP_HEADER.unpack_from(self._buffer)
+            frame_end = 6 + length
+
+            if len(self._buffer) < frame_end:
+                break
+
+            pdu = bytes(self._buffer[MBAP_HEADER.size : frame_end])
+            del self._buffer[:frame_end]
+
+            future = self._transactions.get(tid)
+            if future is None or future.done():
+                _LOGGER.debug(f"Unrequested response tid={tid} unit={unit}")
+                continue
+
+            response = self._decoder.decode(pdu)
+            if response is None:
+                future.set_result(
+                    ModbusIOException(f"Unable to decode response from unit {unit}")
+                )
+                continue
+
+            response.transaction_id = tid
+            response.unit_id = unit
+            future.set_result(response)
@@ -0,0 +1,41 @@
+"""Fixtures running the integration against tools/simulator.py."""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "tools")]
+
+import simulator  # noqa: E402
+
+from custom_components.solaredge_modbus_multi.hub import (  # noqa: E402
+    SolarEdgeModbusMultiHub,
+)
+
+
+@pytest.fixture
+def simulate():
+    """Start simulators on free ports, stopped after the test."""
+    servers = []
+
+    def start(**options):
+        options.setdefault("update_interval", None)
+        server = simulator.start(0, **options)
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_hub(server, hass=None, **options) -> SolarEdgeModbusMultiHub:
+    """A hub polling a simulator, keeping the connection open by default."""
+    options.setdefault("keep_modbus_open", True)
+    options.setdefault("async_modbus", True)
+    host, port = server.server_address
+
+    return SolarEdgeModbusMultiHub(hass, "test", host, port, **options)
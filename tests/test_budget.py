@@ -0,0 +1,48 @@
+import asyncio
+
+from conftest import make_hub
+
+
+def test_first_cycle_reads_every_device_under_budget_pressure(simulate):
+    server = simulate(units=(1, 2), meters=2, latency=0.02)
+
+    async def run():
+        hub = make_hub(server, number_of_inverters=2)
+        hub.cycle_budget = 0.05
+        assert hub.cycle_timeout is None
+
+        await hub.async_refresh_modbus_data()
+        devices = [*hub.inverters, *hub.meters]
+
+        assert len(devices) == 6
+        assert all(device.online and device.snapshot for device in devices)
+
+        # later cycles carry devices over but keep their last values
+        await hub.async_refresh_modbus_data()
+        assert hub.carried_devices
+        assert all(device.online for device in devices)
+        assert hub.cycle_timeout is not None
+
+        await hub.shutdown()
+
+    asyncio.run(run())
+
+
+def test_undecoded_devices_are_unavailable(simulate):
+    server = simulate(units=(1, 2), meters=1)
+
+    async def run():
+        hub = make_hub(server, number_of_inverters=2)
+        await hub.async_refresh_modbus_data()
+        inverter = hub.inverters[1]
+
+        inverter.decoded_model.clear()
+        inverter.snapshot = {}
+        assert not inverter.online
+
+        hub._update_sleeping()
+        assert not hub.sleeping
+
+        await hub.shutdown()
+
+    asyncio.run(run())
@@ -0,0 +1,78 @@
+import asyncio
+from functools import partial
+
+from conftest import make_hub
+from homeassistant.core import HomeAssistant
+
+from custom_components.solaredge_modbus_multi.fleet import FleetScheduler
+
+
+def test_burst_expiry_restores_the_fleet_interval(simulate):
+    server = simulate(meters=0)
+
+    async def run():
+        hass = HomeAssistant()
+        fleet = FleetScheduler(hass)
+        hub = make_hub(
+            server,
+            hass,
+            detect_meters=False,
+            scan_interval=30,
+            interval_changed=partial(fleet.async_set_interval, "entry"),
+        )
+        await hub.async_refresh_modbus_data()
+        remove_site = fleet.async_add_site("entry", 30, hub.async_refresh_modbus_data)
+
+        inverter = hub.inverters[0]
+        groups = frozenset(group.name for group in inverter.register_groups)
+        hub.start_burst(hub.plan_burst({inverter: groups}, 5, 0.1))
+        assert fleet.sites["entry"].interval == 5
+
+        # a failing burst device keeps the hub online
+        server.context[1].illegal.append((inverter.model_address, 1))
+        inverter.last_read.clear()
+        assert await hub.async_refresh_modbus_data()
+        assert hub.online
+        assert not inverter.online
+
+        await asyncio.sleep(0.1)
+        await hub.async_refresh_modbus_data()
+        assert hub.burst is None
+        assert fleet.sites["entry"].interval == hub.scan_interval
+
+        remove_site()
+        await hub.shutdown()
+        await hass.async_stop(force=True)
+
+    asyncio.run(run())
+
+
+def test_stop_burst_restores_the_fleet_interval(simulate):
+    server = simulate(meters=0)
+
+    async def run():
+        hass = HomeAssistant()
+        fleet = FleetScheduler(hass)
+        hub = make_hub(
+            server,
+            hass,
+            detect_meters=False,
+            scan_interval=30,
+            interval_changed=partial(fleet.async_set_interval, "entry"),
+        )
+        await hub.async_refresh_modbus_data()
+        remove_site = fleet.async_add_site("entry", 30, hub.async_refresh_modbus_data)
+
+        inverter = hub.inverters[0]
+        groups = frozenset(group.name for group in inverter.register_groups)
+        hub.start_burst(hub.plan_burst({inverter: groups}, 5, 60))
+        assert fleet.sites["entry"].interval == 5
+
+        hub.stop_burst()
+        assert fleet.sites["entry"].interval == 30
+
+        remove_site()
+        await hub.shutdown()
+        await hass.async_stop(force=True)
+
+    asyncio.run(run())
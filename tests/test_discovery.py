@@ -0,0 +1,22 @@
+import asyncio
+
+import pytest
+from conftest import make_hub
+
+from custom_components.solaredge_modbus_multi.hub import HubInitFailed
+
+
+def test_missing_inverter_cancels_discovery(simulate):
+    server = simulate(units=(1, 2), meters=3, latency=0.05)
+    server.context[2].illegal.append((40000, 69))
+
+    async def run():
+        hub = make_hub(server, number_of_inverters=2)
+
+        with pytest.raises(HubInitFailed):
+            await hub.async_refresh_modbus_data()
+
+        assert not hub.is_socket_open()
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(run())
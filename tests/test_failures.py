@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from conftest import make_hub
+
+
+def test_single_device_failure_keeps_hub_online(simulate):
+    server = simulate(meters=0)
+
+    async def run():
+        hub = make_hub(server, detect_meters=False)
+        await hub.async_refresh_modbus_data()
+        inverter = hub.inverters[0]
+
+        server.context[1].illegal.append((inverter.model_address, 1))
+        assert await hub.async_refresh_modbus_data()
+
+        assert hub.online
+        assert hub.is_socket_open()
+        assert not inverter.online
+        assert inverter.failures == 1
+        assert inverter.retry_at > time.monotonic()
+
+        # backed off, so the next cycle doesn't read it
+        await hub.async_refresh_modbus_data()
+        assert inverter.failures == 1
+        assert hub.read_plan == {}
+
+        await hub.shutdown()
+
+    asyncio.run(run())
+
+
+def test_failed_device_recovers(simulate):
+    server = simulate(meters=1)
+
+    async def run():
+        hub = make_hub(server)
+        await hub.async_refresh_modbus_data()
+        meter = hub.meters[0]
+
+        server.context[1].illegal.append((meter.model_address, 1))
+        await hub.async_refresh_modbus_data()
+        assert not meter.online
+        assert hub.inverters[0].online
+
+        server.context[1].illegal.clear()
+        meter.retry_at = 0
+        await hub.async_refresh_modbus_data()
+        assert meter.online
+        assert meter.failures == 0
+
+        await hub.shutdown()
+
+    asyncio.run(run())
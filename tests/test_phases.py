@@ -0,0 +1,20 @@
+import asyncio
+
+from conftest import make_hub
+
+
+def test_single_phase_meter_keeps_line_voltage(simulate):
+    server = simulate(meters=1, meter_did=201)
+
+    async def run():
+        hub = make_hub(server)
+        await hub.async_refresh_modbus_data()
+        meter = hub.meters[0]
+
+        assert "AB" in meter.phases
+        assert meter.snapshot["AC_Voltage_AB"] == 400.0
+        assert meter.snapshot["AC_Voltage_BC"] is None
+
+        await hub.shutdown()
+
+    asyncio.run(run())
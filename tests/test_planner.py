@@ -0,0 +1,18 @@
+import pytest
+
+from custom_components.solaredge_modbus_multi.planner import RegisterBuffer, plan_reads
+
+
+def test_split_range_is_joined_from_its_reads():
+    plan = plan_reads([(40000, 300)])
+    assert plan == [(40000, 125), (40125, 125), (40250, 50)]
+
+    buffer = RegisterBuffer()
+    for address, count in plan:
+        buffer.add(address, list(range(address, address + count)))
+
+    assert buffer.get(40000, 300) == list(range(40000, 40300))
+    assert buffer.get(40120, 10) == list(range(40120, 40130))
+
+    with pytest.raises(KeyError):
+        buffer.get(40290, 20)
@@ -0,0 +1,51 @@
+import asyncio
+
+from conftest import make_hub
+from pymodbus.pdu import ModbusExceptions
+
+from custom_components.solaredge_modbus_multi.fleet import FleetScheduler
+from custom_components.solaredge_modbus_multi.proxy import (
+    READ_REQUEST,
+    ModbusProxy,
+    exception_pdu,
+)
+
+READ_COMMON = READ_REQUEST.pack(3, 40000, 2)
+
+
+def test_proxy_reads_share_the_host_slot(simulate):
+    server = simulate(meters=0)
+
+    async def run():
+        hub = make_hub(server, detect_meters=False)
+        await hub.async_refresh_modbus_data()
+        fleet = FleetScheduler(None)
+        proxy = ModbusProxy(
+            hub.connection,
+            lambda: fleet.async_connection("simulator"),
+            "127.0.0.1",
+            0,
+            0,
+        )
+        await proxy.async_start()
+        assert proxy._server.sockets[0].getsockname()[0] == "127.0.0.1"
+
+        async with fleet.async_connection("simulator"):
+            answer = asyncio.ensure_future(proxy.async_answer(1, READ_COMMON))
+            await asyncio.sleep(0.1)
+            assert not answer.done()
+
+        assert (await answer)[:2] == b"\x03\x04"
+
+        # a closed hub connection is not reopened and doesn't back off
+        hub.disconnect()
+        assert await proxy.async_answer(1, READ_COMMON) == exception_pdu(
+            3, ModbusExceptions.GatewayPathUnavailable
+        )
+        assert not hub.is_socket_open()
+        assert hub.connection.retry_in == 0
+
+        await proxy.async_stop()
+        await hub.shutdown()
+
+    asyncio.run(run())
@@ -0,0 +1,74 @@
+import asyncio
+from functools import partial
+
+from conftest import make_hub
+from homeassistant.core import HomeAssistant
+
+from custom_components.solaredge_modbus_multi import SolarEdgeCoordinator
+from custom_components.solaredge_modbus_multi.fleet import FleetScheduler
+
+
+def count_cycles(hub) -> list:
+    """Count the refresh cycles that read the bus."""
+    cycles = []
+    refresh = hub._async_refresh_modbus_data
+
+    async def counted():
+        cycles.append(None)
+        return await refresh()
+
+    hub._async_refresh_modbus_data = counted
+    return cycles
+
+
+def test_concurrent_coordinator_refreshes_share_one_cycle(simulate):
+    server = simulate(meters=1)
+
+    async def run():
+        hass = HomeAssistant()
+        fleet = FleetScheduler(hass)
+        hub = make_hub(server, hass, poll_slot=partial(fleet.async_poll, "simulator"))
+        coordinator = SolarEdgeCoordinator(hass, hub, 30)
+        await coordinator.async_refresh()
+        cycles = count_cycles(hub)
+
+        # a fleet poll and an entity update while the host is busy
+        async with fleet.async_connection("simulator"):
+            refreshes = asyncio.gather(
+                coordinator.async_refresh(), coordinator.async_request_refresh()
+            )
+            await asyncio.sleep(0.1)
+            assert not refreshes.done()
+
+        await refreshes
+        assert coordinator.last_update_success
+        assert len(cycles) == 1
+        assert hub.coalesced_refreshes == 1
+
+        await hub.shutdown()
+        await hass.async_stop(force=True)
+
+    asyncio.run(run())
+
+
+def test_refresh_requested_while_reading_follows_up(simulate):
+    server = simulate(meters=0, latency=0.05)
+
+    async def run():
+        hub = make_hub(server, detect_meters=False)
+        await hub.async_refresh_modbus_data()
+        cycles = count_cycles(hub)
+
+        first = asyncio.ensure_future(hub.async_refresh_modbus_data())
+        await asyncio.sleep(0.01)
+        assert hub._refresh_reading
+
+        await asyncio.gather(
+            first, hub.async_refresh_modbus_data(), hub.async_refresh_modbus_data()
+        )
+        assert len(cycles) == 2
+        assert hub.coalesced_refreshes == 1
+
+        await hub.shutdown()
+
+    asyncio.run(run())
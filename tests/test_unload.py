@@ -0,0 +1,56 @@
+import asyncio
+from functools import partial
+
+from conftest import make_hub
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.solaredge_modbus_multi import (
+    SolarEdgeCoordinator,
+    async_unload_entry,
+)
+from custom_components.solaredge_modbus_multi.const import DOMAIN
+from custom_components.solaredge_modbus_multi.fleet import FleetScheduler
+
+
+def test_unload_during_a_poll_keeps_the_connection_closed(simulate):
+    server = simulate(meters=1, latency=0.05)
+
+    async def run():
+        hass = HomeAssistant()
+        hass.config_entries = ConfigEntries(hass, {})
+        entry = ConfigEntry(1, DOMAIN, "test", {}, "user", entry_id="entry")
+        fleet = FleetScheduler(hass)
+        hub = make_hub(server, hass, poll_slot=partial(fleet.async_poll, "simulator"))
+        coordinator = SolarEdgeCoordinator(hass, hub, 1)
+        await coordinator.async_refresh()
+
+        hass.data[DOMAIN] = {
+            entry.entry_id: {
+                "hub": hub,
+                "coordinator": coordinator,
+                "remove_site": fleet.async_add_site(
+                    entry.entry_id, 1, coordinator.async_refresh
+                ),
+            }
+        }
+        site = fleet.sites[entry.entry_id]
+
+        while not site.polling:
+            await asyncio.sleep(0.01)
+
+        await asyncio.sleep(0.02)
+        assert hub.is_socket_open()
+        assert await async_unload_entry(hass, entry)
+        assert not fleet.sites
+        assert not hub.is_socket_open()
+
+        # neither the cancelled poll nor a later refresh reconnects
+        await asyncio.sleep(1.5)
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        assert not hub.is_socket_open()
+
+        await hass.async_stop(force=True)
+
+    asyncio.run(run())
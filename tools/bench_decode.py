@@ -0,0 +1,83 @@
+"""Compare register block decode throughput against BinaryPayloadDecoder.
+
+The legacy path rebuilds a BinaryPayloadDecoder and fills an OrderedDict with
+one decode call per field, as the hub did before the register maps.
+
+    python tools/bench_decode.py [--number N]
+"""
+import argparse
+import random
+import timeit
+from collections import OrderedDict
+
+from integration import load
+from pymodbus.constants import Endian
+from pymodbus.payload import BinaryPayloadDecoder
+
+registers = load("registers")
+
+LEGACY_DECODERS = {
+    "uint16": "decode_16bit_uint",
+    "int16": "decode_16bit_int",
+    "uint32": "decode_32bit_uint",
+    "int32": "decode_32bit_int",
+    "uint64": "decode_64bit_uint",
+    "float32": "decode_32bit_float",
+}
+
+LAYOUTS = [
+    ("inverter", registers.INVERTER_MODEL),
+    ("meter", registers.METER_MODEL),
+    ("battery", registers.BATTERY_MODEL),
+]
+
+
+def legacy_decoder(register_map):
+    """Return a decode function equivalent to the old per-field code."""
+    fields = [
+        (name, LEGACY_DECODERS[field_type]) for name, field_type in register_map.layout
+    ]
+    wordorder = Endian.Little if register_map.word_order == "<" else Endian.Big
+
+    def decode(data):
+        decoder = BinaryPayloadDecoder.fromRegisters(
+            data, byteorder=Endian.Big, wordorder=wordorder
+        )
+        return OrderedDict(
+            [(name, getattr(decoder, method)()) for name, method in fields]
+        )
+
+    return decode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+
+    for name, register_map in LAYOUTS:
+        data = [rng.randrange(0x10000) for _ in range(register_map.count)]
+        legacy = legacy_decoder(register_map)
+
+        new = register_map.decode(data)
+        old = legacy(data)
+        assert list(new.keys()) == list(old.keys())
+        assert all(a == b or a != a for a, b in zip(new, old.values()))
+
+        legacy_time = min(timeit.repeat(lambda: legacy(data), number=args.number))
+        struct_time = min(
+            timeit.repeat(lambda: register_map.decode(data), number=args.number)
+        )
+
+        print(
+            f"{name:8} {register_map.count:3} regs  "
+            f"legacy {args.number / legacy_time:10.0f}/s  "
+            f"struct {args.number / struct_time:10.0f}/s  "
+            f"speedup {legacy_time / struct_time:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
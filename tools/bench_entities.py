@@ -0,0 +1,178 @@
+"""Sensor platform startup and memory benchmark against the simulator.
+
+Discovers a simulated site, then measures what the sensor platform costs on
+top of the hub: module import time, async_setup_entry wall time, memory held
+by the created entities and the time to write every entity state once.
+
+    python tools/bench_entities.py
+    python tools/bench_entities.py --inverters 32 --meters 3 --batteries 2
+
+Import time is measured in a fresh interpreter with Home Assistant's sensor
+component already imported, so it only covers the integration modules. State
+writes go to a bare Home Assistant state machine without an entity platform.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import simulator
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from integration import PACKAGE, load
+
+hub_module = load("hub")
+sensor = load("sensor")
+
+IMPORT_SCRIPT = """
+import time
+import homeassistant.components.sensor
+import homeassistant.helpers.update_coordinator
+from integration import load
+started = time.perf_counter()
+load("sensor")
+print(time.perf_counter() - started)
+"""
+
+
+class BenchCoordinator:
+    """Coordinator stand-in, entities are updated by the benchmark."""
+
+    def async_add_listener(self, update_callback, context=None):
+        return lambda: None
+
+
+def import_time(repeat: int) -> float:
+    """Median seconds to import the sensor platform in a new interpreter."""
+    samples = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT],
+                cwd=Path(__file__).resolve().parent,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(repeat)
+    ]
+    return statistics.median(samples)
+
+
+async def run(args, config_dir: str) -> dict:
+    hass = HomeAssistant()
+    hass.config.config_dir = config_dir
+    await er.async_load(hass)
+
+    hub = hub_module.SolarEdgeModbusMultiHub(
+        hass,
+        "bench",
+        "127.0.0.1",
+        args.port,
+        args.inverters,
+        1,
+        args.meters > 0,
+        args.batteries > 0,
+        True,
+        True,
+        True,
+    )
+    await hub.async_refresh_modbus_data()
+
+    config_entry = ConfigEntry(
+        version=1,
+        domain=PACKAGE,
+        title="bench",
+        data={"name": "bench"},
+        source="user",
+        options={},
+    )
+    hass.data[PACKAGE] = {
+        config_entry.entry_id: {"hub": hub, "coordinator": BenchCoordinator()}
+    }
+
+    entities = []
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+    await sensor.async_setup_entry(hass, config_entry, entities.extend)
+    setup = time.perf_counter() - started
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    memory = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    for index, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"sensor.bench_{index}"
+
+    writes = []
+    for _ in range(args.cycles):
+        started = time.perf_counter()
+        for entity in entities:
+            entity.async_write_ha_state()
+        writes.append(time.perf_counter() - started)
+
+    await hub.shutdown()
+
+    return {
+        "devices": {
+            "inverters": len(hub.inverters),
+            "meters": len(hub.meters),
+            "batteries": len(hub.batteries),
+        },
+        "entities": len(entities),
+        "classes": len({type(entity) for entity in entities}),
+        "setup_ms": setup * 1000,
+        "memory_kib": memory / 1024,
+        "bytes_per_entity": memory / len(entities),
+        "write_all_ms": statistics.median(writes) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inverters", type=int, default=32)
+    parser.add_argument("--meters", type=int, default=3)
+    parser.add_argument("--batteries", type=int, default=0)
+    parser.add_argument("--cycles", type=int, default=10, help="state writes")
+    parser.add_argument("--imports", type=int, default=5, help="import samples")
+    parser.add_argument("--port", type=int, default=15020)
+    args = parser.parse_args()
+
+    # entities without a platform log a warning on their first write
+    logging.disable(logging.WARNING)
+
+    server = simulator.start(
+        args.port,
+        units=range(1, args.inverters + 1),
+        meters=args.meters,
+        batteries=args.batteries,
+        update_interval=None,
+    )
+
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            result = asyncio.run(run(args, config_dir))
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    result["import_ms"] = import_time(args.imports) * 1000
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
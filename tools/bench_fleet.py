@@ -0,0 +1,177 @@
+"""Fleet polling benchmark of many sites against the simulator.
+
+Every site is a hub with its own connection to a different loopback address
+of one simulator. Sites are polled for a number of scan intervals in two
+modes: "timers" starts every site at the same moment of each interval
+without connection limits, as coordinator timers of config entries loaded
+together do, "fleet" lets the fleet scheduler spread and limit the polls.
+
+    python tools/bench_fleet.py
+    python tools/bench_fleet.py --sites 200 --interval 10 --latency 0.02
+
+Latency is measured from the start of a poll, including the wait for a
+connection, to its end. Sites reach the simulator at 127.0.0.2 onwards,
+which needs a system routing all of 127.0.0.0/8 to loopback, as Linux does.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import simulator
+from homeassistant.core import HomeAssistant
+from integration import load
+
+fleet_module = load("fleet")
+hub_module = load("hub")
+
+
+class Peaks:
+    """Polls and executor jobs in flight, and their maximum."""
+
+    def __init__(self) -> None:
+        self.polls = 0
+        self.polls_max = 0
+        self.jobs = 0
+        self.jobs_max = 0
+
+    def instrument(self, hass: HomeAssistant) -> None:
+        add_executor_job = hass.async_add_executor_job
+
+        async def counted_job(target, *args):
+            self.jobs += 1
+            self.jobs_max = max(self.jobs_max, self.jobs)
+            try:
+                return await add_executor_job(target, *args)
+            finally:
+                self.jobs -= 1
+
+        hass.async_add_executor_job = counted_job
+
+    def poll(self, fleet, host: str, hub):
+        async def refresh() -> None:
+            async with fleet.async_poll(host):
+                self.polls += 1
+                self.polls_max = max(self.polls_max, self.polls)
+                try:
+                    await hub.async_refresh_modbus_data()
+                finally:
+                    self.polls -= 1
+
+        return refresh
+
+
+async def run(args, mode: str) -> dict:
+    hass = HomeAssistant()
+    peaks = Peaks()
+    peaks.instrument(hass)
+
+    if mode == "fleet":
+        fleet = fleet_module.FleetScheduler(hass)
+    else:
+        fleet = fleet_module.FleetScheduler(hass, args.sites, args.sites)
+
+    sites = []
+    for index in range(args.sites):
+        host = f"127.0.0.{index + 2}"
+        hub = hub_module.SolarEdgeModbusMultiHub(
+            hass,
+            f"site{index}",
+            host,
+            args.port,
+            1,
+            1,
+            False,
+            False,
+            True,
+            True,
+            args.client == "async",
+            args.interval,
+        )
+        sites.append((hub, peaks.poll(fleet, host, hub)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(refresh() for _, refresh in sites))
+    startup = time.perf_counter() - started
+
+    fleet.cycles = fleet_module.PollStats(args.sites * args.cycles)
+    fleet.waits = fleet_module.PollStats(args.sites * args.cycles)
+    fleet.backlog_max = 0
+    peaks.polls_max = peaks.jobs_max = 0
+
+    if mode == "fleet":
+        removes = [
+            fleet.async_add_site(f"site{index}", args.interval, refresh)
+            for index, (_, refresh) in enumerate(sites)
+        ]
+
+        await asyncio.sleep(args.interval * args.cycles)
+
+        for remove in removes:
+            remove()
+
+    else:
+        for _ in range(args.cycles):
+            tick = asyncio.sleep(args.interval)
+            await asyncio.gather(*(refresh() for _, refresh in sites))
+            await tick
+
+    while peaks.polls:
+        await asyncio.sleep(0.1)
+
+    online = sum(hub.online for hub, _ in sites)
+
+    for hub, _ in sites:
+        await hub.shutdown()
+
+    await hass.async_stop(force=True)
+
+    result = fleet.as_dict()
+    return {
+        "mode": mode,
+        "startup_s": round(startup, 2),
+        "online": online,
+        "polls": fleet.cycles.as_dict()["polls"],
+        "polls_max": peaks.polls_max,
+        "executor_jobs_max": peaks.jobs_max,
+        "backlog_max": result["backlog_max"],
+        "overruns": result["overruns"],
+        "cycle_latency_p50_ms": result["cycle_latency_p50_ms"],
+        "cycle_latency_p95_ms": result["cycle_latency_p95_ms"],
+        "cycle_latency_max_ms": result["cycle_latency_max_ms"],
+        "failure_rate": result["failure_rate"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, default=200)
+    parser.add_argument("--interval", type=int, default=10, help="seconds")
+    parser.add_argument("--cycles", type=int, default=3, help="scan intervals")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--client", choices=["sync", "async"], default="sync")
+    parser.add_argument(
+        "--modes", nargs="+", choices=["timers", "fleet"], default=["timers", "fleet"]
+    )
+    parser.add_argument("--port", type=int, default=15020)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    server = simulator.start(
+        args.port, host="0.0.0.0", latency=args.latency, update_interval=None
+    )
+
+    try:
+        results = [asyncio.run(run(args, mode)) for mode in args.modes]
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
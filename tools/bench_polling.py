@@ -0,0 +1,282 @@
+"""End-to-end polling benchmark of the hub against the simulator.
+
+Runs async_refresh_modbus_data for each combination of inverters, meters and
+batteries per inverter, with the synchronous and asyncio Modbus clients and
+with the connection kept open or reopened every cycle. Results are written
+as JSON so releases can be compared.
+
+    python tools/bench_polling.py --output results.json
+    python tools/bench_polling.py --inverters 1 --meters 1 --batteries 0 1
+
+Each topology is measured in two phases: "full" cycles read every register
+group, "fast" cycles are the steady state where slow tier groups are not due.
+Bytes are Modbus/TCP frame sizes (MBAP header and PDU) of every request and
+response, without TCP/IP overhead.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pymodbus
+import simulator
+from integration import PACKAGE_DIR, load
+
+hub_module = load("hub")
+
+# MBAP header, function code, address and count
+REQUEST_BYTES = 12
+# MBAP header, function code and byte count or exception code
+RESPONSE_HEADER_BYTES = 9
+
+
+class BenchHass:
+    """Stand-in for Home Assistant counting executor jobs."""
+
+    def __init__(self) -> None:
+        self.executor_jobs = 0
+
+    async def async_add_executor_job(self, target, *args):
+        self.executor_jobs += 1
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+class Counters:
+    """Totals collected by the instrumented hub."""
+
+    def __init__(self, hass: BenchHass) -> None:
+        self._hass = hass
+        self.reset()
+
+    def reset(self) -> None:
+        self.transactions = 0
+        self.bytes = 0
+        self.decode_cpu = 0.0
+        self.connects = 0
+        self.connect_time = 0.0
+        self._hass.executor_jobs = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "transactions": self.transactions,
+            "executor_jobs": self._hass.executor_jobs,
+            "bytes": self.bytes,
+            "decode_cpu": self.decode_cpu,
+            "connects": self.connects,
+            "connect_time": self.connect_time,
+        }
+
+
+def instrument_hub(hub, counters: Counters) -> None:
+    """Count transactions, bytes and connection time of a hub."""
+    read = hub.async_read_holding_registers
+    connect = hub.connect
+
+    async def counted_read(unit, address, count):
+        result = await read(unit, address, count)
+        counters.transactions += 1
+        counters.bytes += REQUEST_BYTES
+
+        if not result.isError():
+            counters.bytes += RESPONSE_HEADER_BYTES + 2 * len(result.registers)
+        elif hasattr(result, "exception_code"):
+            counters.bytes += RESPONSE_HEADER_BYTES
+
+        return result
+
+    async def timed_connect():
+        started = time.perf_counter()
+        await connect()
+        counters.connects += 1
+        counters.connect_time += time.perf_counter() - started
+
+    hub.async_read_holding_registers = counted_read
+    hub.connect = timed_connect
+
+
+def instrument_devices(hub, counters: Counters) -> None:
+    """Measure CPU time spent decoding in every device."""
+    for device in [*hub.inverters, *hub.meters, *hub.batteries]:
+
+        def timed_decode(buffer, groups, decode=device.decode_modbus_data):
+            started = time.thread_time()
+            decode(buffer, groups)
+            counters.decode_cpu += time.thread_time() - started
+
+        device.decode_modbus_data = timed_decode
+
+
+def summarize(samples: list, cycles: int) -> dict:
+    """Per cycle statistics of a measured phase."""
+    wall = sorted(sample["wall"] for sample in samples)
+    totals = {
+        key: sum(sample[key] for sample in samples)
+        for key in samples[0]
+        if key != "wall"
+    }
+
+    return {
+        "cycles": cycles,
+        "wall_ms": {
+            "mean": statistics.mean(wall) * 1000,
+            "median": statistics.median(wall) * 1000,
+            "p95": wall[min(len(wall) - 1, int(len(wall) * 0.95))] * 1000,
+            "max": wall[-1] * 1000,
+        },
+        "transactions": totals["transactions"] / cycles,
+        "executor_jobs": totals["executor_jobs"] / cycles,
+        "bytes": totals["bytes"] / cycles,
+        "decode_cpu_ms": totals["decode_cpu"] * 1000 / cycles,
+        "connects": totals["connects"] / cycles,
+        "connect_ms": totals["connect_time"] * 1000 / cycles,
+    }
+
+
+async def measure(hub, counters: Counters, cycles: int, full: bool) -> dict:
+    samples = []
+
+    for _ in range(cycles):
+        if full:
+            for device in [*hub.inverters, *hub.meters, *hub.batteries]:
+                device.last_read.clear()
+
+        counters.reset()
+        started = time.perf_counter()
+        await hub.async_refresh_modbus_data()
+        sample = counters.snapshot()
+        sample["wall"] = time.perf_counter() - started
+        samples.append(sample)
+
+    return summarize(samples, cycles)
+
+
+async def run_hub(port: int, topology: dict, config: dict, cycles: int) -> dict:
+    hass = BenchHass()
+    counters = Counters(hass)
+    hub = hub_module.SolarEdgeModbusMultiHub(
+        hass,
+        "bench",
+        "127.0.0.1",
+        port,
+        topology["inverters"],
+        1,
+        topology["meters"] > 0,
+        topology["batteries"] > 0,
+        True,
+        config["keep_modbus_open"],
+        config["async_modbus"],
+    )
+    instrument_hub(hub, counters)
+
+    started = time.perf_counter()
+    await hub.async_refresh_modbus_data()
+    setup = time.perf_counter() - started
+
+    found = (len(hub.inverters), len(hub.meters), len(hub.batteries))
+    expected = (
+        topology["inverters"],
+        topology["inverters"] * topology["meters"],
+        topology["inverters"] * topology["batteries"],
+    )
+    if found != expected:
+        raise RuntimeError(f"Discovered {found} devices, expected {expected}")
+
+    instrument_devices(hub, counters)
+
+    try:
+        return {
+            "setup_ms": setup * 1000,
+            "full": await measure(hub, counters, cycles, True),
+            "fast": await measure(hub, counters, cycles, False),
+        }
+
+    finally:
+        await hub.shutdown()
+
+
+def metadata(args) -> dict:
+    manifest = json.loads((PACKAGE_DIR / "manifest.json").read_text())
+
+    return {
+        "version": manifest["version"],
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pymodbus": pymodbus.__version__,
+        "platform": platform.platform(),
+        "latency": args.latency,
+        "cycles": args.cycles,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inverters", type=int, nargs="+", default=[1, 10, 32])
+    parser.add_argument("--meters", type=int, nargs="+", default=[0, 1, 2, 3])
+    parser.add_argument("--batteries", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument(
+        "--clients", nargs="+", choices=["sync", "async"], default=["sync", "async"]
+    )
+    parser.add_argument(
+        "--keep-open", nargs="+", choices=["yes", "no"], default=["yes", "no"]
+    )
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--port", type=int, default=15020, help="first port")
+    parser.add_argument("--output", type=Path, help="default: standard output")
+    args = parser.parse_args()
+
+    results = []
+    port = args.port
+
+    for inverters, meters, batteries in itertools.product(
+        args.inverters, args.meters, args.batteries
+    ):
+        topology = {"inverters": inverters, "meters": meters, "batteries": batteries}
+        server = simulator.start(
+            port,
+            units=range(1, inverters + 1),
+            meters=meters,
+            batteries=batteries,
+            latency=args.latency,
+            update_interval=None,
+        )
+
+        try:
+            for client, keep_open in itertools.product(args.clients, args.keep_open):
+                config = {
+                    "async_modbus": client == "async",
+                    "keep_modbus_open": keep_open == "yes",
+                }
+                result = asyncio.run(run_hub(port, topology, config, args.cycles))
+                results.append({**topology, **config, **result})
+
+                print(
+                    f"{inverters:2} inv {meters} mtr {batteries} bat "
+                    f"{client:5} keep_open={keep_open:3} "
+                    f"full {result['full']['wall_ms']['median']:8.2f} ms "
+                    f"fast {result['fast']['wall_ms']['median']:8.2f} ms "
+                    f"{result['full']['transactions']:4.0f} reads",
+                    file=sys.stderr,
+                )
+
+        finally:
+            server.shutdown()
+            server.server_close()
+            port += 1
+
+    report = json.dumps({"metadata": metadata(args), "results": results}, indent=2)
+
+    if args.output:
+        args.output.write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Import integration modules without loading Home Assistant.
+
+The package __init__ sets up the Home Assistant integration, so tools register
+an empty package for custom_components/solaredge_modbus_multi and import the
+modules they need from it directly.
+"""
+import importlib
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+PACKAGE = "solaredge_modbus_multi"
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / PACKAGE
+
+
+def load(module: str):
+    """Return the named integration module, e.g. load("registers")."""
+    if PACKAGE not in sys.modules:
+        spec = importlib.machinery.ModuleSpec(PACKAGE, None, is_package=True)
+        package = importlib.util.module_from_spec(spec)
+        package.__path__ = [str(PACKAGE_DIR)]
+        sys.modules[PACKAGE] = package
+
+    return importlib.import_module(f"{PACKAGE}.{module}")
@@ -0,0 +1,185 @@
+"""Poll a SolarEdge host without Home Assistant and stream device snapshots.
+
+Discovers the inverters with the given unit IDs and their meters and
+batteries, then polls them every interval and writes the decoded, scaled
+snapshot of every device as JSON lines or as CSV rows of time, device, field
+and value. Timing statistics of the cycles and of every device are printed
+to standard error when polling ends.
+
+    python tools/poller.py 192.168.1.10 --units 1-3 --batteries
+    python tools/poller.py 127.0.0.1 --port 15020 --interval 0 --cycles 1000 \\
+        --full --format csv --output /dev/null --profile poll.prof
+
+An interval of 0 polls back to back. With --full every register group is
+read every cycle instead of slow tier groups only when they are due.
+"""
+import argparse
+import asyncio
+import cProfile
+import csv
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from integration import load
+
+hub_module = load("hub")
+
+
+def unit_range(value: str) -> range:
+    first, _, last = value.partition("-")
+    try:
+        units = range(int(first), int(last or first) + 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a unit ID or range: {value}")
+
+    if not units or units[0] < 1 or units[-1] > 247:
+        raise argparse.ArgumentTypeError(f"unit IDs must be 1 to 247: {value}")
+
+    return units
+
+
+class SnapshotWriter:
+    """Writes device snapshots as JSON lines or CSV."""
+
+    def __init__(self, output, output_format: str) -> None:
+        self._output = output
+        self._csv = None
+
+        if output_format == "csv":
+            self._csv = csv.writer(output)
+            self._csv.writerow(["time", "device", "field", "value"])
+
+    def write(self, timestamp: str, device) -> None:
+        if self._csv is None:
+            row = {
+                "time": timestamp,
+                "device": device.uid_base,
+                "online": device.online,
+                **device.snapshot,
+            }
+            self._output.write(json.dumps(row, default=str) + "\n")
+            return
+
+        self._csv.writerow([timestamp, device.uid_base, "online", device.online])
+        for field, value in device.snapshot.items():
+            self._csv.writerow([timestamp, device.uid_base, field, value])
+
+
+async def poll(args, writer: SnapshotWriter, cycles: list, devices: list) -> None:
+    hub = hub_module.SolarEdgeModbusMultiHub(
+        None,
+        args.host,
+        args.host,
+        args.port,
+        len(args.units),
+        args.units[0],
+        args.meters,
+        args.batteries,
+        True,
+        args.keep_open,
+        args.client == "async",
+        max(args.interval, 1),
+    )
+
+    try:
+        await hub.async_refresh_modbus_data()
+    except hub_module.SolarEdgeException as e:
+        raise SystemExit(f"Discovery failed: {e}")
+
+    devices.extend([*hub.inverters, *hub.meters, *hub.batteries])
+    print(f"Polling {', '.join(device.name for device in devices)}", file=sys.stderr)
+
+    try:
+        while not args.cycles or len(cycles) < args.cycles:
+            if args.full:
+                for device in devices:
+                    device.last_read.clear()
+
+            started = time.monotonic()
+            try:
+                await hub.async_refresh_modbus_data()
+            except hub_module.SolarEdgeException as e:
+                print(f"Cycle failed: {e}", file=sys.stderr)
+            cycles.append(time.monotonic() - started)
+
+            timestamp = datetime.now(timezone.utc).isoformat()
+            for device in devices:
+                writer.write(timestamp, device)
+            args.output.flush()
+
+            await asyncio.sleep(max(0, started + args.interval - time.monotonic()))
+
+    finally:
+        await hub.shutdown()
+
+
+def print_statistics(cycles: list, devices: list) -> None:
+    if not cycles:
+        return
+
+    ordered = sorted(cycles)
+    p95 = ordered[max(0, -(-len(ordered) * 95 // 100) - 1)]
+    print(
+        f"{len(cycles)} cycles, median {statistics.median(cycles) * 1000:.1f} ms, "
+        f"p95 {p95 * 1000:.1f} ms, max {ordered[-1] * 1000:.1f} ms",
+        file=sys.stderr,
+    )
+
+    for device in devices:
+        stats = device.stats.as_dict()
+        print(
+            f"{device.name}: reads p50 {stats['latency_p50_ms']} ms, "
+            f"p95 {stats['latency_p95_ms']} ms, "
+            f"failure rate {stats['failure_rate']}%",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("host")
+    parser.add_argument("--port", type=int, default=1502)
+    parser.add_argument(
+        "--units", type=unit_range, default=range(1, 2), help="inverters, e.g. 1-3"
+    )
+    parser.add_argument("--meters", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--batteries", action="store_true")
+    parser.add_argument("--client", choices=["sync", "async"], default="async")
+    parser.add_argument(
+        "--keep-open", action=argparse.BooleanOptionalAction, default=True
+    )
+    parser.add_argument("--interval", type=float, default=10, help="seconds")
+    parser.add_argument("--cycles", type=int, default=0, help="default: until ^C")
+    parser.add_argument("--full", action="store_true")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--output", type=argparse.FileType("w"), default=sys.stdout)
+    parser.add_argument("--profile", help="write cProfile statistics of polling")
+    args = parser.parse_args()
+
+    writer = SnapshotWriter(args.output, args.format)
+    cycles = []
+    devices = []
+    profiler = cProfile.Profile() if args.profile else None
+
+    if profiler:
+        profiler.enable()
+
+    try:
+        asyncio.run(poll(args, writer, cycles, devices))
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+
+    print_statistics(cycles, devices)
+
+
+if __name__ == "__main__":
+    main()
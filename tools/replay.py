@@ -0,0 +1,124 @@
+"""Poll a raw read capture through the hub instead of a live inverter.
+
+Captures are written by the integration with the "Capture Raw Modbus Reads"
+option. Replay discovers the captured devices and polls them, reading every
+register group each cycle, and prints the time of each cycle. Device
+snapshots of every cycle can be written as JSON to compare decoding between
+releases.
+
+    python tools/replay.py solaredge_modbus_multi.<entry_id>.capture
+    python tools/replay.py CAPTURE --inverters 2 --batteries --output cycles.json
+
+Rotated backups of the capture (CAPTURE.1, CAPTURE.2, ...) are replayed
+first. With --realtime every read takes as long as it did when captured.
+Discovery replays the reads made when the integration was loaded, so those
+must not have been rotated out of the capture.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from integration import load
+
+capture = load("capture")
+connection = load("connection")
+hub_module = load("hub")
+
+
+def load_records(path: str) -> list:
+    records = []
+
+    for name in capture.capture_files(path):
+        records.extend(capture.read_capture(name))
+
+    if not records:
+        raise SystemExit(f"No captured reads in {path}")
+
+    return records
+
+
+async def replay(args, records: list) -> list:
+    client = capture.ReplayModbusClient(records, args.realtime)
+    hub = hub_module.SolarEdgeModbusMultiHub(
+        None,
+        "replay",
+        "replay",
+        0,
+        args.inverters,
+        args.device_id,
+        args.meters,
+        args.batteries,
+        True,
+        True,
+        True,
+    )
+    hub.connection = connection.ModbusConnection(
+        None, "replay", 0, True, probe_unit=args.device_id, client=client
+    )
+
+    try:
+        await hub.async_refresh_modbus_data()
+    except hub_module.HubInitFailed as e:
+        raise SystemExit(f"Capture does not replay discovery: {e}")
+
+    devices = [*hub.inverters, *hub.meters, *hub.batteries]
+    print(f"Discovered {', '.join(device.name for device in devices)}", file=sys.stderr)
+
+    cycles = []
+    wall = []
+
+    for _ in range(args.cycles):
+        for device in devices:
+            device.last_read.clear()
+
+        reads = client.reads
+        started = time.perf_counter()
+        await hub.async_refresh_modbus_data()
+        wall.append(time.perf_counter() - started)
+
+        cycles.append(
+            {
+                device.uid_base: {"online": device.online, **device.snapshot}
+                for device in devices
+            }
+        )
+        print(
+            f"cycle {len(cycles):3} {wall[-1] * 1000:8.2f} ms "
+            f"{client.reads - reads:3} reads",
+            file=sys.stderr,
+        )
+
+    await hub.shutdown()
+
+    print(
+        f"{len(records)} captured reads, median cycle "
+        f"{statistics.median(wall) * 1000:.2f} ms",
+        file=sys.stderr,
+    )
+    return cycles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", help="capture file")
+    parser.add_argument("--inverters", type=int, default=1)
+    parser.add_argument("--device-id", type=int, default=1, help="first inverter")
+    parser.add_argument("--meters", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--batteries", action="store_true")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--realtime", action="store_true")
+    parser.add_argument("--output", type=Path, help="device snapshots as JSON")
+    args = parser.parse_args()
+
+    cycles = asyncio.run(replay(args, load_records(args.capture)))
+
+    if args.output:
+        args.output.write_text(json.dumps(cycles, indent=2, default=str) + "\n")
+
+
+if __name__ == "__main__":
+    main()
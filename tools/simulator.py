@@ -0,0 +1,398 @@
+"""SolarEdge Modbus/TCP simulator for tests and benchmarks.
+
+Serves the SunSpec blocks of a SolarEdge leader inverter on any number of
+unit IDs: the common model at 40000, an inverter model (101/102/103), an
+optional MMPPT model 160 at 40121, meters (201-204) at the offsets used by
+SolarEdgeMeter, and batteries at 57600/57856 with little-endian word order.
+Registers of missing devices answer IllegalAddress, like a real inverter.
+
+    python tools/simulator.py --units 1 2 --meters 2 --batteries 1 \\
+        --latency 0.03 --drop-rate 0.01 --illegal 1:40188+107
+"""
+import argparse
+import logging
+import math
+import random
+import socket
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from integration import load
+from pymodbus.datastore import (
+    ModbusServerContext,
+    ModbusSlaveContext,
+    ModbusSparseDataBlock,
+)
+from pymodbus.server.sync import ModbusConnectedRequestHandler, ModbusTcpServer
+
+registers = load("registers")
+
+_LOGGER = logging.getLogger(__name__)
+
+SUNSPEC_ID = 0x53756E53
+METER_OFFSETS = {1: 121, 2: 295, 3: 469}
+MMPPT_OFFSETS = {0: 0, 2: 50, 3: 70}
+BATTERY_ADDRESSES = {1: 57600, 2: 57856}
+
+# model registers for each phase that a single or split phase device lacks
+THREE_PHASE_ONLY = {
+    101: ["AC_Current_B", "AC_Current_C", "AC_Voltage_BC", "AC_Voltage_CA"]
+    + ["AC_Voltage_BN", "AC_Voltage_CN"],
+    102: ["AC_Current_C", "AC_Voltage_CA", "AC_Voltage_CN"],
+    201: ["AC_Current_B", "AC_Current_C", "AC_Voltage_BN", "AC_Voltage_CN"]
+    + ["AC_Voltage_BC", "AC_Voltage_CA"],
+    202: ["AC_Current_C", "AC_Voltage_CN", "AC_Voltage_BC", "AC_Voltage_CA"],
+}
+
+
+def common_block(manufacturer: str, model: str, serial: str, address: int) -> List:
+    return registers.COMMON_MODEL.encode(
+        {
+            "C_Manufacturer": manufacturer,
+            "C_Model": model,
+            "C_Option": "",
+            "C_Version": "0004.0018.0036",
+            "C_SerialNumber": serial,
+            "C_Device_address": address,
+        }
+    )
+
+
+class SimulatedUnit:
+    """Register values of one inverter unit ID and its meters and batteries."""
+
+    def __init__(
+        self,
+        unit: int,
+        meters: int = 1,
+        batteries: int = 0,
+        mmppt_units: int = 0,
+        inverter_did: int = 103,
+        meter_did: int = 203,
+    ) -> None:
+        self.unit = unit
+        self.meters = list(range(1, meters + 1))
+        self.batteries = list(range(1, batteries + 1))
+        self.mmppt_units = mmppt_units
+        self.inverter_did = inverter_did
+        self.meter_did = meter_did
+        self.energy = 12345678
+        self.values: Dict[int, int] = {}
+
+        self._put(40000, registers.COMMON_IDENT.encode([SUNSPEC_ID, 1, 65]))
+        self._put(40004, common_block("SolarEdge", "SE10K-RWS", f"7E{unit:06X}", unit))
+
+        if mmppt_units:
+            self._put(40121, self._mmppt_block())
+
+        for meter_id in self.meters:
+            start = 40000 + METER_OFFSETS[meter_id] + MMPPT_OFFSETS[mmppt_units]
+            self._put(start, registers.MODEL_IDENT.encode([1, 65]))
+            self._put(
+                start + 2,
+                common_block("SolarEdge", "WND-3Y-400-MB", f"M{unit:03d}{meter_id}", 2),
+            )
+
+        for battery_id in self.batteries:
+            start = BATTERY_ADDRESSES[battery_id]
+            self._put(start, self._battery_common(battery_id))
+            # reserved registers up to the battery model
+            self._put(start + registers.BATTERY_COMMON.count, [0] * 32)
+
+        self.update(0.0)
+
+    def _put(self, address: int, block: Iterable[int]) -> None:
+        for offset, value in enumerate(block):
+            self.values[address + offset] = value
+
+    def _mmppt_block(self) -> List[int]:
+        header = registers.MMPPT_COMMON.encode(
+            {
+                "mmppt_DID": 160,
+                "mmppt_Length": 8 + 20 * self.mmppt_units,
+                "mmppt_DCA_SF": -2,
+                "mmppt_DCV_SF": -1,
+                "mmppt_DCW_SF": 0,
+                "mmppt_DCWH_SF": 0,
+                "mmppt_Events": 0,
+                "mmppt_Units": self.mmppt_units,
+                "mmppt_TmsPer": 0,
+            }
+        )
+        return header + [0] * (20 * self.mmppt_units)
+
+    def _battery_common(self, battery_id: int) -> List[int]:
+        serial = f"B{self.unit:03d}{battery_id}"
+        return registers.BATTERY_COMMON.encode(
+            {
+                "B_Manufacturer": f"LGES{serial}",
+                "B_Model": f"RESU10H{serial}",
+                "B_Version": "DCDC 1.3.4",
+                "B_SerialNumber": serial,
+                "B_Device_Address": 15,
+                "Reserved": 0,
+                "B_RatedEnergy": 9800.0,
+                "B_MaxChargePower": 5000.0,
+                "B_MaxDischargePower": 5000.0,
+                "B_MaxChargePeakPower": 7000.0,
+                "B_MaxDischargePeakPower": 7000.0,
+            }
+        )
+
+    def update(self, elapsed: float) -> None:
+        """Recalculate measurements for a time in seconds since start."""
+        power = int(5000 + 2000 * math.sin(elapsed / 60) + random.randint(-50, 50))
+        self.energy += max(power, 0) // 3600
+
+        inverter = {
+            "C_SunSpec_DID": self.inverter_did,
+            "C_SunSpec_Length": 50,
+            "AC_Current": power * 100 // 230,
+            "AC_Current_A": power * 100 // 690,
+            "AC_Current_B": power * 100 // 690,
+            "AC_Current_C": power * 100 // 690,
+            "AC_Current_SF": -2,
+            "AC_Voltage_AB": 4000,
+            "AC_Voltage_BC": 4001,
+            "AC_Voltage_CA": 4002,
+            "AC_Voltage_AN": 2300 + random.randint(-5, 5),
+            "AC_Voltage_BN": 2301,
+            "AC_Voltage_CN": 2302,
+            "AC_Voltage_SF": -1,
+            "AC_Power": power,
+            "AC_Power_SF": 0,
+            "AC_Frequency": 5000,
+            "AC_Frequency_SF": -2,
+            "AC_VA": power,
+            "AC_VA_SF": 0,
+            "AC_var": 0,
+            "AC_var_SF": 0,
+            "AC_PF": 100,
+            "AC_PF_SF": 0,
+            "AC_Energy_WH": self.energy,
+            "AC_Energy_WH_SF": 0,
+            "I_DC_Current": power * 100 // 750,
+            "I_DC_Current_SF": -2,
+            "I_DC_Voltage": 7500,
+            "I_DC_Voltage_SF": -1,
+            "I_DC_Power": power + 50,
+            "I_DC_Power_SF": 0,
+            "I_Temp_Cab": -32768,
+            "I_Temp_Sink": 3500,
+            "I_Temp_Trns": -32768,
+            "I_Temp_Other": -32768,
+            "I_Temp_SF": -2,
+            "I_Status": 4,
+            "I_Status_Vendor": 0,
+        }
+        for field in THREE_PHASE_ONLY.get(self.inverter_did, []):
+            inverter[field] = 0xFFFF
+        self._put(40069, registers.INVERTER_MODEL.encode(inverter))
+
+        for meter_id in self.meters:
+            start = 40000 + METER_OFFSETS[meter_id] + MMPPT_OFFSETS[self.mmppt_units]
+            self._put(start + 67, registers.METER_MODEL.encode(self._meter(power)))
+
+        for battery_id in self.batteries:
+            self._put(
+                BATTERY_ADDRESSES[battery_id] + 108,
+                registers.BATTERY_MODEL.encode(self._battery(power)),
+            )
+
+    def _meter(self, power: int) -> Dict:
+        meter = {field: 0 for field in registers.METER_MODEL.fields}
+        meter.update(
+            {
+                "C_SunSpec_DID": self.meter_did,
+                "C_SunSpec_Length": 105,
+                "AC_Current_SF": -2,
+                "AC_Voltage_SF": -1,
+                "AC_Frequency": 5000,
+                "AC_Frequency_SF": -2,
+                "AC_PF_SF": -2,
+                "M_Events": 0,
+            }
+        )
+        for phase in ["", "_A", "_B", "_C"]:
+            share = 1 if phase == "" else 3
+            meter[f"AC_Current{phase}"] = power * 100 // 230 // share
+            meter[f"AC_Power{phase}"] = -power // share
+            meter[f"AC_VA{phase}"] = power // share
+            meter[f"AC_PF{phase}"] = 98
+            meter[f"AC_Energy_WH_Exported{phase}"] = self.energy // share
+            meter[f"AC_Energy_WH_Imported{phase}"] = self.energy // 4 // share
+        for phase in ["LN", "AN", "BN", "CN"]:
+            meter[f"AC_Voltage_{phase}"] = 2300
+        for phase in ["LL", "AB", "BC", "CA"]:
+            meter[f"AC_Voltage_{phase}"] = 4000
+        for field in THREE_PHASE_ONLY.get(self.meter_did, []):
+            meter[field] = -32768
+        return meter
+
+    def _battery(self, power: int) -> Dict:
+        battery = {field: 0 for field in registers.BATTERY_MODEL.fields}
+        battery.update(
+            {
+                "B_Temp_Average": 25.5,
+                "B_Temp_Max": 27.0,
+                "B_DC_Voltage": 400.0,
+                "B_DC_Current": power / 800,
+                "B_DC_Power": power / 2,
+                "B_Export_Energy_WH": self.energy // 2,
+                "B_Import_Energy_WH": self.energy // 2 + 1000,
+                "B_Energy_Max": 9300.0,
+                "B_Energy_Available": 5000.0,
+                "B_SOH": 98.0,
+                "B_SOE": 54.0,
+                "B_Status": 3,
+            }
+        )
+        return battery
+
+
+class SimulatorContext(ModbusSlaveContext):
+    """Unit ID datastore answering IllegalAddress for configured ranges."""
+
+    def __init__(self, values: Dict[int, int], illegal=()) -> None:
+        super().__init__(hr=ModbusSparseDataBlock(values), zero_mode=True)
+        self.illegal = list(illegal)
+
+    def validate(self, fx, address, count=1):
+        for start, length in self.illegal:
+            if address < start + length and start < address + count:
+                return False
+
+        return super().validate(fx, address, count)
+
+
+class SimulatorHandler(ModbusConnectedRequestHandler):
+    """Request handler adding latency and dropped connections."""
+
+    def execute(self, request):
+        options = self.server.simulator_options
+
+        if options["latency"]:
+            time.sleep(options["latency"] * random.uniform(0.8, 1.2))
+
+        if random.random() < options["drop_rate"]:
+            _LOGGER.debug(f"Dropping connection on request to unit {request.unit_id}")
+            self.running = False
+            self.request.shutdown(socket.SHUT_RDWR)
+            return
+
+        super().execute(request)
+
+
+def parse_illegal(value: str) -> Tuple[int, int, int]:
+    """Parse UNIT:ADDRESS[+COUNT]."""
+    unit, _, block = value.partition(":")
+    address, _, count = block.partition("+")
+    return int(unit), int(address), int(count or 1)
+
+
+def start(
+    port: int = 1502,
+    host: str = "127.0.0.1",
+    units: Iterable[int] = (1,),
+    meters: int = 1,
+    batteries: int = 0,
+    mmppt_units: int = 0,
+    inverter_did: int = 103,
+    meter_did: int = 203,
+    latency: float = 0.0,
+    drop_rate: float = 0.0,
+    illegal: Iterable[Tuple[int, int, int]] = (),
+    update_interval: Optional[float] = 1.0,
+) -> ModbusTcpServer:
+    """Start a simulator serving in background threads."""
+    illegal = list(illegal)
+    simulated = {}
+    slaves = {}
+
+    for unit in units:
+        simulated[unit] = SimulatedUnit(
+            unit, meters, batteries, mmppt_units, inverter_did, meter_did
+        )
+        slaves[unit] = SimulatorContext(
+            simulated[unit].values,
+            [(address, count) for u, address, count in illegal if u == unit],
+        )
+
+    server = ModbusTcpServer(
+        ModbusServerContext(slaves=slaves, single=False),
+        address=(host, port),
+        handler=SimulatorHandler,
+        allow_reuse_address=True,
+    )
+    server.simulator_options = {"latency": latency, "drop_rate": drop_rate}
+    server.simulated_units = simulated
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    if update_interval:
+
+        def update() -> None:
+            started = time.monotonic()
+
+            while True:
+                time.sleep(update_interval)
+
+                for unit, sim in simulated.items():
+                    sim.update(time.monotonic() - started)
+                    slaves[unit].store["h"].values.update(sim.values)
+
+        threading.Thread(target=update, daemon=True).start()
+
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1502)
+    parser.add_argument("--units", type=int, nargs="+", default=[1])
+    parser.add_argument("--meters", type=int, choices=range(4), default=1)
+    parser.add_argument("--batteries", type=int, choices=range(3), default=0)
+    parser.add_argument("--mmppt-units", type=int, choices=[0, 2, 3], default=0)
+    parser.add_argument("--inverter-did", type=int, choices=[101, 102, 103])
+    parser.add_argument("--meter-did", type=int, choices=[201, 202, 203, 204])
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="0 to 1")
+    parser.add_argument(
+        "--illegal",
+        type=parse_illegal,
+        action="append",
+        default=[],
+        metavar="UNIT:ADDRESS[+COUNT]",
+        help="answer IllegalAddress for reads overlapping these registers",
+    )
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+
+    start(
+        args.port,
+        args.host,
+        args.units,
+        args.meters,
+        args.batteries,
+        args.mmppt_units,
+        args.inverter_did or 103,
+        args.meter_did or 203,
+        args.latency,
+        args.drop_rate,
+        args.illegal,
+    )
+    _LOGGER.info(f"Serving units {args.units} on {args.host}:{args.port}")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()